@@ -10,7 +10,8 @@ Rule IDs:
 from __future__ import annotations
 
 import ast
-from collections import defaultdict
+import os
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -18,10 +19,13 @@ from skylos.analysis.architecture_findings import generate_architecture_findings
 from skylos.analysis.architecture_layers import get_layer_policy_findings
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleMetrics:
     name: str
     file_path: str
+    package: str = ""
+    simple_name: str = ""
+    basename: str = ""
     ca: int = 0
     ce: int = 0
     instability: float = 0.0
@@ -41,7 +45,7 @@ class ModuleMetrics:
         return self.ca + self.ce
 
 
-@dataclass
+@dataclass(slots=True)
 class DIPViolation:
     stable_module: str
     unstable_module: str
@@ -50,7 +54,7 @@ class DIPViolation:
     severity: str = "MEDIUM"
 
 
-@dataclass
+@dataclass(slots=True)
 class ArchitectureResult:
     modules: dict[str, ModuleMetrics] = field(default_factory=dict)
     packages: dict[str, dict[str, Any]] = field(default_factory=dict)
@@ -59,6 +63,27 @@ class ArchitectureResult:
     findings: list[dict[str, Any]] = field(default_factory=list)
 
 
+# Classes, functions, assignments and ifs are all statements, and statements
+# never nest inside expressions, so only the fields holding statement lists
+# (plus except handlers and match cases) need to be descended into. Reading
+# them directly avoids iter_child_nodes visiting every expression field.
+_STATEMENT_LIST_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def _iter_statements(tree: ast.AST):
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        yield node
+        for field_name in _STATEMENT_LIST_FIELDS:
+            children = getattr(node, field_name, None)
+            if children:
+                stack.extend(children)
+
+
+_FUNCTION_TYPES = frozenset((ast.FunctionDef, ast.AsyncFunctionDef))
+
+
 def _compute_abstractness(tree: ast.AST) -> dict[str, Any]:
     total_classes = 0
     abstract_classes = 0
@@ -68,8 +93,11 @@ def _compute_abstractness(tree: ast.AST) -> dict[str, Any]:
     protocols = 0
     has_type_checking = False
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
+    # AST node classes are never subclassed, so one type() lookup per node
+    # replaces the chain of isinstance calls.
+    for node in _iter_statements(tree):
+        node_type = type(node)
+        if node_type is ast.ClassDef:
             total_classes += 1
             is_abstract = False
             is_protocol = False
@@ -93,7 +121,7 @@ def _compute_abstractness(tree: ast.AST) -> dict[str, Any]:
                 abstract_classes += 1
 
             for item in node.body:
-                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if type(item) in _FUNCTION_TYPES:
                     for dec in item.decorator_list:
                         if isinstance(dec, ast.Name) and dec.id == "abstractmethod":
                             abstract_methods += 1
@@ -103,10 +131,10 @@ def _compute_abstractness(tree: ast.AST) -> dict[str, Any]:
                         ):
                             abstract_methods += 1
 
-        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        elif node_type in _FUNCTION_TYPES:
             total_functions += 1
 
-        elif isinstance(node, ast.Assign):
+        elif node_type is ast.Assign:
             if isinstance(node.value, ast.Call):
                 if (
                     isinstance(node.value.func, ast.Name)
@@ -119,7 +147,7 @@ def _compute_abstractness(tree: ast.AST) -> dict[str, Any]:
                 ):
                     type_vars += 1
 
-        elif isinstance(node, ast.If):
+        elif node_type is ast.If:
             if isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING":
                 has_type_checking = True
             elif (
@@ -155,6 +183,29 @@ def _compute_abstractness(tree: ast.AST) -> dict[str, Any]:
     }
 
 
+def _count_code_lines(lines) -> int:
+    count = 0
+    for line in lines:
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            count += 1
+    return count
+
+
+def _count_source_loc(source: str) -> int:
+    return _count_code_lines(source.splitlines())
+
+
+def _count_loc(file_path: str) -> int:
+    # Text mode folds \r and \r\n into \n; splitting each line again picks up
+    # the remaining separators str.splitlines() knows, so this matches
+    # _count_source_loc on the whole text without holding it in memory.
+    with open(  # skylos: ignore[SKY-D215] analyzer reads discovered source files
+        file_path, encoding="utf-8", errors="replace"
+    ) as handle:
+        return _count_code_lines(part for line in handle for part in line.splitlines())
+
+
 def _classify_zone(abstractness: float, instability: float) -> str:
     distance = abs(abstractness + instability - 1.0)
     if distance <= 0.2:
@@ -170,8 +221,8 @@ def _classify_zone(abstractness: float, instability: float) -> str:
 
 
 def _has_main_guard(tree: ast.AST) -> bool:
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.If):
+    for node in _iter_statements(tree):
+        if type(node) is not ast.If:
             continue
 
         test = node.test
@@ -208,20 +259,32 @@ def analyze_architecture(
     result = ArchitectureResult()
 
     all_modules = set(module_files.keys())
-    afferent: dict[str, set[str]] = defaultdict(set)
-    efferent: dict[str, set[str]] = defaultdict(set)
+    afferent: dict[str, set[str]] = {m: set() for m in all_modules}
+    efferent: dict[str, set[str]] = {m: set() for m in all_modules}
 
     for module, deps in dependency_graph.items():
+        # Importers outside module_files still count towards Ca of their
+        # targets, but they get no Ce bucket of their own.
+        eff = efferent.get(module)
         for dep in deps:
-            if dep in all_modules and dep != module:
-                efferent[module].add(dep)
-                afferent[dep].add(module)
+            if dep == module:
+                continue
+            aff = afferent.get(dep)
+            if aff is None:
+                continue
+            aff.add(module)
+            if eff is not None:
+                eff.add(dep)
 
     for module_name in all_modules:
         file_path = module_files.get(module_name, "")
         metrics = ModuleMetrics(name=module_name, file_path=file_path)
-        metrics.ca = len(afferent.get(module_name, set()))
-        metrics.ce = len(efferent.get(module_name, set()))
+        parts = module_name.rsplit(".", 1)
+        metrics.simple_name = parts[-1]
+        metrics.package = parts[0] if len(parts) == 2 else module_name
+        metrics.basename = os.path.basename(file_path) if file_path else module_name
+        metrics.ca = len(afferent[module_name])
+        metrics.ce = len(efferent[module_name])
 
         total = metrics.ca + metrics.ce
 
@@ -261,15 +324,8 @@ def analyze_architecture(
             metrics.loc = module_loc[module_name]
         elif file_path:
             try:
-                text = Path(file_path).read_text(
-                    errors="replace"
-                )  # skylos: ignore[SKY-D215] analyzer reads discovered source files
-                metrics.loc = sum(
-                    1
-                    for line in text.splitlines()
-                    if line.strip() and not line.strip().startswith("#")
-                )
-            except (OSError, UnicodeDecodeError):
+                metrics.loc = _count_loc(file_path)
+            except OSError:
                 pass
 
         result.modules[module_name] = metrics
@@ -279,63 +335,52 @@ def analyze_architecture(
     # "unstable" means instability > 0.7
     unstable_threshold = 0.7
 
-    for module, deps in efferent.items():
+    unstable_modules = frozenset(
+        name
+        for name, metrics in result.modules.items()
+        if metrics.instability > unstable_threshold
+    )
+
+    # Walk the graph rather than efferent so violations keep graph order.
+    for module in dependency_graph:
         m_metrics = result.modules.get(module)
         if not m_metrics or m_metrics.instability >= instability_threshold:
             continue
 
-        for dep in deps:
-            dep_metrics = result.modules.get(dep)
-            if not dep_metrics:
-                continue
-            if dep_metrics.instability > unstable_threshold:
-                if m_metrics.instability < 0.1:
-                    severity = "HIGH"
-                else:
-                    severity = "MEDIUM"
-
-                violation = DIPViolation(
-                    stable_module=module,
-                    unstable_module=dep,
-                    stable_instability=round(m_metrics.instability, 3),
-                    unstable_instability=round(dep_metrics.instability, 3),
-                    severity=severity,
-                )
-                result.dip_violations.append(violation)
-
-    package_modules: dict[str, list[str]] = defaultdict(list)
-    for module_name in all_modules:
-        parts = module_name.split(".")
-        if len(parts) > 1:
-            package = ".".join(parts[:-1])
-        else:
-            package = module_name
-        package_modules[package].append(module_name)
+        for dep in efferent[module] & unstable_modules:
+            dep_metrics = result.modules[dep]
+            if m_metrics.instability < 0.1:
+                severity = "HIGH"
+            else:
+                severity = "MEDIUM"
+
+            violation = DIPViolation(
+                stable_module=module,
+                unstable_module=dep,
+                stable_instability=round(m_metrics.instability, 3),
+                unstable_instability=round(dep_metrics.instability, 3),
+                severity=severity,
+            )
+            result.dip_violations.append(violation)
 
-    for package, members in package_modules.items():
-        member_metrics = [result.modules[m] for m in members if m in result.modules]
-        if not member_metrics:
-            continue
+    package_modules: dict[str, list[ModuleMetrics]] = defaultdict(list)
+    for metrics in result.modules.values():
+        package_modules[metrics.package].append(metrics)
 
+    for package, member_metrics in package_modules.items():
         pkg_ca = sum(m.ca for m in member_metrics)
         pkg_ce = sum(m.ce for m in member_metrics)
         pkg_total = pkg_ca + pkg_ce
         pkg_instability = pkg_ce / pkg_total if pkg_total > 0 else 0.0
 
-        avg_abstractness = (
-            sum(m.abstractness for m in member_metrics) / len(member_metrics)
-            if member_metrics
-            else 0.0
-        )
-        avg_distance = (
-            sum(m.distance for m in member_metrics) / len(member_metrics)
-            if member_metrics
-            else 0.0
-        )
+        # Every bucket holds at least the module that created it.
+        member_count = len(member_metrics)
+        avg_abstractness = sum(m.abstractness for m in member_metrics) / member_count
+        avg_distance = sum(m.distance for m in member_metrics) / member_count
 
         result.packages[package] = {
-            "modules": sorted(members),
-            "module_count": len(members),
+            "modules": sorted(m.name for m in member_metrics),
+            "module_count": member_count,
             "afferent_coupling": pkg_ca,
             "efferent_coupling": pkg_ce,
             "instability": round(pkg_instability, 3),
@@ -348,41 +393,49 @@ def analyze_architecture(
     if all_metrics:
         total_deps = sum(len(deps) for deps in dependency_graph.values())
         intra_package_deps = 0
+        # Graph keys and deps can name modules outside module_files, so the
+        # top-level segment is memoised per name rather than read off metrics.
+        top_level: dict[str, str] = {}
         for module, deps in dependency_graph.items():
-            m_pkg = module.split(".")[0] if "." in module else module
+            m_pkg = top_level.get(module)
+            if m_pkg is None:
+                m_pkg = top_level[module] = module.split(".", 1)[0]
             for dep in deps:
-                d_pkg = dep.split(".")[0] if "." in dep else dep
+                d_pkg = top_level.get(dep)
+                if d_pkg is None:
+                    d_pkg = top_level[dep] = dep.split(".", 1)[0]
                 if m_pkg == d_pkg:
                     intra_package_deps += 1
 
         modularity = intra_package_deps / total_deps if total_deps > 0 else 1.0
 
-        instabilities = [m.instability for m in all_metrics if m.total_coupling > 0]
-        instability_variance = (
-            sum(
-                (i - sum(instabilities) / len(instabilities)) ** 2
-                for i in instabilities
-            )
-            / len(instabilities)
-            if instabilities
-            else 0.0
-        )
-
-        distances = []
+        # Welford's update keeps the instability variance to the same single
+        # pass that sums distances and LOC.
+        coupled = 0
+        mean_instability = 0.0
+        instability_m2 = 0.0
+        total_distance = 0.0
+        total_loc = 0
         for m in all_metrics:
-            distances.append(m.distance)
+            total_distance += m.distance
+            total_loc += m.loc
+            if m.total_coupling == 0:
+                continue
+            coupled += 1
+            delta = m.instability - mean_instability
+            mean_instability += delta / coupled
+            instability_m2 += delta * (m.instability - mean_instability)
 
-        if distances:
-            mean_distance = sum(distances) / len(distances)
-        else:
-            mean_distance = 0.0
+        instability_variance = instability_m2 / coupled if coupled else 0.0
+        mean_distance = total_distance / len(all_metrics)
 
         architecture_fitness = 1.0 - mean_distance
+        zone_counts = Counter(m.zone for m in all_metrics)
 
         result.system_metrics = {
             "total_modules": len(all_metrics),
             "total_packages": len(result.packages),
-            "total_loc": sum(m.loc for m in all_metrics),
+            "total_loc": total_loc,
             "modularity_index": round(modularity, 3),
             "architecture_fitness": round(architecture_fitness, 3),
             "mean_distance": round(mean_distance, 3),
@@ -390,17 +443,11 @@ def analyze_architecture(
             "coupling_health": round(1.0 - min(1.0, instability_variance * 10), 3),
             "dip_violations": len(result.dip_violations),
             "zone_distribution": {
-                "main_sequence": sum(
-                    1 for m in all_metrics if m.zone == "main_sequence"
-                ),
-                "off_main_sequence": sum(
-                    1 for m in all_metrics if m.zone == "off_main_sequence"
-                ),
-                "zone_of_pain": sum(1 for m in all_metrics if m.zone == "zone_of_pain"),
-                "zone_of_uselessness": sum(
-                    1 for m in all_metrics if m.zone == "zone_of_uselessness"
-                ),
-                "disconnected": sum(1 for m in all_metrics if m.zone == "disconnected"),
+                "main_sequence": zone_counts["main_sequence"],
+                "off_main_sequence": zone_counts["off_main_sequence"],
+                "zone_of_pain": zone_counts["zone_of_pain"],
+                "zone_of_uselessness": zone_counts["zone_of_uselessness"],
+                "disconnected": zone_counts["disconnected"],
             },
         }
     else:
@@ -543,8 +590,12 @@ def _filter_contextual_findings(
             continue
 
         if rule_id in {"SKY-Q802", "SKY-Q803"} and isinstance(module_name, str):
-            simple_name = module_name.rsplit(".", 1)[-1]
             metrics = modules.get(module_name)
+            simple_name = (
+                metrics.simple_name
+                if metrics is not None
+                else module_name.rsplit(".", 1)[-1]
+            )
             if (
                 rule_id == "SKY-Q802"
                 and simple_name.startswith("_")
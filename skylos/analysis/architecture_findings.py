@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import Any
 
 
@@ -40,8 +39,9 @@ def _iad_docs_url(rule_id: str) -> str:
     return f"https://docs.skylos.dev/rules/{rule_id}"
 
 
-def _iad_remediations(module_name: str, zone: str) -> list[dict[str, str]]:
-    simple_name = module_name.rsplit(".", 1)[-1]
+def _iad_remediations(
+    module_name: str, simple_name: str, zone: str
+) -> list[dict[str, str]]:
     if simple_name.startswith("_"):
         helper_hint = (
             "This module is already marked private. If it belongs to one release-unit, "
@@ -104,6 +104,11 @@ def generate_architecture_findings(
     *,
     iad_findings_advisory: bool = True,
 ) -> None:
+    # The scope fields and gate note depend only on the advisory flag, so
+    # build them once and splice the same values into every I/A/D finding.
+    scope_fields = _iad_scope_fields(iad_findings_advisory)
+    gate_note = _iad_gate_note(iad_findings_advisory)
+
     for name, m in result.modules.items():
         # SKY-Q802: High distance from main sequence
         if m.distance > 0.5 and m.total_coupling > 0:
@@ -119,7 +124,7 @@ def generate_architecture_findings(
                     "severity": severity,
                     "type": "module",
                     "name": name,
-                    "simple_name": name.split(".")[-1],
+                    "simple_name": m.simple_name,
                     "value": round(m.distance, 3),
                     "threshold": 0.5,
                     "instability": round(m.instability, 3),
@@ -128,14 +133,14 @@ def generate_architecture_findings(
                         f"Module '{name}' is far from the Main Sequence "
                         f"(D={m.distance:.2f}, I={m.instability:.2f}, A={m.abstractness:.2f}). "
                         f"Zone: {m.zone.replace('_', ' ')}. "
-                        f"{_iad_gate_note(iad_findings_advisory)}"
+                        f"{gate_note}"
                     ),
                     "file": m.file_path,
-                    "basename": Path(m.file_path).name if m.file_path else name,
+                    "basename": m.basename,
                     "line": 1,
                     "docs_url": _iad_docs_url("SKY-Q802"),
-                    "remediations": _iad_remediations(name, m.zone),
-                    **_iad_scope_fields(iad_findings_advisory),
+                    "remediations": _iad_remediations(name, m.simple_name, m.zone),
+                    **scope_fields,
                 }
             )
 
@@ -146,14 +151,14 @@ def generate_architecture_findings(
                     f"Module '{name}' is in the Zone of Pain "
                     f"(concrete A={m.abstractness:.2f}, stable I={m.instability:.2f}). "
                     "Changes here can ripple widely at file granularity. "
-                    f"{_iad_gate_note(iad_findings_advisory)}"
+                    f"{gate_note}"
                 )
             else:
                 zone_msg = (
                     f"Module '{name}' is in the Zone of Uselessness "
                     f"(abstract A={m.abstractness:.2f}, unstable I={m.instability:.2f}). "
                     "Few stable consumers depend on it. "
-                    f"{_iad_gate_note(iad_findings_advisory)}"
+                    f"{gate_note}"
                 )
 
             result.findings.append(
@@ -163,18 +168,18 @@ def generate_architecture_findings(
                     "severity": "MEDIUM",
                     "type": "module",
                     "name": name,
-                    "simple_name": name.split(".")[-1],
+                    "simple_name": m.simple_name,
                     "value": m.zone,
                     "instability": round(m.instability, 3),
                     "abstractness": round(m.abstractness, 3),
                     "distance": round(m.distance, 3),
                     "message": zone_msg,
                     "file": m.file_path,
-                    "basename": Path(m.file_path).name if m.file_path else name,
+                    "basename": m.basename,
                     "line": 1,
                     "docs_url": _iad_docs_url("SKY-Q803"),
-                    "remediations": _iad_remediations(name, m.zone),
-                    **_iad_scope_fields(iad_findings_advisory),
+                    "remediations": _iad_remediations(name, m.simple_name, m.zone),
+                    **scope_fields,
                 }
             )
 
@@ -188,7 +193,9 @@ def generate_architecture_findings(
                 "severity": v.severity,
                 "type": "module",
                 "name": v.stable_module,
-                "simple_name": v.stable_module.split(".")[-1],
+                "simple_name": stable_file.simple_name
+                if stable_file
+                else v.stable_module.rsplit(".", 1)[-1],
                 "value": f"{v.stable_module} -> {v.unstable_module}",
                 "message": (
                     f"Dependency Inversion violation: stable module '{v.stable_module}' "
@@ -197,9 +204,7 @@ def generate_architecture_findings(
                     f"Consider introducing an abstraction layer."
                 ),
                 "file": stable_file.file_path if stable_file else "",
-                "basename": Path(stable_file.file_path).name
-                if stable_file and stable_file.file_path
-                else v.stable_module,
+                "basename": stable_file.basename if stable_file else v.stable_module,
                 "line": 1,
             }
         )
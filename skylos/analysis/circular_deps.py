@@ -2,7 +2,7 @@ from __future__ import annotations
 import ast
 from dataclasses import dataclass, field
 from typing import Dict, List, Set, Tuple, Any
-from collections import defaultdict
+from collections import defaultdict, deque
 
 try:
     from skylos_fast import (
@@ -12,8 +12,11 @@ except ImportError:
     _fast_find_cycles = None
 
 
+_STATEMENT_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
 def _module_root(module_name: str) -> str:
-    return module_name.split(".")[0] if module_name else ""
+    return module_name.partition(".")[0]
 
 
 def _known_module_names(module_name: str) -> Set[str]:
@@ -23,12 +26,15 @@ def _known_module_names(module_name: str) -> Set[str]:
 
 
 def _resolve_known_module(module_name: str, known_modules: Set[str]) -> str | None:
-    parts = module_name.split(".")
-    for end in range(len(parts), 0, -1):
-        candidate = ".".join(parts[:end])
+    # Longest known prefix wins; trim one dotted segment at a time instead of
+    # re-joining split parts for every candidate.
+    candidate = module_name
+    while True:
         if candidate in known_modules:
             return candidate
-    return None
+        if "." not in candidate:
+            return None
+        candidate = candidate.rpartition(".")[0]
 
 
 def _resolve_from_import_targets(
@@ -90,20 +96,24 @@ class DependencyGraphBuilder(ast.NodeVisitor):
         self.architecture_dependencies: List[ModuleDependency] = []
 
     def generic_visit(self, node):
+        # Imports are statements and statements never sit inside
+        # expressions, so expression subtrees are not worth visiting.
         for child in ast.iter_child_nodes(node):
-            self.visit(child)
+            if isinstance(child, _STATEMENT_NODES):
+                self.visit(child)
 
     def visit_Import(self, node: ast.Import):
         for alias in node.names:
             module = _resolve_known_module(alias.name, self.known_modules)
             if module:
+                bound_name = alias.asname or alias.name
                 self.dependencies.append(
                     ModuleDependency(
                         from_module=self.module_name,
                         to_module=_module_root(alias.name),
                         import_line=node.lineno,
                         import_type="import",
-                        imported_names=[alias.asname or alias.name],
+                        imported_names=[bound_name],
                     )
                 )
                 self.architecture_dependencies.append(
@@ -112,7 +122,7 @@ class DependencyGraphBuilder(ast.NodeVisitor):
                         to_module=module,
                         import_line=node.lineno,
                         import_type="import",
-                        imported_names=[alias.asname or alias.name],
+                        imported_names=[bound_name],
                     )
                 )
 
@@ -156,14 +166,14 @@ class CircularDependencyAnalyzer:
         self.architecture_dependencies: Dict[str, Set[str]] = defaultdict(set)
         self.all_deps: List[ModuleDependency] = []
         self.known_modules: Set[str] = set()
+        self._cycles_cache: List[List[str]] | None = None
 
     def add_file(self, tree: ast.AST, file_path: str, module_name: str):
         self.modules[module_name] = file_path
         self.known_modules.update(_known_module_names(module_name))
 
     def build_graph_from_raw_imports(self, raw_imports_by_module: Dict[str, list]):
-        for module_name in self.modules:
-            self.known_modules.update(_known_module_names(module_name))
+        self._cycles_cache = None
 
         for module_name, raw_imports in raw_imports_by_module.items():
             file_path = self.modules.get(module_name, "")
@@ -196,8 +206,7 @@ class CircularDependencyAnalyzer:
                     self.architecture_dependencies[module_name].add(target)
 
     def build_graph(self, trees: Dict[str, ast.AST]):
-        for module_name in self.modules:
-            self.known_modules.update(_known_module_names(module_name))
+        self._cycles_cache = None
 
         for module_name, file_path in self.modules.items():
             if module_name in trees:
@@ -213,9 +222,14 @@ class CircularDependencyAnalyzer:
                     self.architecture_dependencies[dep.from_module].add(dep.to_module)
 
     def find_simple_cycles(self) -> List[List[str]]:
-        if _fast_find_cycles is not None:
-            return self._find_cycles_fast()
-        return self._find_cycles_py()
+        # analyze() and get_core_infrastructure() both need the cycles; the
+        # graph only changes through build_graph*, which drops this cache.
+        if self._cycles_cache is None:
+            if _fast_find_cycles is not None:
+                self._cycles_cache = self._find_cycles_fast()
+            else:
+                self._cycles_cache = self._find_cycles_py()
+        return self._cycles_cache
 
     def _find_cycles_fast(self) -> List[List[str]]:
         """Rust-accelerated cycle detection."""
@@ -226,70 +240,99 @@ class CircularDependencyAnalyzer:
         modules = list(self.modules.keys())
         return _fast_find_cycles(edges, modules)
 
-    def _find_cycles_py(self) -> List[List[str]]:
-        """Pure Python DFS cycle detection."""
-        cycles = []
-        visited = set()
-
-        def dfs(node, path, path_set):
-            if node in path_set:
-                cycle_start = path.index(node)
-                cycle = path[cycle_start:] + [node]
-                min_idx = cycle.index(min(cycle[:-1]))
-                normalized = cycle[min_idx:-1] + cycle[:min_idx]
-                return [normalized]
-
-            if node in visited:
-                return []
+    def _has_any_cycle(self) -> bool:
+        """Kahn's topological sort: True unless every node can be peeled off."""
+        in_degree: Dict[str, int] = defaultdict(int)
+        for frm, tos in self.dependencies.items():
+            in_degree[frm] += 0
+            for to in tos:
+                in_degree[to] += 1
 
-            found_cycles = []
-            path.append(node)
-            path_set.add(node)
+        ready = deque(node for node, degree in in_degree.items() if degree == 0)
+        processed = 0
+        while ready:
+            node = ready.popleft()
+            processed += 1
+            for to in self.dependencies.get(node, ()):
+                in_degree[to] -= 1
+                if in_degree[to] == 0:
+                    ready.append(to)
 
-            for neighbor in self.dependencies.get(node, []):
-                found_cycles.extend(dfs(neighbor, path, path_set))
+        return processed != len(in_degree)
 
-            path.pop()
-            path_set.remove(node)
-            visited.add(node)
+    def _find_cycles_py(self) -> List[List[str]]:
+        """Pure Python DFS cycle detection."""
+        # Acyclic graphs are the common case; one linear pass settles them
+        # without a DFS from every module.
+        if not self._has_any_cycle():
+            return []
 
-            return found_cycles
+        cycles = []
+        seen_cycles = set()
+        visited = set()
+        dependencies = self.dependencies
 
-        for node in self.modules:
+        for start in self.modules:
             visited.clear()
-            found = dfs(node, [], set())
-            for cycle in found:
-                if cycle not in cycles:
-                    cycles.append(cycle)
-
-        unique_cycles = []
-        seen = set()
-        for cycle in cycles:
-            key = tuple(sorted(cycle))
-            if key not in seen:
-                seen.add(key)
-                unique_cycles.append(cycle)
-
-        return unique_cycles
-
-    def suggest_break_point(self, cycle: List[str]) -> str:
+            # One successor iterator per module on the current path, so long
+            # import chains cannot hit the interpreter's recursion limit.
+            path = [start]
+            # Position of each path module, for O(1) cycle-start lookup.
+            path_index = {start: 0}
+            work = [iter(dependencies.get(start, ()))]
+            while work:
+                node = next(work[-1], None)
+                if node is None:
+                    done = path.pop()
+                    del path_index[done]
+                    visited.add(done)
+                    work.pop()
+                    continue
+
+                cycle_start = path_index.get(node)
+                if cycle_start is not None:
+                    cycle = path[cycle_start:]
+                    # Cycles over the same module set are reported once,
+                    # first-found wins. Path entries are distinct, so a
+                    # frozenset identifies the set without sorting it.
+                    key = frozenset(cycle)
+                    if key not in seen_cycles:
+                        seen_cycles.add(key)
+                        min_idx = min(range(len(cycle)), key=cycle.__getitem__)
+                        cycles.append(cycle[min_idx:] + cycle[:min_idx])
+                    continue
+
+                if node in visited:
+                    continue
+
+                path_index[node] = len(path)
+                path.append(node)
+                work.append(iter(dependencies.get(node, ())))
+
+        return cycles
+
+    def _incoming_counts(self) -> Dict[str, int]:
+        incoming: Dict[str, int] = defaultdict(int)
+        for deps in self.dependencies.values():
+            for module in deps:
+                incoming[module] += 1
+        return incoming
+
+    def suggest_break_point(
+        self, cycle: List[str], incoming_counts: Dict[str, int] | None = None
+    ) -> str:
         if not cycle:
             return ""
 
-        incoming_counts = {}
-        for module in cycle:
-            count = 0
-            for other_deps in self.dependencies.values():
-                if module in other_deps:
-                    count += 1
-            incoming_counts[module] = count
+        if incoming_counts is None:
+            incoming_counts = self._incoming_counts()
 
         best = cycle[0]
         best_score = float("inf")
 
         for module in cycle:
             outgoing = len(self.dependencies.get(module, set()))
-            incoming = incoming_counts[module]
+            incoming = incoming_counts.get(module, 0)
             score = incoming - outgoing
             if score < best_score:
                 best_score = score
@@ -299,13 +342,14 @@ class CircularDependencyAnalyzer:
 
     def analyze(self) -> List[CircularDependency]:
         cycles = self.find_simple_cycles()
+        incoming_counts = self._incoming_counts() if cycles else {}
 
         findings = []
         for cycle in cycles:
             severity = (
                 "HIGH" if len(cycle) > 3 else "MEDIUM" if len(cycle) > 2 else "LOW"
             )
-            suggested = self.suggest_break_point(cycle)
+            suggested = self.suggest_break_point(cycle, incoming_counts)
 
             findings.append(
                 CircularDependency(
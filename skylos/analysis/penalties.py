@@ -1204,12 +1204,13 @@ def _check_data_model_fields(def_obj, analyzer, framework):
 
 def _apply_standard_reductions(def_obj, analyzer, visitor, framework, confidence):
     simple_name = def_obj.simple_name
+    is_dunder = simple_name[:2] == "__" == simple_name[-2:]
     _is_ts = str(def_obj.filename).endswith((".ts", ".tsx", ".js", ".jsx"))
 
     if simple_name.startswith("_") and not simple_name.startswith("__") and not _is_ts:
         confidence -= PENALTIES["private_name"]
 
-    if simple_name.startswith("__") and simple_name.endswith("__") and not _is_ts:
+    if is_dunder and not _is_ts:
         confidence -= PENALTIES["dunder_or_magic"]
 
     if def_obj.in_init and def_obj.type in ("function", "class"):
@@ -1242,7 +1243,7 @@ def _apply_standard_reductions(def_obj, analyzer, visitor, framework, confidence
     if framework_confidence is not None:
         confidence = min(confidence, framework_confidence)
 
-    if simple_name.startswith("__") and simple_name.endswith("__"):
+    if is_dunder:
         confidence = 0
 
     if def_obj.type == "parameter":
@@ -5,9 +5,11 @@ import json
 import logging
 import os
 import re
+import threading
 import traceback
 from pathlib import Path
 from collections import Counter, defaultdict
+from functools import lru_cache
 
 try:
     from skylos_fast import discover_files as _fast_discover
@@ -60,6 +62,7 @@ from skylos.rules.quality.clones import (
     detect_pairs,
     group_pairs,
 )
+from skylos.analysis.ast_mask import apply_body_mask, default_mask_spec_from_config
 from skylos.analysis.penalties import apply_penalties
 from skylos.analysis.file_processing import (
     collect_python_raw_imports,
@@ -347,6 +350,20 @@ _DART_SOURCE_EXTS = (".dart",)
 _CSHARP_SOURCE_EXTS = (".cs",)
 _KOTLIN_SOURCE_EXTS = (".kt", ".kts")
 _SHELL_SOURCE_EXTS = SHELL_SOURCE_EXTS
+_ANALYZED_SOURCE_EXTS = frozenset(
+    {
+        *PYTHON_SIGNATURE_SUFFIXES,
+        ".go",
+        *(_TS_JS_SOURCE_EXTS),
+        ".java",
+        *(_PHP_SOURCE_EXTS),
+        *(_RUST_SOURCE_EXTS),
+        *(_DART_SOURCE_EXTS),
+        *(_CSHARP_SOURCE_EXTS),
+        *(_KOTLIN_SOURCE_EXTS),
+        *(_SHELL_SOURCE_EXTS),
+    }
+)
 _PYTHON_SOURCE_ROOT_NAMES = {"src", "lib", "python"}
 
 _HTML_PARSER_CALLBACKS = {
@@ -834,18 +851,7 @@ class Skylos:
             return [p], p.parent
 
         root = p
-        exts = {
-            *PYTHON_SIGNATURE_SUFFIXES,
-            ".go",
-            *(_TS_JS_SOURCE_EXTS),
-            ".java",
-            *(_PHP_SOURCE_EXTS),
-            *(_RUST_SOURCE_EXTS),
-            *(_DART_SOURCE_EXTS),
-            *(_CSHARP_SOURCE_EXTS),
-            *(_KOTLIN_SOURCE_EXTS),
-            *(_SHELL_SOURCE_EXTS),
-        }
+        exts = set(_ANALYZED_SOURCE_EXTS)
         ext_list = [
             "py",
             "pyi",
@@ -958,20 +964,17 @@ class Skylos:
                 def_obj.is_exported = True
                 def_obj.references += 1
 
-        for mod, export_names in self.exports.items():
-            for name in export_names:
-                for def_name, def_obj in self.defs.items():
-                    if (
-                        def_name.startswith(f"{mod}.")
-                        and def_obj.simple_name == name
-                        and def_obj.type != "import"
-                    ):
-                        def_obj.is_exported = True
-
         non_import_by_simple = defaultdict(list)
         for k, d in self.defs.items():
             if d.type != "import":
-                non_import_by_simple[d.simple_name].append(d)
+                non_import_by_simple[d.simple_name].append((k, d))
+
+        for mod, export_names in self.exports.items():
+            prefix = f"{mod}."
+            for name in export_names:
+                for def_name, def_obj in non_import_by_simple.get(name, ()):
+                    if def_name.startswith(prefix):
+                        def_obj.is_exported = True
 
         for def_key, def_obj in self.defs.items():
             if def_obj.type != "import":
@@ -990,7 +993,7 @@ class Skylos:
                 self.defs[target_name].references += 1
                 self.defs[target_name].is_exported = True
                 continue
-            for candidate in non_import_by_simple.get(simple, []):
+            for _, candidate in non_import_by_simple.get(simple, ()):
                 candidate.references += 1
                 candidate.is_exported = True
 
@@ -1423,10 +1426,13 @@ class Skylos:
             ]
             return same_file or matches
 
-        total_refs = len(self.refs)
+        # Resolution depends only on (ref, file), so resolve each distinct
+        # pair once and credit it with its multiplicity.
+        ref_counts = Counter(self.refs)
+        total_refs = len(ref_counts)
         tick_every = int(os.getenv("SKYLOS_MARKREFS_TICK", str(MARKREFS_TICK_DEFAULT)))
 
-        for i, (ref, ref_file) in enumerate(self.refs, 1):
+        for i, ((ref, ref_file), count) in enumerate(ref_counts.items(), 1):
             if progress_callback and (i == 1 or i % tick_every == 0 or i == total_refs):
                 progress_callback(i, total_refs or 1, Path("PHASE: mark refs"))
 
@@ -1437,30 +1443,34 @@ class Skylos:
                 ref = ref[2:]
                 for d in simple_name_lookup.get(ref, []):
                     if d.type == "method":
-                        d.references += 1
+                        d.references += count
 
             file_key = f"{ref_file}:{ref}"
 
             if file_key in self.defs:
-                self.defs[file_key].references += 1
+                self.defs[file_key].references += count
                 if file_key in import_to_original:
                     original = import_to_original[file_key]
                     if original in self.defs:
-                        self.defs[original].references += 1
+                        self.defs[original].references += count
                 continue
 
             if ref in self.defs:
-                self.defs[ref].references += 1
+                self.defs[ref].references += count
                 if ref in import_to_original:
                     original = import_to_original[ref]
-                    self.defs[original].references += 1
+                    self.defs[original].references += count
                 continue
 
             if "." in ref:
                 ref_mod, simple = ref.rsplit(".", 1)
             else:
                 ref_mod, simple = "", ref
-            candidates = simple_name_lookup.get(simple, [])
+            if simple not in simple_name_lookup:
+                # No definition carries this simple name, so none of the
+                # fallbacks below can match (e.g. builtins, stdlib attrs).
+                continue
+            candidates = simple_name_lookup[simple]
 
             if ref_mod:
                 if ref_mod in ("cls", "self"):
@@ -1471,7 +1481,7 @@ class Skylos:
 
                     if cls_candidates:
                         for d in cls_candidates:
-                            d.references += 1
+                            d.references += count
                         continue
 
                 else:
@@ -1496,7 +1506,7 @@ class Skylos:
                     candidates = same_file
 
             if len(candidates) == 1:
-                candidates[0].references += 1
+                candidates[0].references += count
                 continue
 
             if len(candidates) > 1:
@@ -1506,7 +1516,7 @@ class Skylos:
                     ]
                     if same_file_cands:
                         for d in same_file_cands:
-                            d.references += 1
+                            d.references += count
                     continue
                 if not ref_mod:
                     continue
@@ -1516,7 +1526,7 @@ class Skylos:
                 matched_members = _matching_type_members(ref_mod, simple, ref_file)
                 if matched_members:
                     for member_def in matched_members:
-                        member_def.references += 1
+                        member_def.references += count
                     continue
 
                 resolved_type = self._global_type_map.get(ref_mod)
@@ -1526,7 +1536,7 @@ class Skylos:
                     )
                     if matched_members:
                         for member_def in matched_members:
-                            member_def.references += 1
+                            member_def.references += count
                         continue
 
             non_import_defs_fallback = []
@@ -1535,7 +1545,7 @@ class Skylos:
                     non_import_defs_fallback.append(d)
 
             if len(non_import_defs_fallback) == 1:
-                non_import_defs_fallback[0].references += 1
+                non_import_defs_fallback[0].references += count
                 continue
 
             if "." in ref:
@@ -1546,12 +1556,12 @@ class Skylos:
 
                 if same_file_methods and ref_mod in {"self", "cls"}:
                     for m in same_file_methods:
-                        m.references += 1
+                        m.references += count
                     continue
 
                 if non_import_defs_fallback and not ref_mod:
                     for d in non_import_defs_fallback:
-                        d.references += 1
+                        d.references += count
                     continue
 
         from skylos.analysis.implicit_refs import pattern_tracker as global_tracker
@@ -2154,6 +2164,7 @@ class Skylos:
         if not (0 <= thr <= 100):
             raise ValueError(f"thr must be 0-100, got {thr}")
 
+        debug = bool(os.getenv("SKYLOS_DEBUG"))
         clear_go_cache()
 
         if isinstance(path, (list, tuple)):
@@ -2238,7 +2249,7 @@ class Skylos:
                         if config_findings:
                             danger_findings.extend(config_findings)
                 except Exception:
-                    if os.getenv("SKYLOS_DEBUG"):
+                    if debug:
                         logger.error("Config scan failed", exc_info=True)
 
                 if enable_ai_defects and enable_dependency_hallucinations:
@@ -2255,7 +2266,7 @@ class Skylos:
                                 continue
                             ai_defect_findings.append(finding)
                     except Exception:
-                        if os.getenv("SKYLOS_DEBUG"):
+                        if debug:
                             logger.error(
                                 "Manifest dependency scan failed", exc_info=True
                             )
@@ -2375,12 +2386,12 @@ class Skylos:
         if custom_rules_data and not os.getenv("SKYLOS_CUSTOM_RULES"):
             os.environ["SKYLOS_CUSTOM_RULES"] = json.dumps(custom_rules_data)
             injected = True
-            if os.getenv("SKYLOS_DEBUG"):
+            if debug:
                 logger.info(
                     f"[DBG] Injected SKYLOS_CUSTOM_RULES (count={len(custom_rules_data)})"
                 )
         else:
-            if os.getenv("SKYLOS_DEBUG"):
+            if debug:
                 logger.info(
                     f"[DBG] Did NOT inject SKYLOS_CUSTOM_RULES "
                     f"(custom_rules_data={bool(custom_rules_data)}, env_already_set={bool(os.getenv('SKYLOS_CUSTOM_RULES'))})"
@@ -2414,7 +2425,7 @@ class Skylos:
                 config_file=config_file,
             )
 
-            if os.getenv("SKYLOS_DEBUG"):
+            if debug:
                 logger.info(f"[DBG] run_proc_file_parallel returned outs={len(outs)}")
 
             for file, out in zip(files, outs):
@@ -2696,7 +2707,7 @@ class Skylos:
                         full_path = str((root / line).resolve())
                         changed_files.add(full_path)
             except Exception:
-                if os.getenv("SKYLOS_DEBUG"):
+                if debug:
                     logger.error("Auto-detect git changes failed", exc_info=True)
 
         if changed_files and enable_quality and "SKY-L021" not in project_ignore:
@@ -2741,7 +2752,7 @@ class Skylos:
                         )
                         all_quality.extend(reg_findings)
             except Exception:
-                if os.getenv("SKYLOS_DEBUG"):
+                if debug:
                     logger.error("Security regression scan failed", exc_info=True)
 
         if changed_files and enable_danger and "SKY-SC001" not in project_ignore:
@@ -2756,7 +2767,7 @@ class Skylos:
                     )
                 )
             except Exception:
-                if os.getenv("SKYLOS_DEBUG"):
+                if debug:
                     logger.error("Security contract scan failed", exc_info=True)
 
         self.pattern_trackers = pattern_trackers
@@ -2868,7 +2879,7 @@ class Skylos:
                 if config_findings:
                     all_dangers.extend(config_findings)
             except Exception:
-                if os.getenv("SKYLOS_DEBUG"):
+                if debug:
                     logger.error("Config scan failed", exc_info=True)
 
             # --- SKY-D260/D266: Prompt injection scanner (multi-file) ---
@@ -3042,7 +3053,7 @@ class Skylos:
                             all_dangers.extend(bounded_hits)
                             injection_findings += len(bounded_hits)
                 except Exception:
-                    if os.getenv("SKYLOS_DEBUG"):
+                    if debug:
                         logger.error(traceback.format_exc())
 
         if enable_ai_defects:
@@ -3070,7 +3081,7 @@ class Skylos:
                             all_suppressed=all_suppressed,
                         )
                 except Exception:
-                    if os.getenv("SKYLOS_DEBUG"):
+                    if debug:
                         logger.error(traceback.format_exc())
 
                 try:
@@ -3094,7 +3105,7 @@ class Skylos:
                             all_suppressed=all_suppressed,
                         )
                 except Exception:
-                    if os.getenv("SKYLOS_DEBUG"):
+                    if debug:
                         logger.error(traceback.format_exc())
 
                 try:
@@ -3113,7 +3124,7 @@ class Skylos:
                         all_suppressed=all_suppressed,
                     )
                 except Exception:
-                    if os.getenv("SKYLOS_DEBUG"):
+                    if debug:
                         logger.error(traceback.format_exc())
 
             _ai_py_files = [
@@ -3183,7 +3194,7 @@ class Skylos:
                         self._ai_verification_checks.append(
                             failed_python_api_check("detector_error")
                         )
-                        if os.getenv("SKYLOS_DEBUG"):
+                        if debug:
                             logger.error(
                                 "Python API hallucination scan failed",
                                 exc_info=True,
@@ -3221,7 +3232,7 @@ class Skylos:
                             all_suppressed=all_suppressed,
                         )
                 except Exception:
-                    if os.getenv("SKYLOS_DEBUG"):
+                    if debug:
                         logger.error(traceback.format_exc())
 
             _ai_go_files = [f for f in files if str(f).endswith(".go")]
@@ -3259,7 +3270,7 @@ class Skylos:
                         self._ai_verification_checks.append(
                             failed_go_api_check("detector_error")
                         )
-                        if os.getenv("SKYLOS_DEBUG"):
+                        if debug:
                             logger.error(
                                 "Go API hallucination scan failed",
                                 exc_info=True,
@@ -3300,7 +3311,7 @@ class Skylos:
                         self._ai_verification_checks.append(
                             failed_java_api_check("detector_error")
                         )
-                        if os.getenv("SKYLOS_DEBUG"):
+                        if debug:
                             logger.error(
                                 "Java API hallucination scan failed",
                                 exc_info=True,
@@ -3358,7 +3369,7 @@ class Skylos:
                                 all_suppressed=all_suppressed,
                             )
                 except Exception:
-                    if os.getenv("SKYLOS_DEBUG"):
+                    if debug:
                         logger.error("Assertion weakening scan failed", exc_info=True)
 
             if changed_files and "SKY-A102" not in project_ignore:
@@ -3389,7 +3400,7 @@ class Skylos:
                         all_suppressed=all_suppressed,
                     )
                 except Exception:
-                    if os.getenv("SKYLOS_DEBUG"):
+                    if debug:
                         logger.error("Test impact scan failed", exc_info=True)
 
             if changed_files and (
@@ -3406,7 +3417,7 @@ class Skylos:
                         all_suppressed=all_suppressed,
                     )
                 except Exception:
-                    if os.getenv("SKYLOS_DEBUG"):
+                    if debug:
                         logger.error("AI defect diff scan failed", exc_info=True)
 
         if enable_quality:
@@ -3440,7 +3451,7 @@ class Skylos:
                             all_quality.extend(ud_findings)
 
             except Exception:
-                if os.getenv("SKYLOS_DEBUG"):
+                if debug:
                     logger.error(traceback.format_exc())
 
             try:
@@ -3452,7 +3463,7 @@ class Skylos:
                 if policy_findings:
                     all_quality.extend(policy_findings)
             except Exception:
-                if os.getenv("SKYLOS_DEBUG"):
+                if debug:
                     logger.error(traceback.format_exc())
 
         all_sca = []
@@ -3473,10 +3484,10 @@ class Skylos:
 
                         all_sca = enrich_with_reachability(all_sca, scan_root)
                     except Exception:
-                        if os.getenv("SKYLOS_DEBUG"):
+                        if debug:
                             logger.error(traceback.format_exc())
             except Exception:
-                if os.getenv("SKYLOS_DEBUG"):
+                if debug:
                     logger.error(traceback.format_exc())
 
         from skylos.visitors.languages.typescript.resolve import MonorepoResolver
@@ -3492,7 +3503,7 @@ class Skylos:
             )
             ts_raw_imports.update(mdx_raw_imports)
         except Exception:
-            if os.getenv("SKYLOS_DEBUG"):
+            if debug:
                 logger.error("MDX component import graph scan failed", exc_info=True)
 
         if enable_ai_defects:
@@ -3527,7 +3538,7 @@ class Skylos:
                     self._ai_verification_checks.append(
                         failed_js_api_check("detector_error")
                     )
-                    if os.getenv("SKYLOS_DEBUG"):
+                    if debug:
                         logger.error("JS API hallucination scan failed", exc_info=True)
 
         self._build_ts_import_graph(ts_raw_imports, monorepo_resolver)
@@ -3552,7 +3563,7 @@ class Skylos:
             )
             self.refs.extend(browser_handler_refs)
         except Exception:
-            if os.getenv("SKYLOS_DEBUG"):
+            if debug:
                 logger.error("Browser event handler liveness scan failed", exc_info=True)
 
         for top_level_ref in all_top_level_refs:
@@ -3676,6 +3687,28 @@ def _is_truly_empty_or_docstring_only(tree):
     )
 
 
+@lru_cache(maxsize=None)
+def _taint_scanner():
+    # The taint flows pull in every danger_* package; load them once per
+    # worker, and only when danger rules are enabled.
+    from skylos.rules.danger.danger import scan_file_with_tree
+
+    return scan_file_with_tree
+
+
+_visitor_cache = threading.local()
+
+
+def _reusable_visitor(mod, file):
+    visitor = getattr(_visitor_cache, "visitor", None)
+    if visitor is None or type(visitor) is not Visitor:
+        visitor = Visitor(mod, file)
+        _visitor_cache.visitor = visitor
+    else:
+        visitor.reset(mod, file)
+    return visitor
+
+
 def proc_file(
     file_or_args,
     mod=None,
@@ -3732,11 +3765,6 @@ def proc_file(
                 "category": "DEAD_CODE",
             }
 
-        from skylos.analysis.ast_mask import (
-            apply_body_mask,
-            default_mask_spec_from_config,
-        )
-
         mask = default_mask_spec_from_config(cfg)
         tree, masked = apply_body_mask(tree, mask)
 
@@ -3762,11 +3790,9 @@ def proc_file(
             linter_d.visit(tree)
             danger_findings = linter_d.findings
 
-            from skylos.rules.danger.danger import scan_file_with_tree
-
             taint_findings = []
             try:
-                scan_file_with_tree(tree, Path(file), taint_findings, source=source)
+                _taint_scanner()(tree, Path(file), taint_findings, source=source)
             except Exception:
                 logger.debug("Taint analysis failed for %s", file, exc_info=True)
             if taint_findings:
@@ -3805,7 +3831,7 @@ def proc_file(
         fv = FrameworkAwareVisitor(filename=file)
         fv.visit(tree)
         fv.finalize()
-        v = Visitor(mod, file)
+        v = _reusable_visitor(mod, file)
         v.visit(tree)
         v.finalize()
 
@@ -3835,17 +3861,14 @@ def proc_file(
 
                 from skylos.analysis.architecture import (
                     _compute_abstractness,
+                    _count_source_loc,
                     _has_main_guard,
                 )
 
                 architecture_metrics = {
                     "abstractness": _compute_abstractness(architecture_tree),
                     "has_main_guard": _has_main_guard(architecture_tree),
-                    "loc": sum(
-                        1
-                        for line in source.splitlines()
-                        if line.strip() and not line.strip().startswith("#")
-                    ),
+                    "loc": _count_source_loc(source),
                 }
             except Exception:
                 logger.debug(
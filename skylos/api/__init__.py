@@ -1,12 +1,18 @@
 import os  # skylos: ignore[SKY-Q502] package facade is being split incrementally
+import gzip
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 import subprocess
 from skylos.cloud.credentials import get_key
 from skylos.reporting.sarif import SarifExporter
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import json
+import random
 from typing import Any
 from uuid import uuid4
 
@@ -38,6 +44,7 @@ from skylos.api._payloads import (
     _coerce_debt_snapshot_dict,
     _compact_finding_metadata as _compact_finding_metadata,
     _compact_upload_finding,
+    _dumps_json_bytes,
     _extract_workspace_upload_metadata,
     _infer_upload_project_root,
     _int_upload_value as _int_upload_value,
@@ -163,47 +170,48 @@ __all__ = [
 
 
 def _detect_ci():
-    if os.getenv("GITHUB_ACTIONS") == "true":
+    env = os.environ.get
+    if env("GITHUB_ACTIONS") == "true":
         return "github_actions", {
-            "run_id": os.getenv("GITHUB_RUN_ID"),
-            "run_attempt": os.getenv("GITHUB_RUN_ATTEMPT"),
-            "workflow": os.getenv("GITHUB_WORKFLOW"),
-            "actor": os.getenv("GITHUB_ACTOR"),
-            "repo": os.getenv("GITHUB_REPOSITORY"),
-            "ref": os.getenv("GITHUB_REF"),
-            "sha": os.getenv("GITHUB_SHA"),
+            "run_id": env("GITHUB_RUN_ID"),
+            "run_attempt": env("GITHUB_RUN_ATTEMPT"),
+            "workflow": env("GITHUB_WORKFLOW"),
+            "actor": env("GITHUB_ACTOR"),
+            "repo": env("GITHUB_REPOSITORY"),
+            "ref": env("GITHUB_REF"),
+            "sha": env("GITHUB_SHA"),
         }
 
-    if os.getenv("JENKINS_URL") or os.getenv("BUILD_NUMBER"):
+    if env("JENKINS_URL") or env("BUILD_NUMBER"):
         return "jenkins", {
-            "build_number": os.getenv("BUILD_NUMBER"),
-            "build_url": os.getenv("BUILD_URL"),
-            "job_name": os.getenv("JOB_NAME"),
-            "change_id": os.getenv("CHANGE_ID"),
-            "change_branch": os.getenv("CHANGE_BRANCH"),
-            "change_target": os.getenv("CHANGE_TARGET"),
-            "git_branch": os.getenv("GIT_BRANCH"),
-            "git_commit": os.getenv("GIT_COMMIT"),
+            "build_number": env("BUILD_NUMBER"),
+            "build_url": env("BUILD_URL"),
+            "job_name": env("JOB_NAME"),
+            "change_id": env("CHANGE_ID"),
+            "change_branch": env("CHANGE_BRANCH"),
+            "change_target": env("CHANGE_TARGET"),
+            "git_branch": env("GIT_BRANCH"),
+            "git_commit": env("GIT_COMMIT"),
         }
 
-    if os.getenv("CIRCLECI") == "true":
+    if env("CIRCLECI") == "true":
         return "circleci", {
-            "build_num": os.getenv("CIRCLE_BUILD_NUM"),
-            "workflow_id": os.getenv("CIRCLE_WORKFLOW_ID"),
-            "username": os.getenv("CIRCLE_USERNAME"),
-            "branch": os.getenv("CIRCLE_BRANCH"),
-            "sha1": os.getenv("CIRCLE_SHA1"),
-            "pr_url": os.getenv("CIRCLE_PULL_REQUEST"),
+            "build_num": env("CIRCLE_BUILD_NUM"),
+            "workflow_id": env("CIRCLE_WORKFLOW_ID"),
+            "username": env("CIRCLE_USERNAME"),
+            "branch": env("CIRCLE_BRANCH"),
+            "sha1": env("CIRCLE_SHA1"),
+            "pr_url": env("CIRCLE_PULL_REQUEST"),
         }
 
-    if os.getenv("GITLAB_CI") == "true":
+    if env("GITLAB_CI") == "true":
         return "gitlab", {
-            "pipeline_id": os.getenv("CI_PIPELINE_ID"),
-            "job_id": os.getenv("CI_JOB_ID"),
-            "commit_sha": os.getenv("CI_COMMIT_SHA"),
-            "commit_branch": os.getenv("CI_COMMIT_BRANCH"),
-            "merge_request_iid": os.getenv("CI_MERGE_REQUEST_IID"),
-            "user_login": os.getenv("GITLAB_USER_LOGIN"),
+            "pipeline_id": env("CI_PIPELINE_ID"),
+            "job_id": env("CI_JOB_ID"),
+            "commit_sha": env("CI_COMMIT_SHA"),
+            "commit_branch": env("CI_COMMIT_BRANCH"),
+            "merge_request_iid": env("CI_MERGE_REQUEST_IID"),
+            "user_login": env("GITLAB_USER_LOGIN"),
         }
 
     return None, {}
@@ -264,28 +272,55 @@ def _normalize_branch(branch):
 def _read_json(path: Path):
     try:
         if path and _is_bounded_regular_file(path):
-            return json.loads(path.read_text(encoding="utf-8"))  # skylos: ignore[SKY-D325] _is_bounded_regular_file rejects symlinks and caps size
+            stat = path.stat()
+            return _read_json_cached(str(path), stat.st_mtime_ns, stat.st_size)
     except (OSError, json.JSONDecodeError, ValueError):
         pass
     return None
 
 
+# Keyed by mtime and size so token lookups repeated within one run reuse the
+# parsed link/credentials files until they change on disk.
+@lru_cache(maxsize=4)
+def _read_json_cached(path_str: str, mtime_ns: int, size: int):
+    return json.loads(Path(path_str).read_text(encoding="utf-8"))  # skylos: ignore[SKY-D325] _is_bounded_regular_file rejects symlinks and caps size
+
+
 def _is_bounded_regular_file(path: Path, *, max_bytes: int = 1_000_000) -> bool:
     if path.is_symlink() or not path.is_file():
         return False
     return path.stat().st_size <= max_bytes
 
 
-def _get_repo_root_for_link():
+_GIT_TOPLEVEL_CACHE: dict[str, str | None] = {}
+
+
+def _git_toplevel() -> str | None:
+    # Token lookup, upload and verify all ask for the same toplevel within
+    # one run; key by cwd so a process that changes directory stays correct.
+    cwd = os.getcwd()
+    if cwd in _GIT_TOPLEVEL_CACHE:
+        return _GIT_TOPLEVEL_CACHE[cwd]
     try:
-        out = subprocess.check_output(
-            ["git", "rev-parse", "--show-toplevel"], stderr=subprocess.DEVNULL
+        toplevel = (
+            subprocess.check_output(
+                ["git", "rev-parse", "--show-toplevel"],
+                stderr=subprocess.DEVNULL,
+                timeout=SUBPROCESS_TIMEOUT,
+            )
+            .decode()
+            .strip()
         )
-        p = out.decode().strip()
-        if p:
-            return Path(p)
     except (subprocess.SubprocessError, OSError):
-        pass
+        return None
+    _GIT_TOPLEVEL_CACHE[cwd] = toplevel
+    return toplevel
+
+
+def _get_repo_root_for_link():
+    toplevel = _git_toplevel()
+    if toplevel:
+        return Path(toplevel)
     return Path.cwd()
 
 
@@ -310,6 +345,19 @@ else:
     AGENT_RUNS_URL = f"{BASE_URL}/api/agent-runs"
 
 
+
+def _new_api_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared so whoami, upload retries and verify reuse one TLS connection.
+_SESSION = _new_api_session()
+
+
 def _try_github_oidc_token():
     oidc_url = os.getenv("ACTIONS_ID_TOKEN_REQUEST_URL")
     oidc_token = os.getenv("ACTIONS_ID_TOKEN_REQUEST_TOKEN")
@@ -321,7 +369,7 @@ def _try_github_oidc_token():
             "audience",
             "skylos",
         )
-        resp = requests.get(
+        resp = _SESSION.get(
             oidc_url,
             headers={"Authorization": f"Bearer {oidc_token}"},
             timeout=SUBPROCESS_TIMEOUT,
@@ -365,19 +413,29 @@ def get_project_token() -> str | None:
     return get_key("skylos_token")
 
 
+PROJECT_INFO_TTL_SECONDS = 60
+
+_PROJECT_INFO_CACHE: dict[str, tuple[float, dict]] = {}
+
+
 def get_project_info(token) -> dict | None:
     if not token:
         return None
     if token.startswith("oidc:"):
         return None
+    cached = _PROJECT_INFO_CACHE.get(token)
+    if cached and time.monotonic() - cached[0] < PROJECT_INFO_TTL_SECONDS:
+        return cached[1]
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             WHOAMI_URL,
             headers={"Authorization": f"Bearer {token}"},
             timeout=SUBPROCESS_TIMEOUT,
         )
         if resp.status_code == 200:
-            return resp.json()
+            info = resp.json()
+            _PROJECT_INFO_CACHE[token] = (time.monotonic(), info)
+            return info
     except (OSError, ValueError):
         logger.debug("Failed to get project info", exc_info=True)
     return None
@@ -389,7 +447,7 @@ def get_credit_balance(token=None) -> dict | None:
     if not token or token.startswith("oidc:"):
         return None
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             _validate_api_request_url(f"{BASE_URL}/api/credits/balance"),
             headers={"Authorization": f"Bearer {token}"},
             timeout=SUBPROCESS_TIMEOUT,
@@ -420,16 +478,7 @@ def print_credit_status(token=None, quiet=False):
 
 
 def get_git_root() -> str | None:
-    try:
-        return (
-            subprocess.check_output(
-                ["git", "rev-parse", "--show-toplevel"], stderr=subprocess.DEVNULL
-            )
-            .decode()
-            .strip()
-        )
-    except (subprocess.SubprocessError, OSError):
-        return None
+    return _git_toplevel()
 
 
 def _resolve_repo_link_path(git_root) -> Path | None:
@@ -525,24 +574,21 @@ def _ci_actor(meta: dict) -> str | None:
 
 def _read_git_head() -> tuple[str | None, str | None]:
     try:
-        git_commit = (
+        # One rev-parse prints the full sha, then the abbreviated ref name.
+        out = (
             subprocess.check_output(
-                ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL
-            )
-            .decode()
-            .strip()
-        )
-        git_branch = (
-            subprocess.check_output(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+                ["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"],
                 stderr=subprocess.DEVNULL,
+                timeout=SUBPROCESS_TIMEOUT,
             )
             .decode()
-            .strip()
+            .splitlines()
         )
-        return git_commit, git_branch
     except (subprocess.SubprocessError, OSError):
         return None, None
+    git_commit = out[0].strip() if out else None
+    git_branch = out[1].strip() if len(out) > 1 else None
+    return git_commit, git_branch
 
 
 def _build_ci_metadata(provider: str | None, meta: dict, pr_number: int | None) -> dict:
@@ -566,6 +612,20 @@ def _truthy_env(name: str) -> bool:
     return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _json_request_kwargs(payload, headers) -> dict[str, Any]:
+    if not _truthy_env("SKYLOS_GZIP_UPLOADS"):
+        return {"json": payload, "headers": headers}
+    body = gzip.compress(_dumps_json_bytes(payload), compresslevel=3)
+    return {
+        "data": body,
+        "headers": {
+            **headers,
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+        },
+    }
+
+
 def _legacy_inline_upload_limit_bytes() -> int:
     raw = os.getenv("SKYLOS_INLINE_UPLOAD_LIMIT_BYTES", "4000000").strip()
     try:
@@ -674,22 +734,27 @@ def _prepare_report_upload(
     analysis_mode="static",
     scan_bundle_id=None,
 ) -> PreparedReportUpload:
-    commit, branch, actor, ci = get_git_info()
-    git_root = get_git_root()
-    project_root = _infer_upload_project_root(result_json, git_root)
-
-    all_findings = _normalize_result_sections(
-        result_json,
-        UPLOAD_FINDING_SPECS,
-        git_root,
-        extract_metadata=True,
-    )
-    _annotate_findings_with_blame(all_findings, git_root)
+    # git metadata and AI-commit detection only shell out to git, so run
+    # them alongside finding normalization and blame annotation.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        git_info_future = executor.submit(get_git_info)
+        git_root = get_git_root()
+        ai_code_future = executor.submit(detect_ai_code, git_root)
+        project_root = _infer_upload_project_root(result_json, git_root)
+
+        all_findings = _normalize_result_sections(
+            result_json,
+            UPLOAD_FINDING_SPECS,
+            git_root,
+            extract_metadata=True,
+        )
+        _annotate_findings_with_blame(all_findings, git_root)
 
-    exporter = SarifExporter(all_findings, tool_name="Skylos")
-    core_payload = exporter.generate()
+        exporter = SarifExporter(all_findings, tool_name="Skylos")
+        core_payload = exporter.generate()
 
-    ai_code = detect_ai_code(git_root)
+        commit, branch, actor, ci = git_info_future.result()
+        ai_code = ai_code_future.result()
     if isinstance(result_json, dict) and "provenance" in result_json:
         raw_provenance = result_json.get("provenance")
         provenance_data = raw_provenance if isinstance(raw_provenance, dict) else None
@@ -1158,6 +1223,10 @@ def _report_upload_success_result(
     }
 
 
+RETRY_BACKOFF_SECONDS = 0.5
+RETRY_AFTER_MAX_SECONDS = 30
+
+
 def _post_json_with_retries(
     url,
     headers,
@@ -1173,19 +1242,23 @@ def _post_json_with_retries(
     except ValueError as exc:
         return None, f"Unsafe API URL: {exc}"
 
+    request_kwargs = _json_request_kwargs(payload, headers)
     last_err = None
+    response = None
     for attempt in range(3):
+        if attempt > 0:
+            time.sleep(_retry_delay_seconds(attempt, response))
+        response = None
         try:
             if not quiet:
                 if attempt == 0 and initial_message:
                     print(initial_message, end="", flush=True)
                 elif attempt > 0:
                     print(f" retrying ({attempt + 1}/3)...", end="", flush=True)
-            response = requests.post(
+            response = _SESSION.post(
                 safe_url,
-                json=payload,
-                headers=headers,
                 timeout=timeout,
+                **request_kwargs,
             )
             if response.status_code in accepted_statuses:
                 return response, None
@@ -1198,6 +1271,14 @@ def _post_json_with_retries(
     return None, last_err or "Unknown error"
 
 
+def _retry_delay_seconds(attempt: int, response=None) -> float:
+    if response is not None and response.status_code in (429, 503):
+        retry_after = _parse_optional_int(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return float(min(max(retry_after, 0), RETRY_AFTER_MAX_SECONDS))
+    return RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1) + random.random() * 0.25
+
+
 def _post_report_payload(token, payload, *, quiet=False, initial_message=None):
     return _post_json_with_retries(
         REPORT_URL,
@@ -1621,18 +1702,18 @@ def upload_report(
             "error": "No token found. Run 'skylos login' or 'skylos project use', or set SKYLOS_TOKEN.",
         }
 
-    if not quiet:
-        info = get_project_info(token)
-        if info and info.get("ok"):
-            project_name = info.get("project", {}).get("name", "Unknown")
-            print(f"Uploading to: {project_name}")
-
-    prepared = _prepare_report_upload(
-        result_json,
-        is_forced=is_forced,
-        analysis_mode=analysis_mode,
-        scan_bundle_id=scan_bundle_id,
-    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        info_future = None if quiet else executor.submit(get_project_info, token)
+        prepared = _prepare_report_upload(
+            result_json,
+            is_forced=is_forced,
+            analysis_mode=analysis_mode,
+            scan_bundle_id=scan_bundle_id,
+        )
+        info = info_future.result() if info_future is not None else None
+    if info and info.get("ok"):
+        project_name = info.get("project", {}).get("name", "Unknown")
+        print(f"Uploading to: {project_name}")
 
     if _should_use_legacy_inline_report_upload(prepared):
         return upload_report_legacy(
@@ -1906,7 +1987,7 @@ def upload_agent_run(
             "status": status,
         }
 
-        requests.post(
+        _SESSION.post(
             AGENT_RUNS_URL,
             json=payload,
             headers=_build_auth_headers(token),
@@ -1950,7 +2031,7 @@ def verify_report(result_json, quiet=False) -> dict:
 
     data = response["response"].json() or {}
     results = data.get("results") or []
-    _merge_verification_results(result_json, results)
+    _merge_verification_results(result_json, findings, results)
     verdict_counts = _verification_verdict_counts(results)
 
     if not quiet:
@@ -1979,11 +2060,10 @@ def _post_verification_request(
         "findings": findings,
     }
     try:
-        response = requests.post(
+        response = _SESSION.post(
             VERIFY_URL,
-            json=payload,
-            headers={"Authorization": f"Bearer {token}"},
             timeout=UPLOAD_TIMEOUT,
+            **_json_request_kwargs(payload, {"Authorization": f"Bearer {token}"}),
         )
     except requests.exceptions.RequestException as exc:
         return {
@@ -2015,10 +2095,21 @@ def _verification_error_response(response) -> dict | None:
     return None
 
 
-def _merge_verification_results(result_json: dict, results: list[dict]) -> None:
+def _merge_verification_results(
+    result_json: dict, findings: list[dict], results: list[dict]
+) -> None:
     by_id = _verification_results_by_id(results)
-    _merge_verified_items(result_json.get("danger", []), by_id)
-    _merge_verified_items(result_json.get("secrets", []), by_id)
+    originals = [
+        item
+        for section_name, _, _ in VERIFY_FINDING_SPECS
+        for item in result_json.get(section_name) or []
+    ]
+    # findings were normalized from these same items in the same order, so
+    # reuse their finding_id instead of rebuilding the key per item.
+    for item, finding in zip(originals, findings):
+        verification = by_id.get(finding["finding_id"])
+        if verification:
+            item["verification"] = verification
 
 
 def _verification_results_by_id(results: list[dict]) -> dict:
@@ -2030,29 +2121,6 @@ def _verification_results_by_id(results: list[dict]) -> dict:
     }
 
 
-def _merge_verified_items(items, by_id: dict) -> None:
-    for item in items or []:
-        verification = by_id.get(_verification_item_id(item))
-        if verification:
-            item["verification"] = verification
-
-
-def _verification_item_id(item: dict) -> str:
-    rule_id = str(item.get("rule_id") or item.get("rule") or item.get("code") or "UNKNOWN")
-    file_path = (item.get("file_path") or item.get("file") or "unknown").replace(
-        "\\", "/"
-    )
-    line = _coerce_verification_line(item.get("line_number") or item.get("line") or 1)
-    return f"{rule_id}::{file_path}::{line}"
-
-
-def _coerce_verification_line(value) -> int:
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return 1
-
-
 def _verification_verdict_counts(results: list[dict]) -> dict[str, int]:
     verdict_counts = {"VERIFIED": 0, "REFUTED": 0, "UNKNOWN": 0}
     for result in results:
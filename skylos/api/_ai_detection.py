@@ -1,37 +1,32 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
 import subprocess
 from collections.abc import Callable
 
-from skylos.constants import NETWORK_TIMEOUT_SHORT, SUBPROCESS_TIMEOUT
+from skylos.constants import SUBPROCESS_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
-_AI_COAUTHOR_PATTERNS = [
-    re.compile(r"copilot", re.IGNORECASE),
-    re.compile(r"claude", re.IGNORECASE),
-    re.compile(r"cursor", re.IGNORECASE),
-    re.compile(r"codewhisperer", re.IGNORECASE),
-    re.compile(r"tabnine", re.IGNORECASE),
-    re.compile(r"github-actions\[bot\]", re.IGNORECASE),
-    re.compile(r"devin", re.IGNORECASE),
-]
-
-_AI_EMAIL_PATTERNS = [
-    re.compile(r"\[bot\]@", re.IGNORECASE),
-    re.compile(r"copilot", re.IGNORECASE),
-    re.compile(r"cursor", re.IGNORECASE),
-    re.compile(r"claude", re.IGNORECASE),
-]
-
-_AI_MESSAGE_PATTERNS = [
-    re.compile(r"generated\s+by\s+(copilot|claude|cursor|ai)", re.IGNORECASE),
-    re.compile(r"ai[- ]generated", re.IGNORECASE),
-    re.compile(r"co-authored-by.*copilot", re.IGNORECASE),
-    re.compile(r"co-authored-by.*claude", re.IGNORECASE),
-]
+# Prefixes each commit header in `git log --name-only` output so it can be
+# told apart from the changed-file lines that follow it.
+_COMMIT_MARKER = "\x1e"
+
+_AI_COAUTHOR_RE = re.compile(
+    r"copilot|claude|cursor|codewhisperer|tabnine|github-actions\[bot\]|devin",
+    re.IGNORECASE,
+)
+
+_AI_EMAIL_RE = re.compile(r"\[bot\]@|copilot|cursor|claude", re.IGNORECASE)
+
+_AI_MESSAGE_RE = re.compile(
+    r"generated\s+by\s+(?:copilot|claude|cursor|ai)"
+    r"|ai[- ]generated"
+    r"|co-authored-by.*(?:copilot|claude)",
+    re.IGNORECASE,
+)
 
 
 def _empty_ai_detection() -> dict:
@@ -52,6 +47,12 @@ def detect_ai_code(
         git_root = get_git_root_func() if get_git_root_func is not None else None
     if not git_root:
         return _empty_ai_detection()
+    if os.getenv("SKYLOS_SKIP_AI_DETECT") == "1":
+        return _empty_ai_detection()
+    # .git is a directory in a normal checkout and a file in worktrees and
+    # submodules; without either there is no history worth a git log.
+    if not os.path.exists(os.path.join(git_root, ".git")):
+        return _empty_ai_detection()
 
     indicators = []
     ai_files = set()
@@ -61,7 +62,8 @@ def detect_ai_code(
             [
                 "git",
                 "log",
-                "--format=%H|%an|%ae|%s|%(trailers:key=Co-authored-by,valueonly,separator=%x00)",
+                f"--format={_COMMIT_MARKER}%H|%an|%ae|%s|%(trailers:key=Co-authored-by,valueonly,separator=%x00)",
+                "--name-only",
                 "-50",
             ],
             cwd=git_root,
@@ -69,10 +71,8 @@ def detect_ai_code(
             timeout=SUBPROCESS_TIMEOUT,
         ).decode("utf-8", errors="ignore")
 
-        for line in log_output.strip().splitlines():
-            if not line.strip():
-                continue
-            parts = line.split("|", 4)
+        for header, files in _iter_log_records(log_output):
+            parts = header.split("|", 4)
             if len(parts) < 4:
                 continue
 
@@ -92,7 +92,7 @@ def detect_ai_code(
             )
 
             if is_ai_commit:
-                _collect_ai_commit_files(git_root, commit_sha, ai_files)
+                ai_files.update(files)
 
     except (subprocess.SubprocessError, OSError):
         logger.debug("Failed to detect AI code from git log", exc_info=True)
@@ -113,62 +113,53 @@ def _append_ai_indicator(
     subject: str,
     trailers: str,
 ) -> bool:
-    for pattern in _AI_COAUTHOR_PATTERNS:
-        if pattern.search(trailers):
-            indicators.append(
-                {
-                    "type": "co-author",
-                    "commit": commit_sha[:7],
-                    "detail": trailers.strip()[:100],
-                }
-            )
-            return True
-
-    for pattern in _AI_EMAIL_PATTERNS:
-        if pattern.search(author_email):
-            indicators.append(
-                {
-                    "type": "author-email",
-                    "commit": commit_sha[:7],
-                    "detail": f"{author_name} <{author_email}>",
-                }
-            )
-            return True
-
-    for pattern in _AI_MESSAGE_PATTERNS:
-        if pattern.search(subject):
-            indicators.append(
-                {
-                    "type": "commit-message",
-                    "commit": commit_sha[:7],
-                    "detail": subject[:100],
-                }
-            )
-            return True
+    if _AI_COAUTHOR_RE.search(trailers):
+        indicators.append(
+            {
+                "type": "co-author",
+                "commit": commit_sha[:7],
+                "detail": trailers.strip()[:100],
+            }
+        )
+        return True
+
+    if _AI_EMAIL_RE.search(author_email):
+        indicators.append(
+            {
+                "type": "author-email",
+                "commit": commit_sha[:7],
+                "detail": f"{author_name} <{author_email}>",
+            }
+        )
+        return True
+
+    if _AI_MESSAGE_RE.search(subject):
+        indicators.append(
+            {
+                "type": "commit-message",
+                "commit": commit_sha[:7],
+                "detail": subject[:100],
+            }
+        )
+        return True
 
     return False
 
 
-def _collect_ai_commit_files(git_root: str, commit_sha: str, ai_files: set[str]) -> None:
-    try:
-        diff_output = subprocess.check_output(
-            [
-                "git",
-                "diff-tree",
-                "--no-commit-id",
-                "--name-only",
-                "-r",
-                commit_sha,
-            ],
-            cwd=git_root,
-            stderr=subprocess.DEVNULL,
-            timeout=NETWORK_TIMEOUT_SHORT,
-        ).decode("utf-8", errors="ignore")
-        for file_path in diff_output.strip().splitlines():
-            if file_path.strip():
-                ai_files.add(file_path.strip())
-    except (subprocess.SubprocessError, OSError):
-        logger.debug("Failed to get git diff-tree for AI detection", exc_info=True)
+def _iter_log_records(log_output: str):
+    header = None
+    files: list[str] = []
+    # str.splitlines() treats the record separator as a line break.
+    for line in log_output.split("\n"):
+        if line.startswith(_COMMIT_MARKER):
+            if header is not None:
+                yield header, files
+            header = line[len(_COMMIT_MARKER) :]
+            files = []
+        elif header is not None and line.strip():
+            files.append(line.strip())
+    if header is not None:
+        yield header, files
 
 
 def _confidence_for_indicators(indicators: list[dict]) -> str:
@@ -54,18 +54,22 @@ def _normalize_findings(
     default_severity=None,
     extract_metadata=False,
     generate_finding_id=False,
+    path_cache: dict[str, tuple[str, str]] | None = None,
 ) -> list[dict]:
     """Unified finding normalization used by upload and verify paths."""
     _validate_category(category)
+    if path_cache is None:
+        path_cache = {}
     return [
         _normalize_finding(
-            dict(item),
+            item.copy(),
             category,
             git_root,
             default_rule_id=default_rule_id,
             default_severity=default_severity,
             extract_metadata=extract_metadata,
             generate_finding_id=generate_finding_id,
+            path_cache=path_cache,
         )
         for item in items or []
     ]
@@ -85,14 +89,20 @@ def _normalize_finding(
     default_severity=None,
     extract_metadata=False,
     generate_finding_id=False,
+    path_cache: dict[str, tuple[str, str]],
 ) -> dict:
     raw_path = finding.get("file_path") or finding.get("file") or ""
-    file_abs = os.path.abspath(raw_path) if raw_path else ""
+    paths = path_cache.get(raw_path)
+    if paths is None:
+        file_abs = os.path.abspath(raw_path) if raw_path else ""
+        paths = (file_abs, _normalize_file_path(raw_path, file_abs, git_root))
+        path_cache[raw_path] = paths
+    file_abs, file_path = paths
     line = _coerce_line_number(finding.get("line_number") or finding.get("line") or 1)
 
     finding["rule_id"] = _normalize_rule_id(finding, default_rule_id)
     finding["line_number"] = line
-    finding["file_path"] = _normalize_file_path(raw_path, file_abs, git_root)
+    finding["file_path"] = file_path
     finding["category"] = category
     _apply_default_severity(finding, default_severity)
     _apply_default_message(finding, category)
@@ -194,6 +204,9 @@ def _normalize_result_sections(
     generate_finding_id=False,
 ) -> list[dict]:
     findings: list[dict] = []
+    # Findings from every section share one path cache; many point at the
+    # same handful of files.
+    path_cache: dict[str, tuple[str, str]] = {}
     for section_name, category, default_rule_id in section_specs:
         findings.extend(
             _normalize_findings(
@@ -204,6 +217,7 @@ def _normalize_result_sections(
                 default_severity=default_severity,
                 extract_metadata=extract_metadata,
                 generate_finding_id=generate_finding_id,
+                path_cache=path_cache,
             )
         )
     return findings
@@ -2,6 +2,11 @@ from pathlib import Path
 from typing import Any
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 __all__ = [
     "_build_legacy_payload",
@@ -9,6 +14,7 @@ __all__ = [
     "_coerce_debt_snapshot_dict",
     "_compact_finding_metadata",
     "_compact_upload_finding",
+    "_dumps_json_bytes",
     "_extract_workspace_upload_metadata",
     "_infer_upload_project_root",
     "_int_upload_value",
@@ -17,7 +23,18 @@ __all__ = [
 ]
 
 
+def _dumps_json_bytes(payload: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
 def _json_size_bytes(payload: Any) -> int:
+    # Inline uploads go out as requests' json=, i.e. stdlib json with
+    # ensure_ascii, so measure that rather than orjson's raw UTF-8.
     return len(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
 
 
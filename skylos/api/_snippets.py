@@ -1,3 +1,4 @@
+from itertools import islice
 from pathlib import Path
 
 from skylos.constants import SNIPPET_CONTEXT_LINES
@@ -5,6 +6,10 @@ from skylos.constants import SNIPPET_CONTEXT_LINES
 
 __all__ = ["_resolve_snippet_path", "extract_snippet"]
 
+# Files below this size are read and split in one pass; larger ones are
+# streamed so only the lines up to the snippet window are read.
+_SNIPPET_STREAM_MIN_BYTES = 1 << 20
+
 
 def _resolve_snippet_path(file_abs, repo_root=None) -> Path | None:
     if not file_abs:
@@ -37,9 +42,12 @@ def extract_snippet(
     if safe_path is None:
         return None
     try:
-        lines = safe_path.read_text(encoding="utf-8", errors="ignore").splitlines()
         start = max(0, line_number - 1 - context)
-        end = min(len(lines), line_number + context)
-        return "\n".join(lines[start:end])
+        end = max(start, line_number + context)
+        with safe_path.open(encoding="utf-8", errors="ignore") as handle:
+            if safe_path.stat().st_size < _SNIPPET_STREAM_MIN_BYTES:
+                return "\n".join(handle.read().splitlines()[start:end])
+            lines = [line.rstrip("\n") for line in islice(handle, start, end)]
+        return "\n".join(lines)
     except (OSError, UnicodeDecodeError):
         return None
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import bisect
+import io
 import json
 import logging
 import os
 import re
 import subprocess
+from functools import lru_cache
 
 import requests
 from rich.console import Console
@@ -26,6 +29,9 @@ from skylos.rules.quality.regression import detect_security_regressions
 console = Console()
 logger = logging.getLogger(__name__)
 
+_HUNK_RE = re.compile(rb"^@@ .+ \+(\d+)(?:,(\d+))? @@")
+_PR_REF_RE = re.compile(r"refs/pull/(\d+)/merge")
+
 
 def run_pr_review(
     results: dict,
@@ -86,25 +92,30 @@ def run_pr_review(
         defense_report=defense_report,
     )
 
-    if findings and not summary_only:
-        _post_pr_review(
-            findings[:max_comments],
-            pr_number,
-            repo,
-            evidence_cards=evidence_cards,
-        )
-
-    _post_summary_comment(
+    summary_body = _format_summary_body(
         all_findings,
         findings,
-        pr_number,
-        repo,
         grade=grade,
         previous_grade=previous_grade,
         evidence_cards=evidence_cards,
         risk_passport=risk_passport,
     )
 
+    # The review's own body carries the summary, so a posted review needs no
+    # second `gh` round-trip for a separate PR comment.
+    posted_review = False
+    if findings and not summary_only:
+        posted_review = _post_pr_review(
+            findings[:max_comments],
+            pr_number,
+            repo,
+            evidence_cards=evidence_cards,
+            summary_body=summary_body,
+        )
+
+    if not posted_review:
+        _post_summary_body(summary_body, pr_number, repo)
+
     console.print(
         f"[green]Posted review on PR #{pr_number} "
         f"({len(findings)} inline, {len(all_findings)} total)[/green]"
@@ -127,31 +138,45 @@ def _resolve_review_provenance(results: dict, *, diff_base: str) -> dict | None:
 
 
 def get_changed_line_ranges(base_ref: str = "origin/main") -> list[dict]:
+    # Stream git's stdout straight into the parser: only the file and hunk
+    # headers are kept, so the diff body is never held in memory. The pipe
+    # stays binary so body lines are never decoded.
     try:
-        result = subprocess.run(
-            ["git", "diff", "--unified=0", f"{base_ref}...HEAD"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            return []
+        with subprocess.Popen(
+            ["git", "diff", "--unified=0", "--no-color", f"{base_ref}...HEAD"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        ) as proc:
+            entries = _parse_diff_lines(proc.stdout)
     except FileNotFoundError:
         return []
 
-    return _parse_unified_diff(result.stdout)
+    if proc.returncode != 0:
+        return []
+    return entries
 
 
 def _parse_unified_diff(diff_output: str) -> list[dict]:
+    return _parse_diff_lines(io.BytesIO(diff_output.encode("utf-8")))
+
+
+def _parse_diff_lines(lines) -> list[dict]:
     entries = []
     current_file = None
 
-    for line in diff_output.splitlines():
-        if line.startswith("+++ b/"):
-            current_file = line[6:]
+    # Only file headers and hunk headers matter; body lines are skipped on
+    # their first character.
+    for line in lines:
+        first = line[:1]
+        if first == b"+":
+            if line.startswith(b"+++ b/"):
+                current_file = line[6:].rstrip(b"\r\n").decode("utf-8", "replace")
+            continue
+        if first != b"@" or not current_file:
             continue
 
-        hunk_match = re.match(r"^@@ .+ \+(\d+)(?:,(\d+))? @@", line)
-        if hunk_match and current_file:
+        hunk_match = _HUNK_RE.match(line)
+        if hunk_match:
             start = int(hunk_match.group(1))
             count = int(hunk_match.group(2) or 1)
             if count > 0:
@@ -235,21 +260,43 @@ def filter_findings_to_diff(
     for r in changed_ranges:
         ranges_by_file.setdefault(r["file"], []).append((r["start"], r["end"]))
 
+    # Sort and merge each file's hunks so a single bisect on the starts finds
+    # the only range that can contain a line.
+    spans_by_file = {}
+    for diff_file, ranges in ranges_by_file.items():
+        starts = []
+        ends = []
+        for start, end in sorted(ranges):
+            if ends and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        spans_by_file[diff_file] = (starts, ends)
+
+    resolved_spans = {}
     filtered = []
     for finding in findings:
         file = finding.get("file", "")
         line = finding.get("line", 0)
 
-        file_ranges = ranges_by_file.get(file, [])
-        if not file_ranges:
-            for diff_file, ranges in ranges_by_file.items():
-                if file.endswith("/" + diff_file) or diff_file.endswith("/" + file):
-                    file_ranges = ranges
-                    break
-        for start, end in file_ranges:
-            if start <= line <= end:
-                filtered.append(finding)
-                break
+        if file in resolved_spans:
+            spans = resolved_spans[file]
+        else:
+            spans = spans_by_file.get(file)
+            if spans is None:
+                for diff_file, candidate in spans_by_file.items():
+                    if file.endswith("/" + diff_file) or diff_file.endswith("/" + file):
+                        spans = candidate
+                        break
+            resolved_spans[file] = spans
+
+        if spans is None:
+            continue
+        starts, ends = spans
+        idx = bisect.bisect_right(starts, line) - 1
+        if idx >= 0 and line <= ends[idx]:
+            filtered.append(finding)
 
     return filtered
 
@@ -605,7 +652,8 @@ def _post_pr_review(
     repo: str,
     *,
     evidence_cards: bool = False,
-) -> None:
+    summary_body: str | None = None,
+) -> bool:
     comments = []
     for f in findings:
         if not f.get("file") or not f.get("line"):
@@ -624,15 +672,18 @@ def _post_pr_review(
         )
 
     if not comments:
-        return
+        return False
 
-    payload = {
-        "body": (
+    if summary_body is None:
+        summary_body = (
             f"Skylos found {len(comments)} issue(s) on changed lines.\n\n"
             "---\n"
             "_🤖 Analyzed by [Skylos](https://github.com/duriantaco/skylos) • "
             "[Set up in 30 seconds](https://github.com/duriantaco/skylos#cicd)_"
-        ),
+        )
+
+    payload = {
+        "body": summary_body,
         "event": "COMMENT",
         "comments": comments,
     }
@@ -655,19 +706,19 @@ def _post_pr_review(
         )
     except subprocess.CalledProcessError as e:
         console.print(f"[yellow]Failed to post PR review: {e.stderr}[/yellow]")
+        return False
+    return True
 
 
-def _post_summary_comment(
+def _format_summary_body(
     all_findings: list[dict],
     diff_findings: list[dict],
-    pr_number: int,
-    repo: str,
     *,
     grade: dict | None = None,
     previous_grade: dict | None = None,
     evidence_cards: bool = False,
     risk_passport: dict | None = None,
-) -> None:
+) -> str:
     by_severity = {}
     for f in all_findings:
         sev = f.get("severity", "MEDIUM")
@@ -836,8 +887,10 @@ def _post_summary_comment(
                 f"| {display} | {cat['score']}{delta_str} | {cat['letter']} | {issue} |"
             )
 
-    body = "\n".join(lines)
+    return "\n".join(lines)
+
 
+def _post_summary_body(body: str, pr_number: int, repo: str) -> None:
     try:
         subprocess.run(
             ["gh", "pr", "comment", str(pr_number), "--body", body, "--repo", repo],
@@ -878,12 +931,13 @@ def _fetch_previous_grade(base_branch: str = "origin/main") -> dict | None:
 
 def _detect_pr_number() -> int | None:
     ref = os.environ.get("GITHUB_REF", "")
-    match = re.match(r"refs/pull/(\d+)/merge", ref)
+    match = _PR_REF_RE.match(ref)
     if match:
         return int(match.group(1))
     return None
 
 
+@lru_cache(maxsize=1)
 def _gh_available() -> bool:
     try:
         subprocess.run(["gh", "--version"], capture_output=True, check=True)
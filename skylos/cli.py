@@ -8,6 +8,7 @@ import logging
 import os
 import secrets as secrets_lib
 import tempfile
+from functools import lru_cache
 from types import SimpleNamespace
 from skylos.cli_core.dispatch import (
     EARLY_COMMAND_HANDLERS as EARLY_COMMAND_HANDLERS,
@@ -23,6 +24,7 @@ from skylos.cli_core.main_parser import (
 from skylos.constants import (
     parse_exclude_folders,
     DEFAULT_EXCLUDE_FOLDERS,
+    SORTED_DEFAULT_EXCLUDE_FOLDERS,
     get_non_library_dir_kind,
 )
 from skylos.config import (
@@ -30,14 +32,6 @@ from skylos.config import (
     load_config,
     resolve_config_file_path,
 )
-from skylos.cloud.credentials import PROVIDERS
-from skylos.core.result_cache import (
-    build_trace_cache_key,
-    load_trace_cache,
-    read_trace_payload,
-    save_trace_cache,
-    write_trace_payload,
-)
 from skylos.remediation.safety import resolve_remediation_path
 
 from pathlib import Path
@@ -48,7 +42,6 @@ import subprocess
 import textwrap
 
 from skylos.reporting.github_annotations import (
-    _emit_github_annotation as _emit_github_annotation,
     _emit_github_annotations,
     _emit_github_grade_annotation as _emit_github_grade_annotation,
     _filter_github_annotations_by_severity as _filter_github_annotations_by_severity,
@@ -85,6 +78,7 @@ from skylos.ui.rich_report import (
     _render_unused_simple as _render_unused_simple,
     _results_pill as _results_pill,
     _score_style as _score_style,
+    _shorten_path as _shorten_path,
     _verification_label as _verification_label,
     _verification_proof as _verification_proof,
     render_results,
@@ -97,7 +91,6 @@ from rich.progress import Progress as Progress
 from rich.progress import SpinnerColumn as SpinnerColumn
 from rich.progress import TextColumn as TextColumn
 from rich.theme import Theme
-from rich.logging import RichHandler
 from rich.rule import Rule
 
 class _LazyInquirer:
@@ -171,6 +164,17 @@ def comment_out_unused_function_cst(*args, **kwargs):
     return _codemods_module().comment_out_unused_function_cst(*args, **kwargs)
 
 
+def apply_cst_edits(*args, **kwargs):
+    return _codemods_module().apply_cst_edits(*args, **kwargs)
+
+
+def RichHandler(*args, **kwargs):
+    # rich.logging drags in rich.traceback; only the scan logger needs it.
+    from rich.logging import RichHandler as RichHandlerImpl
+
+    return RichHandlerImpl(*args, **kwargs)
+
+
 def run_analyze(*args, **kwargs):
     from skylos.analyzer import analyze as run_analyze_impl
 
@@ -732,6 +736,32 @@ class CleanFormatter(logging.Formatter):
         return record.getMessage()
 
 
+class _BufferedFileHandler(logging.FileHandler):
+    # FileHandler flushes after every record, which is one write syscall per
+    # line for large reports. Buffer instead; close() at logging shutdown
+    # flushes whatever is left.
+    buffer_size = 1 << 20
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 def _skylos_console_theme():
     return Theme(
         {
@@ -744,38 +774,61 @@ def _skylos_console_theme():
     )
 
 
+_console_log_handler = None
+
+
 def setup_logger(output_file=None):
-    console = Console(theme=_skylos_console_theme())
+    global _console_log_handler
 
     logger = logging.getLogger("skylos")
     logger.setLevel(logging.INFO)
-    logger.handlers.clear()
 
-    rich_handler = RichHandler(
-        console=console, show_time=False, show_path=False, markup=True
-    )
-    rich_handler.setFormatter(CleanFormatter())
-    logger.addHandler(rich_handler)
+    # Repeated main() calls in one process reuse the console handler set up
+    # by the first; only the optional file handler is swapped.
+    rich_handler = _console_log_handler
+    if rich_handler is None or logger.handlers[:1] != [rich_handler]:
+        console = Console(theme=_skylos_console_theme())
+        logger.handlers.clear()
+        rich_handler = RichHandler(
+            console=console, show_time=False, show_path=False, markup=True
+        )
+        rich_handler.setFormatter(CleanFormatter())
+        logger.addHandler(rich_handler)
+        logger.console = console
+        _console_log_handler = rich_handler
+
+    for handler in logger.handlers[1:]:
+        logger.removeHandler(handler)
+        handler.close()
 
     if output_file:
         file_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        file_handler = logging.FileHandler(output_file)
+        file_handler = _BufferedFileHandler(output_file, encoding="utf-8")
         file_handler.setFormatter(file_formatter)
         logger.addHandler(file_handler)
 
     logger.propagate = False
-    logger.console = console
     return logger
 
 
+def _read_source(path):
+    # read_text() would turn CRLF into "\n"; libcst writes back whichever
+    # newline the source it was given uses, so decode the raw bytes instead.
+    return path.read_bytes().decode("utf-8")
+
+
+def _write_source(path, code):
+    path.write_text(code, encoding="utf-8", newline="")
+
+
 def remove_unused_import(file_path, import_name, line_number, *, root_path=None):
     try:
         path = resolve_remediation_path(file_path, root_path=root_path)
-        src = path.read_text(encoding="utf-8")
+        src = _read_source(path)
         new_code, changed = remove_unused_import_cst(src, import_name, line_number)
         if not changed:
             return False
-        path.write_text(new_code, encoding="utf-8")
+        _write_source(path, new_code)
         return True
 
     except Exception as e:
@@ -786,11 +839,11 @@ def remove_unused_import(file_path, import_name, line_number, *, root_path=None)
 def remove_unused_function(file_path, function_name, line_number, *, root_path=None):
     try:
         path = resolve_remediation_path(file_path, root_path=root_path)
-        src = path.read_text(encoding="utf-8")
+        src = _read_source(path)
         new_code, changed = remove_unused_function_cst(src, function_name, line_number)
         if not changed:
             return False
-        path.write_text(new_code, encoding="utf-8")
+        _write_source(path, new_code)
         return True
 
     except Exception as e:
@@ -805,13 +858,13 @@ def comment_out_unused_import(
 ):
     try:
         path = resolve_remediation_path(file_path, root_path=root_path)
-        src = path.read_text(encoding="utf-8")
+        src = _read_source(path)
         new_code, changed = comment_out_unused_import_cst(
             src, import_name, line_number, marker=marker
         )
         if not changed:
             return False
-        path.write_text(new_code, encoding="utf-8")
+        _write_source(path, new_code)
         return True
 
     except Exception as e:
@@ -826,13 +879,13 @@ def comment_out_unused_function(
 ):
     try:
         path = resolve_remediation_path(file_path, root_path=root_path)
-        src = path.read_text(encoding="utf-8")
+        src = _read_source(path)
         new_code, changed = comment_out_unused_function_cst(
             src, function_name, line_number, marker=marker
         )
         if not changed:
             return False
-        path.write_text(new_code, encoding="utf-8")
+        _write_source(path, new_code)
         return True
 
     except Exception as e:
@@ -842,21 +895,98 @@ def comment_out_unused_function(
         return False
 
 
-def _shorten_path(path, root_path=None, keep_parts=3):
-    if not path:
-        return "?"
+def apply_unused_edits(file_path, edits, marker="SKYLOS DEADCODE", *, root_path=None):
+    """Apply ``(kind, name, line)`` edits to one file with a single parse.
 
+    Returns whether each edit changed anything.
+    """
     try:
-        p = Path(path).resolve()
-        cwd = Path.cwd().resolve()
+        path = resolve_remediation_path(file_path, root_path=root_path)
+        src = _read_source(path)
+        new_code, applied = apply_cst_edits(src, edits, marker=marker)
+        if any(applied):
+            _write_source(path, new_code)
+        return applied
 
-        rel = p.relative_to(cwd)
-        return str(rel)
+    except Exception as e:
+        logging.error(f"Failed to clean up {file_path}: {e}")
+        return [False] * len(edits)
 
-    except ValueError:
-        return str(p)
-    except Exception:
-        return str(path)
+
+def _apply_file_cleanup(file_edits, comment_out=False, root_path=None):
+    if len(file_edits) == 1:
+        kind, action, item = file_edits[0]
+        ok = action(item["file"], item["name"], item["line"], root_path=root_path)
+        return [(kind, item, ok)]
+
+    mode = "comment" if comment_out else "remove"
+    applied = apply_unused_edits(
+        file_edits[0][2]["file"],
+        [
+            (f"{mode}_{kind}", item["name"], item["line"])
+            for kind, _action, item in file_edits
+        ],
+        root_path=root_path,
+    )
+    return [(kind, item, ok) for (kind, _action, item), ok in zip(file_edits, applied)]
+
+
+def _read_file_bytes(path):
+    try:
+        return Path(path).read_bytes()  # skylos: ignore[SKY-D215] cleanup target
+    except OSError:
+        return None
+
+
+def _apply_cleanup_edits(edits_by_file, *, comment_out=False, root_path=None, jobs=1):
+    """Yield ``(kind, item, ok)`` for each edit, file by file.
+
+    ``edits_by_file`` maps a path to ``(kind, action, item)`` tuples, where
+    ``kind`` is "function" or "import" and ``action`` the matching
+    single-edit helper above. A file with several edits is rewritten in one
+    pass instead. With ``jobs`` above 1, separate files run in that many
+    worker processes.
+    """
+    groups = list(edits_by_file.values())
+    jobs = min(jobs, len(groups))
+
+    if jobs <= 1:
+        for file_edits in groups:
+            yield from _apply_file_cleanup(file_edits, comment_out, root_path)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # A worker can fail after it has already rewritten its file; only redo
+    # the edits in this process when the file is still untouched.
+    originals = [_read_file_bytes(file_edits[0][2]["file"]) for file_edits in groups]
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        futures = [
+            ex.submit(_apply_file_cleanup, file_edits, comment_out, root_path)
+            for file_edits in groups
+        ]
+        for file_edits, original, fut in zip(groups, originals, futures):
+            try:
+                results = fut.result()
+            except Exception:
+                path = file_edits[0][2]["file"]
+                if _read_file_bytes(path) != original:
+                    logging.warning(
+                        "Cleanup worker failed after changing %s; not retrying",
+                        path,
+                        exc_info=True,
+                    )
+                    results = [
+                        (kind, item, False) for kind, _action, item in file_edits
+                    ]
+                else:
+                    logging.warning(
+                        "Cleanup worker failed for %s; retrying in parent process",
+                        path,
+                        exc_info=True,
+                    )
+                    results = _apply_file_cleanup(file_edits, comment_out, root_path)
+            yield from results
 
 
 def find_project_root(path):
@@ -888,11 +1018,22 @@ def _rel_to_project_root(file_path: str, project_root: Path) -> str:
     if not file_path:
         return "?"
     try:
-        p = Path(file_path).resolve()
-        root = Path(project_root).resolve()
+        cwd = os.getcwd()
+    except OSError:
+        return str(file_path).replace("\\", "/")
+    return _rel_to_root(str(file_path), str(project_root), cwd)
+
+
+# Agent findings are normalized one by one but mostly share a few files;
+# resolve() stats each path component, so remember results per working dir.
+@lru_cache(maxsize=4096)
+def _rel_to_root(file_path: str, project_root: str, cwd: str) -> str:
+    try:
+        p = Path(cwd, file_path).resolve()
+        root = Path(cwd, project_root).resolve()
         return str(p.relative_to(root)).replace("\\", "/")
     except Exception:
-        return str(file_path).replace("\\", "/")
+        return file_path.replace("\\", "/")
 
 
 def _normalize_agent_findings(payload, project_root: Path):
@@ -999,35 +1140,165 @@ def _has_high_intent_findings(result: dict) -> bool:
     return False
 
 
+_SKYLOS_KEY = r"(?:skylos|\"skylos\"|'skylos')"
+_TOOL_SKYLOS_HEADER_RE = re.compile(
+    rf"[ \t]*\[[ \t]*tool[ \t]*\.[ \t]*{_SKYLOS_KEY}[ \t]*\][ \t]*(?:#.*)?$"
+)
+_TOOL_HEADER_RE = re.compile(r"[ \t]*\[[ \t]*tool[ \t]*\][ \t]*(?:#.*)?$")
+_TOML_TABLE_HEADER_RE = re.compile(r"[ \t]*\[")
+_TOOL_SKYLOS_DOTTED_RE = re.compile(rf"[ \t]*tool[ \t]*\.[ \t]*{_SKYLOS_KEY}[ \t]*\.")
+_SKYLOS_DOTTED_RE = re.compile(rf"[ \t]*{_SKYLOS_KEY}[ \t]*\.")
+
+
+def _no_upload_prompt_re(prefix: str) -> re.Pattern:
+    return re.compile(
+        rf"([ \t]*{prefix}[\"']?no_upload_prompt[\"']?[ \t]*=[ \t]*)"
+        r"(?:true|false)([ \t]*(?:#.*)?)$"
+    )
+
+
+_NO_UPLOAD_PROMPT_RES = {
+    "root": _no_upload_prompt_re(rf"tool[ \t]*\.[ \t]*{_SKYLOS_KEY}[ \t]*\.[ \t]*"),
+    "tool": _no_upload_prompt_re(rf"{_SKYLOS_KEY}[ \t]*\.[ \t]*"),
+    "skylos": _no_upload_prompt_re(""),
+}
+
+
+def _load_toml_text(content: str) -> dict | None:
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            return None
+
+    try:
+        return tomllib.loads(content)
+    except tomllib.TOMLDecodeError:
+        return None
+
+
+def _scan_toml_line(line: str, depth: int, ml_quote: str | None):
+    i = 0
+    n = len(line)
+    while i < n:
+        ch = line[i]
+        if ml_quote is not None:
+            if ml_quote == '"""' and ch == "\\":
+                i += 2
+            elif line.startswith(ml_quote, i):
+                i += 3
+                # A closing delimiter may carry up to two extra quotes.
+                while i < n and line[i] == ml_quote[0]:
+                    i += 1
+                ml_quote = None
+            else:
+                i += 1
+            continue
+        if ch == "#":
+            break
+        if line.startswith('"""', i) or line.startswith("'''", i):
+            ml_quote = line[i : i + 3]
+            i += 3
+            continue
+        if ch == '"':
+            i += 1
+            while i < n and line[i] != '"':
+                i += 2 if line[i] == "\\" else 1
+        elif ch == "'":
+            end = line.find("'", i + 1)
+            i = n if end < 0 else end
+        elif ch in "[{":
+            depth += 1
+        elif ch in "]}":
+            depth = max(0, depth - 1)
+        i += 1
+    return depth, ml_quote
+
+
+def _toml_statement_lines(content: str):
+    """Yield ``(offset, line)`` for each line that starts a TOML statement.
+
+    Lines inside multi-line strings, arrays and inline tables are skipped,
+    so a ``[`` at the start of one is never taken for a table header.
+    """
+    offset = 0
+    depth = 0
+    ml_quote = None
+    for raw in content.splitlines(keepends=True):
+        if depth == 0 and ml_quote is None:
+            yield offset, raw.rstrip("\r\n")
+            if not _TOML_TABLE_HEADER_RE.match(raw):
+                depth, ml_quote = _scan_toml_line(raw, depth, ml_quote)
+        else:
+            depth, ml_quote = _scan_toml_line(raw, depth, ml_quote)
+        offset += len(raw)
+
+
 def _set_no_upload_prompt(project_root: Path, value: bool) -> bool:
     pyproject = project_root / "pyproject.toml"
     if not pyproject.exists():
         return False
 
     content = pyproject.read_text(encoding="utf-8", errors="ignore")
+    data = _load_toml_text(content)
+    if data is None:
+        return False
 
-    key_line = f"no_upload_prompt = {'true' if value else 'false'}"
-
-    if "[tool.skylos]" not in content:
+    literal = "true" if value else "false"
+    key_line = f"no_upload_prompt = {literal}"
+    tool = data.get("tool")
+    tool_skylos = tool.get("skylos") if isinstance(tool, dict) else None
+    if not isinstance(tool_skylos, dict):
         content = content.rstrip() + "\n\n[tool.skylos]\n" + key_line + "\n"
         pyproject.write_text(content, encoding="utf-8")
         return True
 
-    if re.search(r"(?m)^\s*no_upload_prompt\s*=\s*(true|false)\s*$", content):
-        content = re.sub(
-            r"(?m)^\s*no_upload_prompt\s*=\s*(true|false)\s*$",
-            key_line,
-            content,
-        )
-        pyproject.write_text(content, encoding="utf-8")
-        return True
+    # tool.skylos may be a [tool.skylos] table (only its own lines are
+    # rewritten), dotted skylos.* keys under [tool], or tool.skylos.* keys
+    # before the first table; edit whichever spelling the file uses.
+    table = "root"
+    inserts = {}
+    for offset, line in _toml_statement_lines(content):
+        if _TOML_TABLE_HEADER_RE.match(line):
+            if _TOOL_SKYLOS_HEADER_RE.match(line):
+                table = "skylos"
+                inserts.setdefault("skylos", (offset + len(line), "\n" + key_line))
+            elif _TOOL_HEADER_RE.match(line):
+                table = "tool"
+                tool_header_end = offset + len(line)
+            else:
+                table = "other"
+            continue
 
-    content = re.sub(
-        r"(?m)^\[tool\.skylos\]\s*$",
-        "[tool.skylos]\n" + key_line,
-        content,
-        count=1,
-    )
+        pattern = _NO_UPLOAD_PROMPT_RES.get(table)
+        match = pattern.match(line) if pattern else None
+        if match:
+            start = offset + match.end(1)
+            end = offset + match.start(2)
+            content = content[:start] + literal + content[end:]
+            pyproject.write_text(content, encoding="utf-8")
+            return True
+
+        if table == "tool" and _SKYLOS_DOTTED_RE.match(line):
+            inserts.setdefault("tool", (tool_header_end, "\nskylos." + key_line))
+        elif table == "root" and _TOOL_SKYLOS_DOTTED_RE.match(line):
+            inserts.setdefault("root", (offset, f"tool.skylos.{key_line}\n"))
+
+    if "no_upload_prompt" in tool_skylos:
+        # Set somewhere this edit does not understand (an inline table, say);
+        # adding a second key would make the file invalid.
+        return False
+
+    for spelling in ("skylos", "tool", "root"):
+        if spelling in inserts:
+            at, text = inserts[spelling]
+            content = content[:at] + text + content[at:]
+            break
+    else:
+        # Only [tool.skylos.*] sub-tables so far; the parent can follow them.
+        content = content.rstrip() + "\n\n[tool.skylos]\n" + key_line + "\n"
     pyproject.write_text(content, encoding="utf-8")
     return True
 
@@ -1752,6 +2023,19 @@ def _run_removed_run_command(_argv):
     raise SystemExit(2)
 
 
+def _run_informational_flag(argv):
+    """Answer --version and --list-default-excludes without the scan parser."""
+    if argv == ["--version"]:
+        print(f"skylos {skylos.__version__}")
+        return True
+    if "--list-default-excludes" in argv and not any(
+        arg.startswith("-") for arg in argv if arg != "--list-default-excludes"
+    ):
+        _print_default_excludes(setup_logger().console)
+        return True
+    return False
+
+
 def _run_scan_command(argv):
     from skylos.commands.scan_cmd import run_scan_command
 
@@ -1798,11 +2082,19 @@ def _resolve_main_project_root(paths):
     return project_root
 
 
+def _format_exclude_folders(folders):
+    if folders == DEFAULT_EXCLUDE_FOLDERS:
+        return ", ".join(SORTED_DEFAULT_EXCLUDE_FOLDERS)
+    return ", ".join(sorted(folders))
+
+
 def _print_default_excludes(console):
     console.print("[brand]Default excluded folders:[/brand]")
-    for folder in sorted(DEFAULT_EXCLUDE_FOLDERS):
+    for folder in SORTED_DEFAULT_EXCLUDE_FOLDERS:
         console.print(f" {folder}")
-    console.print(f"\n[muted]Total: {len(DEFAULT_EXCLUDE_FOLDERS)} folders[/muted]")
+    console.print(
+        f"\n[muted]Total: {len(SORTED_DEFAULT_EXCLUDE_FOLDERS)} folders[/muted]"
+    )
     console.print("\nUse --no-default-excludes to disable these exclusions")
     console.print("Use --include-folder <folder> to force include specific folders")
 
@@ -2016,9 +2308,8 @@ def _print_main_scan_banner(args, console, final_exclude_folders):
             f"[brand]skylos[/brand] [muted]v{skylos.__version__} · scanning...[/muted]"
         )
         if final_exclude_folders and getattr(args, "verbose", False):
-            console.print(
-                f"[muted]excluding: {', '.join(sorted(final_exclude_folders))}[/muted]"
-            )
+            excluded = _format_exclude_folders(final_exclude_folders)
+            console.print(f"[muted]excluding: {excluded}[/muted]")
         return False
 
     banner = (
@@ -2036,9 +2327,8 @@ def _print_main_scan_banner(args, console, final_exclude_folders):
     console.print()
 
     if final_exclude_folders:
-        console.print(
-            f"[warn] Excluding:[/warn] {', '.join(sorted(final_exclude_folders))}"
-        )
+        excluded = _format_exclude_folders(final_exclude_folders)
+        console.print(f"[warn] Excluding:[/warn] {excluded}")
     else:
         console.print("[good] No folders excluded[/good]")
 
@@ -2055,6 +2345,12 @@ def _trace_cache_requested(args) -> bool:
     return bool(getattr(args, "cache", False) or getattr(args, "refresh_cache", False))
 
 
+def _analysis_cache_requested(args) -> bool:
+    if getattr(args, "no_cache", False):
+        return False
+    return bool(getattr(args, "cache", False) or getattr(args, "refresh_cache", False))
+
+
 def _trusted_module_file(module_name: str) -> Path:
     module = importlib.import_module(module_name)
     module_file = getattr(module, "__file__", None)
@@ -2209,6 +2505,14 @@ def _run_pre_analysis_steps(args, project_root, console):
                 console.print("[good]Coverage data collected[/good]")
 
     if args.trace:
+        from skylos.core.result_cache import (
+            build_trace_cache_key,
+            load_trace_cache,
+            read_trace_payload,
+            save_trace_cache,
+            write_trace_payload,
+        )
+
         if not quiet_output:
             console.print("[brand]Running tests with call tracing...[/brand]")
 
@@ -3832,6 +4136,8 @@ def main() -> None:
                     os.environ["SKYLOS_LLM_BASE_URL"] = base_url
                 if api_key is None or api_key == "":
                     if not is_local:
+                        from skylos.cloud.credentials import PROVIDERS
+
                         env_var = (
                             PROVIDERS.get(provider) or f"{provider.upper()}_API_KEY"
                         )
@@ -4092,6 +4398,8 @@ def main() -> None:
 
         if api_key is None or api_key == "":
             if not _is_local:
+                from skylos.cloud.credentials import PROVIDERS
+
                 env_var = PROVIDERS.get(provider) or f"{provider.upper()}_API_KEY"
                 console.print(
                     f"[bad]No {env_var} configured. Run `skylos key` or set the environment variable.[/bad]"
@@ -4462,6 +4770,9 @@ def main() -> None:
         _run_removed_run_command(sys.argv[2:])
         return
 
+    if _run_informational_flag(sys.argv[1:]):
+        return
+
     _run_scan_command(sys.argv[1:])
 
 
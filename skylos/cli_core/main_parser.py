@@ -53,17 +53,17 @@ Run 'skylos tour' for a guided walkthrough of capabilities.
     parser.add_argument(
         "--cache",
         action="store_true",
-        help="Cache successful --trace pytest call-tracing runs.",
+        help="Cache analysis results and successful --trace runs under .skylos/cache.",
     )
     parser.add_argument(
         "--refresh-cache",
         action="store_true",
-        help="Rerun --trace and overwrite its cache entry.",
+        help="Rerun the analysis (and --trace) and overwrite their cache entries.",
     )
     parser.add_argument(
         "--no-cache",
         action="store_true",
-        help="Disable trace cache even when --cache is set.",
+        help="Disable the run cache even when --cache is set.",
     )
     parser.add_argument(
         "--coverage",
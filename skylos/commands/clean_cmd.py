@@ -9,6 +9,7 @@ from rich.rule import Rule
 from skylos.config import load_config
 from skylos.constants import parse_exclude_folders
 from skylos.remediation.codemods import (
+    apply_cst_edits,
     comment_out_unused_function_cst,
     comment_out_unused_import_cst,
     remove_unused_function_cst,
@@ -217,11 +218,32 @@ def _transform_for(finding_type, action):
     return None
 
 
+def _apply_batched_edits(file_edits, scan_root, console):
+    file_path = file_edits[0][0]["file"]
+    edits = [
+        (f"{action}_{finding['type']}", finding["name"], finding["line"])
+        for finding, action in file_edits
+    ]
+    try:
+        path = resolve_remediation_path(file_path, root_path=scan_root)
+        src = path.read_text(encoding="utf-8")
+        new_code, changed = apply_cst_edits(src, edits)
+        if any(changed):
+            path.write_text(new_code, encoding="utf-8")
+    except Exception as e:
+        console.print(f"  [red]Failed to clean up {file_path}: {e}[/red]")
+        return 0
+    return sum(changed)
+
+
 def _apply_edits(edits_by_file, scan_root, console):
     applied = 0
 
     for file_edits in edits_by_file.values():
-        file_edits.sort(key=lambda x: -x[0]["line"])
+        # Several edits to one file share a single parse and write.
+        if len(file_edits) > 1:
+            applied += _apply_batched_edits(file_edits, scan_root, console)
+            continue
         for finding, action in file_edits:
             try:
                 transform = _transform_for(finding["type"], action)
@@ -1,4 +1,5 @@
 import argparse
+import importlib.util
 import json
 import platform
 from pathlib import Path
@@ -29,11 +30,10 @@ def _llm_available() -> bool:
 
 
 def _interactive_available() -> bool:
+    # Locating inquirer is enough; importing it loads blessed and readchar.
     try:
-        import inquirer  # noqa: F401
-
-        return True
-    except ImportError:
+        return importlib.util.find_spec("inquirer") is not None
+    except (ImportError, ValueError):
         return False
 
 
@@ -19,6 +19,8 @@ def run_scan_command(argv: Sequence[str], *, cli_module: ModuleType) -> None:
     Rule = cli_module.Rule
     SpinnerColumn = cli_module.SpinnerColumn
     TextColumn = cli_module.TextColumn
+    _analysis_cache_requested = cli_module._analysis_cache_requested
+    _apply_cleanup_edits = cli_module._apply_cleanup_edits
     _apply_display_filters = cli_module._apply_display_filters
     _attach_upload_project_context = cli_module._attach_upload_project_context
     _build_main_parser = cli_module._build_main_parser
@@ -122,7 +124,48 @@ def run_scan_command(argv: Sequence[str], *, cli_module: ModuleType) -> None:
             machine_output or getattr(args, "format", "rich") == "pretty"
         )
 
-        if quiet_analysis_output:
+        result_json = None
+        analysis_cache_key = None
+        analysis_cache_fingerprint = None
+        analysis_cache_hit = False
+        if _analysis_cache_requested(args):
+            from skylos.core.result_cache import (
+                build_analysis_cache_key,
+                load_analysis_cache,
+            )
+
+            analysis_cache_key, analysis_cache_fingerprint = build_analysis_cache_key(
+                project_root,
+                args.path,
+                options={
+                    "conf": args.confidence,
+                    "secrets": bool(args.secrets),
+                    "danger": bool(args.danger),
+                    "quality": bool(args.quality),
+                    "ai_defects": bool(getattr(args, "ai_defects", False)),
+                    "sca": bool(args.sca),
+                    "grep_verify": not getattr(args, "no_grep_verify", False),
+                    "exclude_folders": sorted(final_exclude_folders),
+                    "custom_rules": custom_rules_data,
+                    "changed_files": (
+                        None if changed_files is None else sorted(changed_files)
+                    ),
+                },
+                exclude_folders=final_exclude_folders,
+                input_files=[config_file, trace_file, project_root / ".coverage"],
+                return_fingerprint=True,
+            )
+            if not getattr(args, "refresh_cache", False):
+                result_json = load_analysis_cache(project_root, analysis_cache_key)
+                analysis_cache_hit = result_json is not None
+                if analysis_cache_hit and not quiet_analysis_output:
+                    console.print(
+                        "[brand]Analysis cache hit:[/brand] reusing cached results."
+                    )
+
+        if analysis_cache_hit:
+            pass
+        elif quiet_analysis_output:
             analyzer_logger = logging.getLogger("Skylos")
             analyzer_logger_level = analyzer_logger.level
             analyzer_logger.setLevel(logging.WARNING)
@@ -146,7 +189,20 @@ def run_scan_command(argv: Sequence[str], *, cli_module: ModuleType) -> None:
 
                 result_json = run_main_analysis(update_progress)
 
+        if analysis_cache_key is not None and not analysis_cache_hit:
+            from skylos.core.result_cache import save_analysis_cache
+
+            save_analysis_cache(
+                project_root,
+                analysis_cache_key,
+                result_json,
+                fingerprint_summary=analysis_cache_fingerprint,
+            )
+
         result = json.loads(result_json)
+        # Only the --json output needs the result as text again; steps that
+        # edit the findings mark it stale and it is serialized once there.
+        result_json_stale = False
 
         if getattr(args, "sca", False) and "dependency_vulnerabilities" not in result:
             try:
@@ -182,7 +238,7 @@ def run_scan_command(argv: Sequence[str], *, cli_module: ModuleType) -> None:
                 )
             else:
                 result = filter_new_findings(result, baseline)
-                result_json = json.dumps(result)
+                result_json_stale = True
 
         if changed_files is not None:
             for category in [
@@ -206,7 +262,7 @@ def run_scan_command(argv: Sequence[str], *, cli_module: ModuleType) -> None:
                         if str((project_root / item.get("file", "")).resolve())
                         in changed_files
                     ]
-            result_json = json.dumps(result)
+            result_json_stale = True
 
         if getattr(args, "diff", None):
             from skylos.cicd.review import (
@@ -240,7 +296,7 @@ def run_scan_command(argv: Sequence[str], *, cli_module: ModuleType) -> None:
                         result[category] = filter_findings_to_diff(
                             items, changed_ranges
                         )
-                result_json = json.dumps(result)
+                result_json_stale = True
                 if not machine_output:
                     console.print(
                         f"[brand]--diff:[/brand] filtered to {len(changed_ranges)} changed line ranges "
@@ -362,7 +418,7 @@ def run_scan_command(argv: Sequence[str], *, cli_module: ModuleType) -> None:
                 result["provenance_summary"] = prov_report.summary
                 result["provenance"] = prov_report.to_dict()
 
-                result_json = json.dumps(result)
+                result_json_stale = True
 
                 if not machine_output:
                     ai_count = ai_stats["ai_authored_findings"]
@@ -470,6 +526,8 @@ def run_scan_command(argv: Sequence[str], *, cli_module: ModuleType) -> None:
                 _json.dump(sarif_data, _sf, indent=2)
 
         if args.json:
+            if result_json_stale:
+                result_json = json.dumps(result)
             if args.output:
                 pathlib.Path(args.output).write_text(  # skylos: ignore[SKY-D215] user-selected CLI output path
                     result_json
@@ -661,36 +719,29 @@ def run_scan_command(argv: Sequence[str], *, cli_module: ModuleType) -> None:
 
                     if proceed:
                         console.print("[warn]Applying changes…[/warn]")
+                        edits_by_file = {}
                         for func in selected_functions:
-                            ok = action_func_fn(
-                                func["file"],
-                                func["name"],
-                                func["line"],
-                                root_path=project_root,
+                            edits_by_file.setdefault(func["file"], []).append(
+                                ("function", action_func_fn, func)
                             )
-                            if ok:
-                                console.print(
-                                    f"[good] ✓ {action_past} function:[/good] {func['name']}"
-                                )
-                            else:
-                                console.print(
-                                    f"[bad] x Failed to {action_verb} function:[/bad] {func['name']}"
-                                )
-
                         for imp in selected_imports:
-                            ok = action_func_imp(
-                                imp["file"],
-                                imp["name"],
-                                imp["line"],
-                                root_path=project_root,
+                            edits_by_file.setdefault(imp["file"], []).append(
+                                ("import", action_func_imp, imp)
                             )
+
+                        for kind, item, ok in _apply_cleanup_edits(
+                            edits_by_file,
+                            comment_out=bool(args.comment_out),
+                            root_path=project_root,
+                            jobs=int(os.getenv("SKYLOS_JOBS", "1")),
+                        ):
                             if ok:
                                 console.print(
-                                    f"[good] ✓ {action_past} import:[/good] {imp['name']}"
+                                    f"[good] ✓ {action_past} {kind}:[/good] {item['name']}"
                                 )
                             else:
                                 console.print(
-                                    f"[bad] x Failed to {action_verb} import:[/bad] {imp['name']}"
+                                    f"[bad] x Failed to {action_verb} {kind}:[/bad] {item['name']}"
                                 )
                         console.print("[good]Cleanup complete![/good]")
                     else:
@@ -102,29 +102,32 @@ NON_LIBRARY_DIR_KINDS = {
     "doc_src": "example",
 }
 
-DEFAULT_EXCLUDE_FOLDERS = {
-    "__pycache__",
-    ".git",
-    ".pytest_cache",
-    ".mypy_cache",
-    ".tox",
-    "htmlcov",
-    ".coverage",
-    "build",
-    "dist",
-    "*.egg-info",
-    "venv",
-    ".venv",
-    "node_modules",
-    ".hg",
-    ".svn",
-    "vendor",
-    ".next",
-    ".nuxt",
-    ".turbo",
-    ".idea",
-    ".vscode",
-}
+DEFAULT_EXCLUDE_FOLDERS = frozenset(
+    {
+        "__pycache__",
+        ".git",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".tox",
+        "htmlcov",
+        ".coverage",
+        "build",
+        "dist",
+        "*.egg-info",
+        "venv",
+        ".venv",
+        "node_modules",
+        ".hg",
+        ".svn",
+        "vendor",
+        ".next",
+        ".nuxt",
+        ".turbo",
+        ".idea",
+        ".vscode",
+    }
+)
+SORTED_DEFAULT_EXCLUDE_FOLDERS = tuple(sorted(DEFAULT_EXCLUDE_FOLDERS))
 
 
 def is_test_path(p) -> bool:
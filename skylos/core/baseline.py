@@ -1,15 +1,62 @@
 from __future__ import annotations
+import hashlib
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 BASELINE_DIR = ".skylos"
 BASELINE_FILE = "baseline.json"
+FINGERPRINT_FORMAT = "blake2b-128"
+
+_FINDING_CATEGORIES = ("danger", "ai_defects", "quality", "secrets")
+_DEAD_CATEGORIES = (
+    "unused_functions",
+    "unused_imports",
+    "unused_classes",
+    "unused_variables",
+)
 
 
 def _baseline_path(project_root: str | Path) -> Path:
     return Path(project_root) / BASELINE_DIR / BASELINE_FILE
 
 
+def _fingerprint_digest(fp: str) -> str:
+    return hashlib.blake2b(fp.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _finding_fingerprint(finding: dict) -> str:
+    get = finding.get
+    return _fingerprint_digest(
+        f"{get('rule_id', '')}:{get('file', '')}:{get('line', 0)}"
+    )
+
+
+def _dead_fingerprint(prefix: str, item) -> str:
+    name = item.get("name", "") if isinstance(item, dict) else str(item)
+    return _fingerprint_digest(prefix + name)
+
+
+def _known_fingerprints(baseline: dict) -> set[str]:
+    fingerprints = baseline.get("fingerprints", [])
+    if baseline.get("fingerprint_format") == FINGERPRINT_FORMAT:
+        return set(fingerprints)
+
+    known = set()
+    for fp in fingerprints:
+        # Baselines written before fingerprints were hashed hold the raw
+        # "rule:file:line" / "dead:category:name" strings; digests never
+        # contain a colon.
+        if ":" in fp:
+            fp = _fingerprint_digest(fp)
+        known.add(fp)
+    return known
+
+
 def save_baseline(project_root: str | Path, result: dict) -> Path:
     path = _baseline_path(project_root)
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -26,27 +73,27 @@ def save_baseline(project_root: str | Path, result: dict) -> Path:
     }
 
     fingerprints = set()
-    for category in ["danger", "ai_defects", "quality", "secrets"]:
-        for finding in result.get(category, []):
-            fp = f"{finding.get('rule_id', '')}:{finding.get('file', '')}:{finding.get('line', 0)}"
-            fingerprints.add(fp)
-
-    for category in [
-        "unused_functions",
-        "unused_imports",
-        "unused_classes",
-        "unused_variables",
-    ]:
+    for category in _FINDING_CATEGORIES:
+        fingerprints.update(map(_finding_fingerprint, result.get(category, [])))
+
+    for category in _DEAD_CATEGORIES:
+        prefix = f"dead:{category}:"
         for item in result.get(category, []):
-            name = item.get("name", "") if isinstance(item, dict) else str(item)
-            fingerprints.add(f"dead:{category}:{name}")
+            fingerprints.add(_dead_fingerprint(prefix, item))
 
     baseline = {
         "counts": counts,
+        "fingerprint_format": FINGERPRINT_FORMAT,
         "fingerprints": sorted(fingerprints),
     }
 
-    path.write_text(json.dumps(baseline, indent=2) + "\n")
+    if orjson is not None:
+        data = orjson.dumps(
+            baseline, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+    else:
+        data = (json.dumps(baseline, indent=2) + "\n").encode("utf-8")
+    path.write_bytes(data)
     return path
 
 
@@ -54,36 +101,30 @@ def load_baseline(project_root: str | Path) -> dict | None:
     path = _baseline_path(project_root)
     if not path.exists():
         return None
-    return json.loads(path.read_text())
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def filter_new_findings(result: dict, baseline: dict) -> dict:
-    known = set(baseline.get("fingerprints", []))
+    known = _known_fingerprints(baseline)
 
     filtered = dict(result)
 
-    for category in ["danger", "ai_defects", "quality", "secrets"]:
-        original = result.get(category, [])
-        new_findings = []
-        for finding in original:
-            fp = f"{finding.get('rule_id', '')}:{finding.get('file', '')}:{finding.get('line', 0)}"
-            if fp not in known:
-                new_findings.append(finding)
-        filtered[category] = new_findings
-
-    for category in [
-        "unused_functions",
-        "unused_imports",
-        "unused_classes",
-        "unused_variables",
-    ]:
-        original = result.get(category, [])
-        new_items = []
-        for item in original:
-            name = item.get("name", "") if isinstance(item, dict) else str(item)
-            fp = f"dead:{category}:{name}"
-            if fp not in known:
-                new_items.append(item)
-        filtered[category] = new_items
+    for category in _FINDING_CATEGORIES:
+        filtered[category] = [
+            finding
+            for finding in result.get(category, [])
+            if _finding_fingerprint(finding) not in known
+        ]
+
+    for category in _DEAD_CATEGORIES:
+        prefix = f"dead:{category}:"
+        filtered[category] = [
+            item
+            for item in result.get(category, [])
+            if _dead_fingerprint(prefix, item) not in known
+        ]
 
     return filtered
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import subprocess
 from fnmatch import fnmatchcase
+from functools import lru_cache
 from collections.abc import Iterable, Sequence
 from pathlib import Path
 
@@ -57,7 +58,11 @@ def _root_prefixed_exclude_candidate(exclude_normalized: str, root_path: Path) -
     return None
 
 
-def _exclude_candidates(exclude_folder: str, root_path: Path) -> list[str]:
+# should_exclude_path runs for every discovered file and directory against
+# the same handful of patterns; the candidates only depend on the pattern and
+# the root, and building them can resolve() both.
+@lru_cache(maxsize=4096)
+def _exclude_candidates(exclude_folder: str, root_path: Path) -> tuple[str, ...]:
     exclude_normalized = _normalize_path_text(exclude_folder)
     candidates = [exclude_normalized]
 
@@ -71,7 +76,7 @@ def _exclude_candidates(exclude_folder: str, root_path: Path) -> list[str]:
         if prefixed_candidate:
             candidates.append(prefixed_candidate)
 
-    return _dedupe_candidates(candidates)
+    return tuple(_dedupe_candidates(candidates))
 
 
 def _glob_patterns(exclude_normalized: str) -> set[str]:
@@ -137,8 +142,12 @@ def should_exclude_path(
     path_parts = rel_path.parts
     rel_path_str = str(rel_path).replace("\\", "/")
 
+    # A relative root resolves against the working directory, so anchor it
+    # there before it becomes part of the _exclude_candidates cache key.
+    candidate_root = root_path if root_path.is_absolute() else Path.cwd() / root_path
+
     for exclude_folder in exclude_folders:
-        for exclude_normalized in _exclude_candidates(exclude_folder, root_path):
+        for exclude_normalized in _exclude_candidates(exclude_folder, candidate_root):
             if _path_matches_exclude(rel_path_str, path_parts, exclude_normalized):
                 return True
 
@@ -12,17 +12,20 @@ import tempfile
 import time
 from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import skylos
 from skylos.core.safe_cache_io import load_project_json_cache, save_project_json_cache
 
 SCHEMA_VERSION = 1
 CACHE_KIND_TRACE = "trace"
+CACHE_KIND_ANALYSIS = "analysis"
 RUN_CACHE_DIR = Path(".skylos") / "cache" / "runs"
 TRACE_CACHE_DIR = RUN_CACHE_DIR / "v1" / "trace"
+ANALYSIS_CACHE_DIR = RUN_CACHE_DIR / "v1" / "analysis"
 MAX_CACHE_STAT_ENTRIES = 100_000
 MAX_TRACE_PAYLOAD_BYTES = 10_000_000
+MAX_ANALYSIS_PAYLOAD_BYTES = 50_000_000
 
 TRACE_ENV_VARS = (
     "PYTHONPATH",
@@ -35,6 +38,12 @@ TRACE_ENV_VARS = (
     "GITHUB_ACTIONS",
 )
 
+ANALYSIS_ENV_VARS = (
+    "SKYLOS_CUSTOM_RULES",
+    "SKYLOS_GREP_BUDGET",
+    "SKYLOS_PRIVATE_DEPS_ALLOW",
+)
+
 TRACE_EXCLUDE_PATTERNS = (
     "site-packages",
     "venv",
@@ -211,6 +220,102 @@ def save_trace_cache(
     return path
 
 
+def build_analysis_cache_key(
+    project_root: str | Path,
+    scan_paths: str | Path | list[str | Path] | tuple[str | Path, ...],
+    *,
+    options: dict[str, Any],
+    exclude_folders: list[str] | tuple[str, ...] | set[str] | None = None,
+    input_files: list[str | Path | None] | tuple[str | Path | None, ...] = (),
+    env: dict[str, str] | None = None,
+    return_fingerprint: bool = False,
+) -> str | tuple[str, dict[str, Any]]:
+    """Build a correctness-first cache key for a full analyze() run."""
+    root = _normalize_root(project_root)
+    env_map = env if env is not None else os.environ
+
+    # Directories the scan itself skips are not inputs to it; everything
+    # else relevant under the root is hashed, gitignored files aside.
+    excluded_dirs = {".git"}
+    for folder in exclude_folders or ():
+        name = str(folder).replace("\\", "/").rstrip("/")
+        if name and "/" not in name and "*" not in name:
+            excluded_dirs.add(name)
+
+    files = _fingerprinted_files(
+        root, excluded_dirs=excluded_dirs, is_relevant=_is_analysis_input_rel
+    )
+    fingerprint = {
+        "schema_version": SCHEMA_VERSION,
+        "cache_kind": CACHE_KIND_ANALYSIS,
+        "skylos_version": skylos.__version__,
+        "python": _python_fingerprint(),
+        "analysis_options": options,
+        "scan_paths": _normalize_scan_paths(root, scan_paths),
+        "cwd": str(Path.cwd()),
+        "env": _hash_selected_env(env_map, ANALYSIS_ENV_VARS),
+        "distributions": _installed_distributions_digest(),
+        "inputs": _input_file_digests(input_files),
+        "files": files,
+    }
+    key = _sha256_json(fingerprint)
+    if return_fingerprint:
+        return key, _fingerprint_summary(fingerprint, key)
+    return key
+
+
+def load_analysis_cache(project_root: str | Path, key: str) -> str | None:
+    root = _normalize_root(project_root)
+    entry = load_project_json_cache(
+        root,
+        _analysis_cache_path(root, key),
+        max_bytes=MAX_ANALYSIS_PAYLOAD_BYTES,
+    )
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("schema_version") != SCHEMA_VERSION:
+        return None
+    if entry.get("cache_kind") != CACHE_KIND_ANALYSIS:
+        return None
+    if entry.get("key") != key:
+        return None
+    result_json = entry.get("result_json")
+    if not isinstance(result_json, str):
+        return None
+    return result_json
+
+
+def save_analysis_cache(
+    project_root: str | Path,
+    key: str,
+    result_json: str,
+    *,
+    fingerprint_summary: dict[str, Any] | None = None,
+) -> Path | None:
+    if not isinstance(result_json, str):
+        return None
+    # Stored as an escaped JSON string (up to about twice its size); skip
+    # entries load_analysis_cache would refuse to read back.
+    if len(result_json) * 2 > MAX_ANALYSIS_PAYLOAD_BYTES:
+        return None
+
+    root = _normalize_root(project_root)
+    path = _analysis_cache_path(root, key)
+    entry = {
+        "schema_version": SCHEMA_VERSION,
+        "cache_kind": CACHE_KIND_ANALYSIS,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "key": key,
+        "skylos_version": skylos.__version__,
+        "python": _python_fingerprint(),
+        "fingerprint": fingerprint_summary or {},
+        "result_json": result_json,
+    }
+    if not save_project_json_cache(root, path, entry):
+        return None
+    return path
+
+
 def clear_run_cache(project_root: str | Path) -> bool:
     root = _normalize_root(project_root)
     path = root / RUN_CACHE_DIR
@@ -344,6 +449,10 @@ def _trace_cache_path(project_root: str | Path, key: str) -> Path:
     return _normalize_root(project_root) / TRACE_CACHE_DIR / f"{key}.json"
 
 
+def _analysis_cache_path(project_root: str | Path, key: str) -> Path:
+    return _normalize_root(project_root) / ANALYSIS_CACHE_DIR / f"{key}.json"
+
+
 def _normalize_root(project_root: str | Path) -> Path:
     root = Path(project_root).resolve()
     if root.is_file():
@@ -385,9 +494,11 @@ def _normalize_scan_paths(
     return sorted(normalized)
 
 
-def _hash_selected_env(env: dict[str, str]) -> dict[str, str | None]:
+def _hash_selected_env(
+    env: dict[str, str], names: tuple[str, ...] = TRACE_ENV_VARS
+) -> dict[str, str | None]:
     values: dict[str, str | None] = {}
-    for name in TRACE_ENV_VARS:
+    for name in names:
         if name not in env:
             values[name] = None
             continue
@@ -396,10 +507,40 @@ def _hash_selected_env(env: dict[str, str]) -> dict[str, str | None]:
     return values
 
 
-def _fingerprinted_files(project_root: Path) -> list[dict[str, Any]]:
+def _installed_distributions_digest() -> str:
+    # Dependency rules resolve imports against what is installed, so an
+    # install or upgrade has to invalidate cached analysis results.
+    from importlib.metadata import distributions
+
+    installed = sorted(
+        (str(dist.metadata.get("Name") or ""), str(dist.version or ""))
+        for dist in distributions()
+    )
+    return _sha256_json(installed)
+
+
+def _input_file_digests(
+    paths: list[str | Path | None] | tuple[str | Path | None, ...],
+) -> dict[str, dict[str, Any] | None]:
+    digests: dict[str, dict[str, Any] | None] = {}
+    for raw in paths:
+        if not raw:
+            continue
+        path = Path(raw).resolve()
+        digests[str(path)] = _content_digest(path)
+    return digests
+
+
+def _fingerprinted_files(
+    project_root: Path,
+    excluded_dirs: set[str] = EXCLUDED_DIRS,
+    is_relevant: Callable[[Path], bool] | None = None,
+) -> list[dict[str, Any]]:
+    is_relevant = is_relevant or _is_relevant_rel
+
     files = _git_visible_files(project_root)
     if files is None:
-        files = _walk_visible_files(project_root)
+        files = _walk_visible_files(project_root, excluded_dirs)
 
     fingerprinted = []
     seen = set()
@@ -413,7 +554,7 @@ def _fingerprinted_files(project_root: Path) -> list[dict[str, Any]]:
         if rel_posix in seen:
             continue
         seen.add(rel_posix)
-        if _is_excluded_rel(rel) or not _is_relevant_rel(rel):
+        if _is_excluded_rel(rel, excluded_dirs) or not is_relevant(rel):
             continue
         digest = _content_digest(abs_path)
         if digest is None:
@@ -455,7 +596,9 @@ def _git_visible_files(project_root: Path) -> list[Path] | None:
     return files
 
 
-def _walk_visible_files(project_root: Path) -> list[Path]:
+def _walk_visible_files(
+    project_root: Path, excluded_dirs: set[str] = EXCLUDED_DIRS
+) -> list[Path]:
     files = []
     for dirpath, dirnames, filenames in os.walk(project_root):
         base = Path(dirpath)
@@ -465,7 +608,7 @@ def _walk_visible_files(project_root: Path) -> list[Path]:
                 rel = (base / dirname).resolve().relative_to(project_root)
             except (OSError, ValueError):
                 continue
-            if not _is_excluded_rel(rel):
+            if not _is_excluded_rel(rel, excluded_dirs):
                 keep_dirs.append(dirname)
         dirnames[:] = keep_dirs
 
@@ -474,9 +617,9 @@ def _walk_visible_files(project_root: Path) -> list[Path]:
     return files
 
 
-def _is_excluded_rel(rel: Path) -> bool:
+def _is_excluded_rel(rel: Path, excluded_dirs: set[str] = EXCLUDED_DIRS) -> bool:
     parts = rel.parts
-    if any(part in EXCLUDED_DIRS for part in parts):
+    if any(part in excluded_dirs for part in parts):
         return True
     if len(parts) >= 2 and parts[0] == ".skylos" and parts[1] == "cache":
         return True
@@ -494,6 +637,18 @@ def _is_relevant_rel(rel: Path) -> bool:
     return any(fnmatchcase(rel.name, pattern) for pattern in RELEVANT_GLOBS)
 
 
+def _is_analysis_input_rel(rel: Path) -> bool:
+    # analyze() reads every source file _get_python_files discovers and, for
+    # secret scans, config files too; all of them have to move the key.
+    from skylos.analyzer import _ANALYZED_SOURCE_EXTS, _is_secret_config_candidate
+
+    if _is_relevant_rel(rel):
+        return True
+    if rel.suffix.lower() in _ANALYZED_SOURCE_EXTS:
+        return True
+    return _is_secret_config_candidate(rel)
+
+
 def _content_digest(path: Path) -> dict[str, Any] | None:
     try:
         stat = path.lstat()
@@ -532,14 +687,18 @@ def _fingerprint_summary(
     key: str,
 ) -> dict[str, Any]:
     files = fingerprint.get("files", [])
-    return {
+    summary = {
         "key": key,
         "file_count": len(files),
         "files_digest": _sha256_json(files),
         "scan_paths": fingerprint.get("scan_paths", []),
-        "trace_options": fingerprint.get("trace_options", {}),
         "env": fingerprint.get("env", {}),
     }
+    if fingerprint.get("cache_kind") == CACHE_KIND_ANALYSIS:
+        summary["analysis_options"] = fingerprint.get("analysis_options", {})
+    else:
+        summary["trace_options"] = fingerprint.get("trace_options", {})
+    return summary
 
 
 def _sha256_json(value: Any) -> str:
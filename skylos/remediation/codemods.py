@@ -1,13 +1,62 @@
 from __future__ import annotations
 
+import re
+from bisect import bisect_left
+
 import libcst as cst
 from libcst.helpers import get_full_name_for_node
 from libcst.metadata import PositionProvider
 
+# Interactive cleanup applies several edits to the same file in a row, each
+# one reading back what the previous one wrote. Parsed modules are kept by
+# source text so those re-reads skip the parse.
+_MODULE_CACHE_SIZE = 8
+_module_cache: dict[str, cst.Module] = {}
+
+
+def _remember_module(code: str, module: cst.Module) -> None:
+    _module_cache.pop(code, None)
+    _module_cache[code] = module
+    while len(_module_cache) > _MODULE_CACHE_SIZE:
+        del _module_cache[next(iter(_module_cache))]
+
+
+def _parse_module(code: str) -> cst.Module:
+    module = _module_cache.get(code)
+    if module is None:
+        module = cst.parse_module(code)
+    _remember_module(code, module)
+    return module
+
+
+def _apply_transformer(code: str, tx) -> tuple[str, bool]:
+    # CST nodes are immutable and a parsed (or transformed) module never
+    # repeats a node, so the wrapper's defensive deep copy can be skipped.
+    wrapper = cst.MetadataWrapper(_parse_module(code), unsafe_skip_copy=True)
+    new_mod = wrapper.visit(tx)
+    new_code = new_mod.code
+    if tx.changed:
+        _remember_module(new_code, new_mod)
+    return new_code, tx.changed
+
+
+class _AtLineTransformer(cst.CSTTransformer):
+    """Transformer for an edit anchored at ``self.target_line``."""
 
-class _CommentOutBlock(cst.CSTTransformer):
     METADATA_DEPENDENCIES = (PositionProvider,)
+    target_line: int
 
+    def on_visit(self, node: cst.CSTNode) -> bool:
+        # Anything the edit touches lies inside every node enclosing the
+        # target line, so subtrees that end before or start after it are
+        # left unvisited.
+        pos = self.get_metadata(PositionProvider, node, None)
+        if pos and not (pos.start.line <= self.target_line <= pos.end.line):
+            return False
+        return super().on_visit(node)
+
+
+class _CommentOutBlock(_AtLineTransformer):
     def __init__(self, module_code: str, marker: str = "SKYLOS DEADCODE"):
         self.module_code = module_code.splitlines(True)
         self.marker = marker
@@ -46,6 +95,7 @@ class _CommentOutFunctionAtLine(_CommentOutBlock):
     def __init__(self, func_name, target_line, module_code, marker):
         super().__init__(module_code, marker)
         self.func_name = func_name
+        self.target = func_name.split(".")[-1]
         self.target_line = target_line
         self.changed = False
 
@@ -54,8 +104,7 @@ class _CommentOutFunctionAtLine(_CommentOutBlock):
         return bool(pos and pos.start.line == self.target_line)
 
     def leave_FunctionDef(self, orig: cst.FunctionDef, updated: cst.FunctionDef):
-        target = self.func_name.split(".")[-1]
-        if self._is_target(orig) and orig.name.value == target:
+        if orig.name.value == self.target and self._is_target(orig):
             self.changed = True
             pos = self.get_metadata(PositionProvider, orig)
             leading = self._comment_block(pos.start.line, pos.end.line)
@@ -65,8 +114,7 @@ class _CommentOutFunctionAtLine(_CommentOutBlock):
     def leave_AsyncFunctionDef(
         self, orig: cst.AsyncFunctionDef, updated: cst.AsyncFunctionDef
     ):
-        target = self.func_name.split(".")[-1]
-        if self._is_target(orig) and orig.name.value == target:
+        if orig.name.value == self.target and self._is_target(orig):
             self.changed = True
             pos = self.get_metadata(PositionProvider, orig)
             leading = self._comment_block(pos.start.line, pos.end.line)
@@ -203,19 +251,15 @@ class _CommentOutImportAtLine(_CommentOutBlock):
 def comment_out_unused_function_cst(
     code, func_name, line_number, marker="SKYLOS DEADCODE"
 ):
-    wrapper = cst.MetadataWrapper(cst.parse_module(code))
     tx = _CommentOutFunctionAtLine(func_name, line_number, code, marker)
-    new_mod = wrapper.visit(tx)
-    return new_mod.code, tx.changed
+    return _apply_transformer(code, tx)
 
 
 def comment_out_unused_import_cst(
     code, import_name, line_number, marker="SKYLOS DEADCODE"
 ):
-    wrapper = cst.MetadataWrapper(cst.parse_module(code))
     tx = _CommentOutImportAtLine(import_name, line_number, code, marker)
-    new_mod = wrapper.visit(tx)
-    return new_mod.code, tx.changed
+    return _apply_transformer(code, tx)
 
 
 def _bound_name_for_import_alias(alias: cst.ImportAlias):
@@ -231,9 +275,7 @@ def _is_plain_dotted_import(alias: cst.ImportAlias):
     return (alias.asname is None) and isinstance(alias.name, cst.Attribute)
 
 
-class _RemoveImportAtLine(cst.CSTTransformer):
-    METADATA_DEPENDENCIES = (PositionProvider,)
-
+class _RemoveImportAtLine(_AtLineTransformer):
     def __init__(self, target_name: str, target_line: int):
         self.target_name = target_name
         self.target_line = target_line
@@ -284,11 +326,10 @@ class _RemoveImportAtLine(cst.CSTTransformer):
         return updated.with_changes(names=tuple(kept))
 
 
-class _RemoveFunctionAtLine(cst.CSTTransformer):
-    METADATA_DEPENDENCIES = (PositionProvider,)
-
+class _RemoveFunctionAtLine(_AtLineTransformer):
     def __init__(self, func_name, target_line):
         self.func_name = func_name
+        self.target = func_name.split(".")[-1]
         self.target_line = target_line
         self.changed = False
 
@@ -297,8 +338,7 @@ class _RemoveFunctionAtLine(cst.CSTTransformer):
         return bool(pos and pos.start.line == self.target_line)
 
     def leave_FunctionDef(self, orig: cst.FunctionDef, updated: cst.FunctionDef):
-        target = self.func_name.split(".")[-1]
-        if self._is_target(orig) and (orig.name.value == target):
+        if orig.name.value == self.target and self._is_target(orig):
             self.changed = True
             return cst.RemoveFromParent()
         return updated
@@ -306,30 +346,33 @@ class _RemoveFunctionAtLine(cst.CSTTransformer):
     def leave_AsyncFunctionDef(
         self, orig: cst.AsyncFunctionDef, updated: cst.AsyncFunctionDef
     ):
-        target = self.func_name.split(".")[-1]
-        if self._is_target(orig) and (orig.name.value == target):
+        if orig.name.value == self.target and self._is_target(orig):
             self.changed = True
             return cst.RemoveFromParent()
         return updated
 
 
+def _may_bind_name(code: str, name: str) -> bool:
+    # Aliases are matched on bare identifiers only, so a name that is dotted
+    # or never appears as a whole word cannot be removed and needs no parse.
+    if not name.isidentifier():
+        return False
+    return re.search(rf"(?<!\w){re.escape(name)}(?!\w)", code) is not None
+
+
 def remove_unused_import_cst(code, import_name, line_number):
-    wrapper = cst.MetadataWrapper(cst.parse_module(code))
+    if not _may_bind_name(code, import_name):
+        return code, False
     tx = _RemoveImportAtLine(import_name, line_number)
-    new_mod = wrapper.visit(tx)
-    return new_mod.code, tx.changed
+    return _apply_transformer(code, tx)
 
 
 def remove_unused_function_cst(code, func_name, line_number):
-    wrapper = cst.MetadataWrapper(cst.parse_module(code))
     tx = _RemoveFunctionAtLine(func_name, line_number)
-    new_mod = wrapper.visit(tx)
-    return new_mod.code, tx.changed
+    return _apply_transformer(code, tx)
 
 
-class _RemoveClassAtLine(cst.CSTTransformer):
-    METADATA_DEPENDENCIES = (PositionProvider,)
-
+class _RemoveClassAtLine(_AtLineTransformer):
     def __init__(self, class_name, target_line):
         self.class_name = class_name
         self.target_line = target_line
@@ -347,9 +390,7 @@ class _RemoveClassAtLine(cst.CSTTransformer):
         return updated
 
 
-class _RemoveVariableAtLine(cst.CSTTransformer):
-    METADATA_DEPENDENCIES = (PositionProvider,)
-
+class _RemoveVariableAtLine(_AtLineTransformer):
     def __init__(self, var_name, target_line):
         self.var_name = var_name
         self.target_line = target_line
@@ -375,15 +416,78 @@ class _RemoveVariableAtLine(cst.CSTTransformer):
 
 def remove_unused_class_cst(code, class_name, line_number):
     """Remove an unused class definition at the given line."""
-    wrapper = cst.MetadataWrapper(cst.parse_module(code))
     tx = _RemoveClassAtLine(class_name, line_number)
-    new_mod = wrapper.visit(tx)
-    return new_mod.code, tx.changed
+    return _apply_transformer(code, tx)
 
 
 def remove_unused_variable_cst(code, var_name, line_number):
     """Remove an unused variable assignment at the given line."""
-    wrapper = cst.MetadataWrapper(cst.parse_module(code))
     tx = _RemoveVariableAtLine(var_name, line_number)
-    new_mod = wrapper.visit(tx)
-    return new_mod.code, tx.changed
+    return _apply_transformer(code, tx)
+
+
+class _BatchEdits(_AtLineTransformer):
+    """Run several single-edit transformers over one parse of a module.
+
+    Every transformer sees original positions, so the edits need no
+    bottom-up ordering; each node is handed to them in turn until one
+    removes or replaces it with something that is no longer a node.
+    """
+
+    def __init__(self, transformers):
+        self.transformers = transformers
+        self.target_lines = sorted({tx.target_line for tx in transformers})
+
+    @property
+    def changed(self):
+        return any(tx.changed for tx in self.transformers)
+
+    def visit_Module(self, node: cst.Module) -> bool:
+        for tx in self.transformers:
+            tx.metadata = self.metadata
+        return True
+
+    def on_visit(self, node: cst.CSTNode) -> bool:
+        pos = self.get_metadata(PositionProvider, node, None)
+        if pos:
+            i = bisect_left(self.target_lines, pos.start.line)
+            if i == len(self.target_lines) or self.target_lines[i] > pos.end.line:
+                return False
+        return cst.CSTTransformer.on_visit(self, node)
+
+    def on_leave(self, original_node, updated_node):
+        for tx in self.transformers:
+            if not isinstance(updated_node, cst.CSTNode):
+                break
+            updated_node = tx.on_leave(original_node, updated_node)
+        return updated_node
+
+
+def _edit_transformer(code, kind, name, line, marker):
+    if kind == "remove_import":
+        return _RemoveImportAtLine(name, line)
+    if kind == "remove_function":
+        return _RemoveFunctionAtLine(name, line)
+    if kind == "remove_class":
+        return _RemoveClassAtLine(name, line)
+    if kind == "remove_variable":
+        return _RemoveVariableAtLine(name, line)
+    if kind == "comment_import":
+        return _CommentOutImportAtLine(name, line, code, marker)
+    if kind == "comment_function":
+        return _CommentOutFunctionAtLine(name, line, code, marker)
+    raise ValueError(f"Unknown codemod edit kind: {kind}")
+
+
+def apply_cst_edits(code, edits, marker="SKYLOS DEADCODE"):
+    """Apply ``(kind, name, line)`` edits to ``code`` in a single pass.
+
+    Returns the new code and, for each edit, whether it changed anything.
+    """
+    transformers = [
+        _edit_transformer(code, kind, name, line, marker) for kind, name, line in edits
+    ]
+    if not transformers:
+        return code, []
+    new_code, _changed = _apply_transformer(code, _BatchEdits(transformers))
+    return new_code, [tx.changed for tx in transformers]
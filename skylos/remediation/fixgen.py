@@ -275,13 +275,13 @@ def _find_block_end(lines: list[str], start_idx: int) -> int:
     end_idx = start_idx
     for i in range(start_idx + 1, len(lines)):
         line = lines[i]
-        stripped = line.strip()
+        stripped = line.lstrip()
 
         if not stripped or stripped.startswith("#"):
             end_idx = i
             continue
 
-        current_indent = len(line) - len(line.lstrip())
+        current_indent = len(line) - len(stripped)
         if current_indent <= base_indent:
             break
         end_idx = i
@@ -335,6 +335,55 @@ def _load_file_lines(
     return file_cache[abs_path]
 
 
+def _python_def_spans(lines: list[str]) -> dict[int, tuple[int, int]]:
+    """Map each def/class line to its (first decorator line, end line), 1-based."""
+    try:
+        tree = ast.parse("\n".join(lines))
+    except (SyntaxError, ValueError):
+        return {}
+
+    spans: dict[int, tuple[int, int]] = {}
+    for node in _iter_statements(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            start = node.decorator_list[0].lineno if node.decorator_list else None
+            spans[node.lineno] = (start or node.lineno, node.end_lineno)
+    return spans
+
+
+def _iter_statements(tree: ast.AST):
+    # Definitions are always statements, so only statement bodies (including
+    # except handlers and match cases) need descending into; ast.walk would
+    # also visit every expression node in the file.
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        yield node
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case)):
+                stack.append(child)
+
+
+def _load_def_spans(
+    span_cache: dict[str, dict[int, tuple[int, int]]],
+    abs_path: str,
+    lines: list[str],
+) -> dict[int, tuple[int, int]]:
+    if abs_path not in span_cache:
+        span_cache[abs_path] = _python_def_spans(lines)
+    return span_cache[abs_path]
+
+
+def _extend_over_trailing_blanks(lines: list[str], end_idx: int) -> int:
+    # Blank and comment lines directly after a block go with it, matching
+    # what the indentation walk in _find_block_end has always removed.
+    while end_idx + 1 < len(lines):
+        stripped = lines[end_idx + 1].strip()
+        if stripped and not stripped.startswith("#"):
+            break
+        end_idx += 1
+    return end_idx
+
+
 def _find_decorator_start(lines: list[str], start_idx: int) -> int:
     dec_start = start_idx
     while dec_start > 0 and lines[dec_start - 1].strip().startswith("@"):
@@ -347,6 +396,7 @@ def _resolve_patch_range(
     abs_path: str,
     kind: str,
     line: int,
+    def_spans: dict[int, tuple[int, int]] | None = None,
 ) -> tuple[int, int] | None:
     start_idx = line - 1
     if start_idx >= len(lines):
@@ -357,6 +407,14 @@ def _resolve_patch_range(
         if ext in _BRACE_LANG_EXTS:
             end_idx = _find_brace_block_end(lines, start_idx)
         else:
+            # The parser knows where the block and its decorators start and
+            # end; the line walks are the fallback for unparsable sources.
+            span = def_spans.get(line) if def_spans else None
+            if span is not None:
+                first_line, last_line = span
+                return first_line - 1, _extend_over_trailing_blanks(
+                    lines, last_line - 1
+                )
             end_idx = _find_block_end(lines, start_idx)
         return _find_decorator_start(lines, start_idx), end_idx
 
@@ -391,6 +449,7 @@ def _build_patch_for_finding(
     *,
     root: Path,
     file_cache: dict[str, list[str]],
+    span_cache: dict[str, dict[int, tuple[int, int]]],
     dag: dict[str, list[str]],
     mode: str,
     min_safety: float,
@@ -410,7 +469,13 @@ def _build_patch_for_finding(
     if lines is None:
         return None
 
-    patch_range = _resolve_patch_range(lines, abs_path, kind, line)
+    def_spans = None
+    if kind in ("function", "method", "class") and (
+        Path(abs_path).suffix.lower() in PYTHON_EXTS
+    ):
+        def_spans = _load_def_spans(span_cache, abs_path, lines)
+
+    patch_range = _resolve_patch_range(lines, abs_path, kind, line, def_spans)
     if patch_range is None:
         return None
     start_idx, end_idx = patch_range
@@ -441,6 +506,7 @@ def generate_removal_plan(
     name_to_finding = _build_name_to_finding(verified_findings)
     patches: list[RemovalPatch] = []
     file_cache: dict[str, list[str]] = {}
+    span_cache: dict[str, dict[int, tuple[int, int]]] = {}
 
     for name in order:
         finding = name_to_finding.get(name)
@@ -450,6 +516,7 @@ def generate_removal_plan(
             finding,
             root=root,
             file_cache=file_cache,
+            span_cache=span_cache,
             dag=dag,
             mode=mode,
             min_safety=min_safety,
@@ -462,6 +529,29 @@ def generate_removal_plan(
     return patches
 
 
+def _ordered_file_patches(file_patches: list[RemovalPatch]) -> list[RemovalPatch]:
+    # Patches are applied bottom-up so earlier line numbers stay valid. A range
+    # nested in (or overlapping) one already kept would shift the outer slice,
+    # so only the outermost patch of each overlapping group is applied.
+    kept: list[RemovalPatch] = []
+    for patch in sorted(
+        file_patches, key=lambda p: (p.line_range[0], -p.line_range[1])
+    ):
+        if kept and patch.line_range[0] <= kept[-1].line_range[1]:
+            logger.debug(
+                "Skipping %s in %s: lines %d-%d overlap %s",
+                patch.finding_name,
+                patch.file_path,
+                patch.line_range[0],
+                patch.line_range[1],
+                kept[-1].finding_name,
+            )
+            continue
+        kept.append(patch)
+    kept.reverse()
+    return kept
+
+
 def generate_unified_diff(
     patches: list[RemovalPatch],
     project_root: str | Path,
@@ -483,7 +573,7 @@ def generate_unified_diff(
             continue
 
         modified_lines = list(original_lines)
-        for patch in sorted(file_patches, key=lambda p: -p.line_range[0]):
+        for patch in _ordered_file_patches(file_patches):
             start = patch.line_range[0] - 1
             end = patch.line_range[1]
             if patch.replacement:
@@ -534,7 +624,7 @@ def apply_patches(
             logger.warning("Cannot read %s: %s", file_path, e)
             continue
 
-        for patch in sorted(file_patches, key=lambda p: -p.line_range[0]):
+        for patch in _ordered_file_patches(file_patches):
             start = patch.line_range[0] - 1
             end = patch.line_range[1]
             if patch.replacement:
@@ -1,3 +1,5 @@
+import sys
+
 _GITHUB_ANNOTATION_LEVELS = {
     "CRITICAL": "error",
     "HIGH": "error",
@@ -93,9 +95,9 @@ def _github_annotation_sort_key(annotation):
     return _GITHUB_ANNOTATION_PRIORITY.get(annotation["severity"], 99)
 
 
-def _emit_github_annotation(annotation):
+def _format_github_annotation(annotation):
     level = _GITHUB_ANNOTATION_LEVELS.get(annotation["severity"], "warning")
-    print(
+    return (
         f"::{level} file={annotation['file']},line={annotation['line']},"
         f"title={annotation['title']}::{annotation['msg']}"
     )
@@ -107,5 +109,8 @@ def _emit_github_annotations(result, *, max_annotations=50, severity_filter=None
     annotations = _filter_github_annotations_by_severity(annotations, severity_filter)
     annotations.sort(key=_github_annotation_sort_key)
 
-    for annotation in annotations[:max_annotations]:
-        _emit_github_annotation(annotation)
+    # Build the batch and hand it to stdout in one write rather than one
+    # print call per annotation.
+    lines = [_format_github_annotation(a) for a in annotations[:max_annotations]]
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -1,5 +1,7 @@
 import logging
+import os
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 
 from rich.console import Console
@@ -23,16 +25,25 @@ def _shorten_path(path, root_path=None, keep_parts=3):
         return "?"
 
     try:
-        p = Path(path).resolve()
-        cwd = Path.cwd().resolve()
+        cwd = os.getcwd()
+    except OSError:
+        return str(path)
+    return _shorten_path_from(str(path), cwd)
+
 
-        rel = p.relative_to(cwd)
+# Every finding in a report is shortened, and most share a handful of files;
+# resolve() stats each path component, so remember results per working dir.
+@lru_cache(maxsize=4096)
+def _shorten_path_from(path, cwd):
+    try:
+        p = Path(path).resolve()
+        rel = p.relative_to(Path(cwd).resolve())
         return str(rel)
 
     except ValueError:
         return str(p)
     except Exception:
-        return str(path)
+        return path
 
 
 def _results_pill(label, n, ok_style="good", bad_style="bad"):
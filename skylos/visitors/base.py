@@ -15,58 +15,60 @@ from skylos.visitors.registration_decorators import (
 )
 from typing import Any, Optional, Union
 
-PYTHON_BUILTINS = {
-    "print",
-    "len",
-    "str",
-    "int",
-    "float",
-    "list",
-    "dict",
-    "set",
-    "tuple",
-    "range",
-    "open",
-    "reversed",
-    "super",
-    "object",
-    "type",
-    "enumerate",
-    "zip",
-    "map",
-    "filter",
-    "sorted",
-    "sum",
-    "min",
-    "next",
-    "iter",
-    "bytes",
-    "bytearray",
-    "format",
-    "round",
-    "abs",
-    "complex",
-    "hash",
-    "id",
-    "bool",
-    "callable",
-    "getattr",
-    "max",
-    "all",
-    "any",
-    "setattr",
-    "hasattr",
-    "isinstance",
-    "globals",
-    "locals",
-    "vars",
-    "dir",
-    "property",
-    "classmethod",
-    "staticmethod",
-}
+PYTHON_BUILTINS = frozenset(
+    {
+        "print",
+        "len",
+        "str",
+        "int",
+        "float",
+        "list",
+        "dict",
+        "set",
+        "tuple",
+        "range",
+        "open",
+        "reversed",
+        "super",
+        "object",
+        "type",
+        "enumerate",
+        "zip",
+        "map",
+        "filter",
+        "sorted",
+        "sum",
+        "min",
+        "next",
+        "iter",
+        "bytes",
+        "bytearray",
+        "format",
+        "round",
+        "abs",
+        "complex",
+        "hash",
+        "id",
+        "bool",
+        "callable",
+        "getattr",
+        "max",
+        "all",
+        "any",
+        "setattr",
+        "hasattr",
+        "isinstance",
+        "globals",
+        "locals",
+        "vars",
+        "dir",
+        "property",
+        "classmethod",
+        "staticmethod",
+    }
+)
 
-DYNAMIC_PATTERNS = {"getattr", "globals", "eval", "exec"}
+DYNAMIC_PATTERNS = frozenset({"getattr", "globals", "eval", "exec"})
 IMPORT_FALLBACK_EXCEPTIONS = {"ImportError", "ModuleNotFoundError"}
 
 OVERRIDE_DECORATORS = {
@@ -81,110 +83,112 @@ NUMBA_OVERLOAD_DECORATORS = {
     "numba.extending.overload_attribute",
 }
 
-IMPLICIT_DUNDERS = {
-    "__init__",
-    "__new__",
-    "__del__",
-    "__init_subclass__",
-    "__repr__",
-    "__str__",
-    "__bytes__",
-    "__format__",
-    "__eq__",
-    "__ne__",
-    "__lt__",
-    "__le__",
-    "__gt__",
-    "__ge__",
-    "__hash__",
-    "__getattr__",
-    "__getattribute__",
-    "__setattr__",
-    "__delattr__",
-    "__dir__",
-    "__get__",
-    "__set__",
-    "__delete__",
-    "__set_name__",
-    "__len__",
-    "__length_hint__",
-    "__getitem__",
-    "__setitem__",
-    "__delitem__",
-    "__missing__",
-    "__iter__",
-    "__reversed__",
-    "__contains__",
-    "__add__",
-    "__sub__",
-    "__mul__",
-    "__matmul__",
-    "__truediv__",
-    "__floordiv__",
-    "__mod__",
-    "__divmod__",
-    "__pow__",
-    "__lshift__",
-    "__rshift__",
-    "__and__",
-    "__xor__",
-    "__or__",
-    "__neg__",
-    "__pos__",
-    "__abs__",
-    "__invert__",
-    "__complex__",
-    "__int__",
-    "__float__",
-    "__index__",
-    "__round__",
-    "__radd__",
-    "__rsub__",
-    "__rmul__",
-    "__rmatmul__",
-    "__rtruediv__",
-    "__rfloordiv__",
-    "__rmod__",
-    "__rdivmod__",
-    "__rpow__",
-    "__rlshift__",
-    "__rrshift__",
-    "__rand__",
-    "__rxor__",
-    "__ror__",
-    "__iadd__",
-    "__isub__",
-    "__imul__",
-    "__imatmul__",
-    "__itruediv__",
-    "__ifloordiv__",
-    "__imod__",
-    "__ipow__",
-    "__ilshift__",
-    "__irshift__",
-    "__iand__",
-    "__ixor__",
-    "__ior__",
-    "__enter__",
-    "__exit__",
-    "__aenter__",
-    "__aexit__",
-    "__call__",
-    "__await__",
-    "__aiter__",
-    "__anext__",
-    "__prepare__",
-    "__class_getitem__",
-    "__reduce__",
-    "__reduce_ex__",
-    "__getstate__",
-    "__setstate__",
-    "__getnewargs__",
-    "__getnewargs_ex__",
-    "__copy__",
-    "__deepcopy__",
-    "__bool__",
-}
+IMPLICIT_DUNDERS = frozenset(
+    {
+        "__init__",
+        "__new__",
+        "__del__",
+        "__init_subclass__",
+        "__repr__",
+        "__str__",
+        "__bytes__",
+        "__format__",
+        "__eq__",
+        "__ne__",
+        "__lt__",
+        "__le__",
+        "__gt__",
+        "__ge__",
+        "__hash__",
+        "__getattr__",
+        "__getattribute__",
+        "__setattr__",
+        "__delattr__",
+        "__dir__",
+        "__get__",
+        "__set__",
+        "__delete__",
+        "__set_name__",
+        "__len__",
+        "__length_hint__",
+        "__getitem__",
+        "__setitem__",
+        "__delitem__",
+        "__missing__",
+        "__iter__",
+        "__reversed__",
+        "__contains__",
+        "__add__",
+        "__sub__",
+        "__mul__",
+        "__matmul__",
+        "__truediv__",
+        "__floordiv__",
+        "__mod__",
+        "__divmod__",
+        "__pow__",
+        "__lshift__",
+        "__rshift__",
+        "__and__",
+        "__xor__",
+        "__or__",
+        "__neg__",
+        "__pos__",
+        "__abs__",
+        "__invert__",
+        "__complex__",
+        "__int__",
+        "__float__",
+        "__index__",
+        "__round__",
+        "__radd__",
+        "__rsub__",
+        "__rmul__",
+        "__rmatmul__",
+        "__rtruediv__",
+        "__rfloordiv__",
+        "__rmod__",
+        "__rdivmod__",
+        "__rpow__",
+        "__rlshift__",
+        "__rrshift__",
+        "__rand__",
+        "__rxor__",
+        "__ror__",
+        "__iadd__",
+        "__isub__",
+        "__imul__",
+        "__imatmul__",
+        "__itruediv__",
+        "__ifloordiv__",
+        "__imod__",
+        "__ipow__",
+        "__ilshift__",
+        "__irshift__",
+        "__iand__",
+        "__ixor__",
+        "__ior__",
+        "__enter__",
+        "__exit__",
+        "__aenter__",
+        "__aexit__",
+        "__call__",
+        "__await__",
+        "__aiter__",
+        "__anext__",
+        "__prepare__",
+        "__class_getitem__",
+        "__reduce__",
+        "__reduce_ex__",
+        "__getstate__",
+        "__setstate__",
+        "__getnewargs__",
+        "__getnewargs_ex__",
+        "__copy__",
+        "__deepcopy__",
+        "__bool__",
+    }
+)
 
 METACLASS_BASES = {"ABCMeta", "EnumMeta", "type"}
 
@@ -247,16 +251,19 @@ class Definition:
         filename: Union[Path, str],
         line: int,
         node: Optional[ast.AST] = None,
+        in_init: Optional[bool] = None,
     ) -> None:
         self.name = name
         self.type = t
         self.filename = filename
         self.line = line
-        self.simple_name = name.split(".")[-1]
+        self.simple_name = name.rpartition(".")[2]
         self.confidence = 100
         self.references = 0
         self.is_exported = False
-        self.in_init = "__init__.py" in str(filename)
+        if in_init is None:
+            in_init = "__init__.py" in str(filename)
+        self.in_init = in_init
 
         self.node = node
         self.calls = set()
@@ -339,10 +346,18 @@ class Definition:
 
 class Visitor(ast.NodeVisitor):
     def __init__(self, mod: str, file: Union[Path, str]) -> None:
+        self.reset(mod, file)
+
+    def reset(self, mod: str, file: Union[Path, str]) -> None:
+        # Rebinds (rather than clears) every per-file container: the previous
+        # file's defs/refs/etc. may still be referenced by the caller.
         self.mod = mod
         self.file = file
+        self._in_init_file = "__init__.py" in str(file)
         self.defs = []
+        self._defs_by_name = {}
         self.refs = []
+        self._ref_entries = {}
         self.cls = None
         self.alias = {}
         self.dyn = set()
@@ -407,38 +422,45 @@ class Visitor(ast.NodeVisitor):
     def add_def(
         self, name: str, t: str, line: int, node: Optional[ast.AST] = None, **extra: Any
     ) -> None:
-        found = False
-        for d in self.defs:
-            if d.name == name:
-                found = True
-                if node is not None:
-                    d.node = node
-                for k, v in extra.items():
-                    if hasattr(d, k):
-                        if k == "suppression_lines":
-                            d.suppression_lines.update(v)
-                        else:
-                            setattr(d, k, v)
-                if t == "import" and name in self._conditional_import_targets:
-                    d.conditional_import = True
-                d.suppression_lines.add(line)
-                break
-        if not found:
-            defn = Definition(name, t, self.file, line, node=node)
+        d = self._defs_by_name.get(name)
+        if d is not None:
+            if node is not None:
+                d.node = node
+            for k, v in extra.items():
+                if hasattr(d, k):
+                    if k == "suppression_lines":
+                        d.suppression_lines.update(v)
+                    else:
+                        setattr(d, k, v)
+            if t == "import" and name in self._conditional_import_targets:
+                d.conditional_import = True
+            d.suppression_lines.add(line)
+        else:
+            defn = Definition(
+                name, t, self.file, line, node=node, in_init=self._in_init_file
+            )
             for k, v in extra.items():
                 if hasattr(defn, k):
                     setattr(defn, k, v)
             if t == "import" and name in self._conditional_import_targets:
                 defn.conditional_import = True
             self.defs.append(defn)
+            self._defs_by_name[name] = defn
 
-            if defn.simple_name.startswith("__") and defn.simple_name.endswith("__"):
+            simple_name = defn.simple_name
+            if simple_name[:2] == "__" == simple_name[-2:]:
                 defn.is_dunder = True
-                if defn.simple_name in IMPLICIT_DUNDERS:
+                if simple_name in IMPLICIT_DUNDERS:
                     defn.references += 1
 
     def add_ref(self, name: str) -> None:
-        self.refs.append((sys.intern(str(name)), self.file))
+        # The file half of every ref is constant per visitor, so share one
+        # tuple per distinct name; repeated refs then cost a list slot only.
+        ref = self._ref_entries.get(name)
+        if ref is None:
+            ref = (sys.intern(str(name)), self.file)
+            self._ref_entries[name] = ref
+        self.refs.append(ref)
 
         if self._current_function_qname:
             self.call_graph[self._current_function_qname].add(name)
@@ -452,22 +474,19 @@ class Visitor(ast.NodeVisitor):
             self.visit(stmt)
 
     def qual(self, name: str) -> str:
-        if name in self.alias:
-            if self.mod:
-                local_name = f"{self.mod}.{name}"
-                if any(d.name == local_name for d in self.defs):
-                    return local_name
-            else:
-                if any(d.name == name for d in self.defs):
-                    return name
-            return self.alias[name]
+        aliased = self.alias.get(name)
+        if aliased is not None:
+            local_name = f"{self.mod}.{name}" if self.mod else name
+            if local_name in self._defs_by_name:
+                return local_name
+            return aliased
 
         if name in PYTHON_BUILTINS:
             if self.mod:
                 mod_candidate = f"{self.mod}.{name}"
             else:
                 mod_candidate = name
-            if any(d.name == mod_candidate for d in self.defs):
+            if mod_candidate in self._defs_by_name:
                 return mod_candidate
 
         if self.mod:
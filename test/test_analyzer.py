@@ -8,6 +8,7 @@ from unittest.mock import Mock, patch
 from collections import defaultdict
 from skylos.visitors.test_aware import TestAwareVisitor
 from skylos.visitors.framework_aware import FrameworkAwareVisitor
+from skylos.visitors.base import Definition
 from skylos.analysis.penalties import apply_penalties
 from skylos.deadcode.config_entrypoints import configured_entrypoint_reason
 
@@ -377,6 +378,24 @@ class TestSkylos:
 
         assert mock_def.is_exported
 
+    def test_mark_exports_explicit_exports_only_match_exporting_module(self, skylos):
+        exported = Definition("pkg.mod.Thing", "class", "pkg/mod.ts", 1)
+        unrelated = Definition("other.Thing", "class", "other.ts", 1)
+        imported = Definition("pkg.mod.Thing", "import", "pkg/mod.ts", 2)
+
+        skylos.defs = {
+            "pkg.mod.Thing": exported,
+            "other.Thing": unrelated,
+            "pkg/mod.ts:pkg.mod.Thing": imported,
+        }
+        skylos.exports = {"pkg.mod": {"Thing"}}
+
+        skylos._mark_exports()
+
+        assert exported.is_exported
+        assert not unrelated.is_exported
+        assert not imported.is_exported
+
     def test_mark_refs_direct_reference(self, skylos):
         mock_def = Mock()
         mock_def.type = "function"
@@ -414,6 +433,24 @@ class TestSkylos:
         assert mock_import.references == 1
         assert mock_original.references == 2
 
+    def test_mark_refs_counts_repeated_references(self, skylos):
+        func = Definition("module.function", "function", "module.py", 1)
+        method = Definition("module.Cls.run", "method", "module.py", 3)
+
+        skylos.defs = {"module.function": func, "module.Cls.run": method}
+        skylos.refs = [
+            ("module.function", "module.py"),
+            ("module.function", "module.py"),
+            ("module.function", "other.py"),
+            ("self.run", "module.py"),
+            ("self.run", "module.py"),
+        ]
+
+        skylos._mark_refs()
+
+        assert func.references == 3
+        assert method.references == 2
+
 
 class TestHeuristics:
     @pytest.fixture
@@ -50,16 +50,17 @@ class TestSkylosApi(unittest.TestCase):
             with self.assertRaises(RuntimeError):
                 api._cli_version()
 
+    @patch("skylos.api._ai_detection.os.path.exists", return_value=True)
     @patch("subprocess.check_output")
     @patch("skylos.api.get_git_root", return_value="/mock/git/root")
-    def test_detect_ai_code_reexport_uses_api_git_root(self, mock_git_root, mock_git):
-        mock_git.side_effect = [
-            (
-                b"abcdef123|Copilot Bot|bot@example.com|generated by ai|"
-                b"Claude <noreply@example.com>\n"
-            ),
-            b"app.py\n",
-        ]
+    def test_detect_ai_code_reexport_uses_api_git_root(
+        self, mock_git_root, mock_git, _exists
+    ):
+        mock_git.return_value = (
+            b"\x1eabcdef123|Copilot Bot|bot@example.com|generated by ai|"
+            b"Claude <noreply@example.com>\n\napp.py\n"
+            b"\x1e0123456|Dev|dev@example.com|fix typo|\n\nREADME.md\n"
+        )
 
         result = api.detect_ai_code()
 
@@ -68,7 +69,49 @@ class TestSkylosApi(unittest.TestCase):
         self.assertEqual(result["ai_files"], ["app.py"])
         self.assertEqual(result["indicators"][0]["type"], "co-author")
         self.assertEqual(mock_git_root.call_count, 1)
-        self.assertEqual(mock_git.call_args_list[0].kwargs["cwd"], "/mock/git/root")
+        mock_git.assert_called_once()
+        self.assertIn("--name-only", mock_git.call_args.args[0])
+        self.assertEqual(mock_git.call_args.kwargs["cwd"], "/mock/git/root")
+
+    @patch("subprocess.check_output")
+    def test_detect_ai_code_skips_git_without_history(self, mock_git):
+        with tempfile.TemporaryDirectory() as repo:
+            self.assertFalse(api.detect_ai_code(repo)["detected"])
+
+            os.mkdir(os.path.join(repo, ".git"))
+            with patch.dict(os.environ, {"SKYLOS_SKIP_AI_DETECT": "1"}):
+                self.assertFalse(api.detect_ai_code(repo)["detected"])
+
+        mock_git.assert_not_called()
+
+    def test_append_ai_indicator_checks_sources_in_order(self):
+        from skylos.api._ai_detection import _append_ai_indicator
+
+        cases = [
+            (
+                ("a", "dependabot[bot]@users.noreply.github.com", "bump", ""),
+                "author-email",
+            ),
+            (("a", "a@example.com", "AI-generated refactor", ""), "commit-message"),
+            (("a", "a@example.com", "Co-authored-by: Claude", ""), "commit-message"),
+            (("a", "a@example.com", "fix", "Devin <d@example.com>"), "co-author"),
+        ]
+        for (name, email, subject, trailers), expected in cases:
+            indicators = []
+            self.assertTrue(
+                _append_ai_indicator(
+                    indicators, "abcdef123", name, email, subject, trailers
+                )
+            )
+            self.assertEqual(indicators[0]["type"], expected)
+
+        indicators = []
+        self.assertFalse(
+            _append_ai_indicator(
+                indicators, "abcdef123", "a", "a@example.com", "fix typo", ""
+            )
+        )
+        self.assertEqual(indicators, [])
 
     @patch("skylos.api.get_git_root", return_value="/mock/git/root")
     @patch(
@@ -76,7 +119,7 @@ class TestSkylosApi(unittest.TestCase):
         return_value=("mock_commit_hash", "main", "mock_actor", {}),
     )
     @patch("skylos.api.get_project_token")
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_report_success(
         self, mock_post, mock_token, mock_git_info, mock_git_root
     ):
@@ -168,10 +211,28 @@ class TestSkylosApi(unittest.TestCase):
             finally:
                 os.chdir(cwd)
 
+    def test_read_json_reuses_parse_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = api.Path(tmp) / "credentials.json"
+            path.write_text('{"token": "one"}', encoding="utf-8")
+            api._read_json_cached.cache_clear()
+
+            with patch("skylos.api.json.loads", wraps=json.loads) as mock_loads:
+                self.assertEqual(api._read_json(path), {"token": "one"})
+                self.assertEqual(api._read_json(path), {"token": "one"})
+                self.assertEqual(mock_loads.call_count, 1)
+
+                path.write_text('{"token": "three"}', encoding="utf-8")
+                self.assertEqual(api._read_json(path), {"token": "three"})
+                self.assertEqual(mock_loads.call_count, 2)
+
     @patch("subprocess.check_output")
     @patch("skylos.api.get_project_token")
-    @patch("requests.post")
-    def test_upload_report_retry_logic(self, mock_post, mock_token, mock_git):
+    @patch("requests.Session.post")
+    @patch("skylos.api.time.sleep")
+    def test_upload_report_retry_logic(
+        self, mock_sleep, mock_post, mock_token, mock_git
+    ):
         mock_token.return_value = "token"
         mock_git.return_value = b"test\n"
 
@@ -185,6 +246,24 @@ class TestSkylosApi(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertEqual(mock_post.call_count, 3)
         self.assertIn("Server Error 500", result["error"])
+        self.assertEqual(mock_sleep.call_count, 2)
+        first_delay, second_delay = (c.args[0] for c in mock_sleep.call_args_list)
+        self.assertGreaterEqual(first_delay, api.RETRY_BACKOFF_SECONDS)
+        self.assertGreaterEqual(second_delay, api.RETRY_BACKOFF_SECONDS * 2)
+
+    def test_retry_delay_honors_retry_after(self):
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "7"})
+        self.assertEqual(api._retry_delay_seconds(1, throttled), 7.0)
+
+        throttled.headers = {"Retry-After": "3600"}
+        self.assertEqual(
+            api._retry_delay_seconds(1, throttled), api.RETRY_AFTER_MAX_SECONDS
+        )
+
+        failed = MagicMock(status_code=500, headers={"Retry-After": "7"})
+        delay = api._retry_delay_seconds(2, failed)
+        self.assertGreaterEqual(delay, api.RETRY_BACKOFF_SECONDS * 2)
+        self.assertLess(delay, api.RETRY_BACKOFF_SECONDS * 2 + 0.25)
 
     @patch("skylos.api._should_use_legacy_inline_report_upload", return_value=False)
     @patch("skylos.api.get_git_root", return_value="/mock/git/root")
@@ -193,9 +272,11 @@ class TestSkylosApi(unittest.TestCase):
         return_value=("mock_commit_hash", "main", "mock_actor", {}),
     )
     @patch("skylos.api.get_project_token")
-    @patch("requests.post")
+    @patch("requests.Session.post")
+    @patch("skylos.api.time.sleep")
     def test_upload_report_falls_back_to_compact_inline_when_artifact_init_500(
         self,
+        _mock_sleep,
         mock_post,
         mock_token,
         _mock_git_info,
@@ -260,9 +341,10 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_project_token")
     @patch("skylos.api.get_git_info", return_value=("c", "b", "actor", {}))
     @patch("skylos.api.get_git_root", return_value=None)
-    @patch("requests.post")
+    @patch("requests.Session.post")
+    @patch("skylos.api.time.sleep")
     def test_upload_defense_report_retry_logic(
-        self, mock_post, _mock_root, _mock_git_info, mock_token
+        self, _mock_sleep, mock_post, _mock_root, _mock_git_info, mock_token
     ):
         mock_token.return_value = "token"
 
@@ -286,7 +368,7 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_project_token")
     @patch("skylos.api.get_git_info", return_value=("c", "b", "actor", {}))
     @patch("skylos.api.get_git_root", return_value=None)
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_defense_report_sends_attestation(
         self, mock_post, _mock_root, _mock_git_info, mock_token
     ):
@@ -325,7 +407,7 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_project_token")
     @patch("skylos.api.get_git_info", return_value=("c", "b", "actor", {}))
     @patch("skylos.api.get_git_root", return_value=None)
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_debt_report_sends_debt_payload(
         self, mock_post, _mock_root, _mock_git_info, mock_token
     ):
@@ -443,6 +525,28 @@ class TestSkylosApi(unittest.TestCase):
         finally:
             os.unlink(file_path)
 
+    def test_extract_snippet_handles_crlf_and_last_line(self):
+        with tempfile.NamedTemporaryFile("wb", delete=False) as handle:
+            handle.write(b"a\r\nb\r\nc")
+            file_path = handle.name
+        try:
+            self.assertEqual(extract_snippet(file_path, 3, context=1), "b\nc")
+            self.assertEqual(extract_snippet(file_path, 9, context=1), "")
+        finally:
+            os.unlink(file_path)
+
+    def test_extract_snippet_streams_large_files(self):
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", delete=False) as handle:
+            handle.write("".join(f"line{i}\n" for i in range(1, 6)))
+            file_path = handle.name
+        try:
+            with patch("skylos.api._snippets._SNIPPET_STREAM_MIN_BYTES", 0):
+                self.assertEqual(
+                    extract_snippet(file_path, 3, context=1), "line2\nline3\nline4"
+                )
+        finally:
+            os.unlink(file_path)
+
     def test_extract_snippet_missing_file_returns_none(self):
         snippet = extract_snippet("missing.py", 1, context=2)
         self.assertIsNone(snippet)
@@ -481,6 +585,70 @@ class TestSkylosApi(unittest.TestCase):
                 extract_snippet(str(link), 1, context=0, repo_root=str(repo))
             )
 
+    def test_normalize_result_sections_resolves_each_path_once(self):
+        with tempfile.TemporaryDirectory() as repo:
+            app = os.path.join(repo, "pkg", "app.py")
+            with patch(
+                "skylos.api._findings.os.path.relpath", wraps=os.path.relpath
+            ) as mock_relpath:
+                findings = api._normalize_result_sections(
+                    {
+                        "danger": [{"file": app, "line": 1}, {"file": app, "line": 2}],
+                        "quality": [{"file": app, "line": 3}],
+                    },
+                    api.UPLOAD_FINDING_SPECS,
+                    repo,
+                )
+
+        self.assertEqual([f["file_path"] for f in findings], ["pkg/app.py"] * 3)
+        self.assertEqual(mock_relpath.call_count, 1)
+
+    @patch("requests.Session.post")
+    def test_report_post_gzips_body_when_enabled(self, mock_post):
+        resp = MagicMock()
+        resp.status_code = 200
+        mock_post.return_value = resp
+
+        with patch.dict(os.environ, {"SKYLOS_GZIP_UPLOADS": "1"}):
+            response, error = api._post_report_payload(
+                "token", {"findings": [1]}, quiet=True
+            )
+
+        self.assertIs(response, resp)
+        self.assertIsNone(error)
+        kwargs = mock_post.call_args.kwargs
+        self.assertNotIn("json", kwargs)
+        self.assertEqual(kwargs["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(kwargs["headers"]["Authorization"], "Bearer token")
+        self.assertEqual(json.loads(gzip.decompress(kwargs["data"])), {"findings": [1]})
+
+    def test_dumps_json_bytes_falls_back_to_stdlib(self):
+        from skylos.api import _payloads
+
+        payload = {"a": [1, "é"], 2: None}
+        expected = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        with patch.object(_payloads, "orjson", None):
+            self.assertEqual(_payloads._dumps_json_bytes(payload), expected)
+
+        broken = MagicMock()
+        broken.dumps.side_effect = TypeError("unsupported")
+        with patch.object(_payloads, "orjson", broken):
+            self.assertEqual(_payloads._dumps_json_bytes(payload), expected)
+
+    def test_json_size_bytes_counts_escaped_non_ascii(self):
+        from skylos.api import _payloads
+
+        payload = {"msg": "héllo ✓ 🙂"}
+        utf8 = MagicMock()
+        utf8.dumps.side_effect = lambda value, option=None: json.dumps(
+            value, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        with patch.object(_payloads, "orjson", utf8):
+            size = _payloads._json_size_bytes(payload)
+
+        self.assertEqual(size, len(json.dumps(payload, separators=(",", ":"))))
+        self.assertGreater(size, len(utf8.dumps(payload)))
+
     def test_secret_findings_do_not_upload_snippets(self):
         raw_secret = 'token = "ghp_FULL_SECRET_TOKEN_ABCD"'
         findings = api._normalize_result_sections(
@@ -520,7 +688,7 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_git_info", return_value=("c", "b", "actor", {}))
     @patch("skylos.api.get_git_root", return_value=None)
     @patch("skylos.api.get_project_info")
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_report_whoami_failure_still_uploads(
         self, mock_post, mock_info, _, _mock_git_info, mock_token
     ):
@@ -537,10 +705,41 @@ class TestSkylosApi(unittest.TestCase):
         self.assertEqual(result["scan_id"], "scan_ok")
         self.assertEqual(mock_post.call_count, 1)
 
+    @patch("skylos.api.get_project_token", return_value="token")
+    @patch("skylos.api.get_git_info", return_value=("c", "b", "actor", {}))
+    @patch("skylos.api.get_git_root", return_value=None)
+    @patch(
+        "skylos.api.detect_ai_code",
+        return_value={"detected": True, "indicators": [], "ai_files": ["a.py"]},
+    )
+    @patch(
+        "skylos.api.get_project_info",
+        return_value={"ok": True, "project": {"name": "demo"}},
+    )
+    @patch("requests.Session.post")
+    def test_upload_report_gathers_metadata_and_project_name(
+        self, mock_post, mock_info, mock_ai, _root, mock_git_info, _token
+    ):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"scanId": "scan_ok"}
+        mock_post.return_value = mock_response
+
+        with patch("builtins.print") as mock_print:
+            result = upload_report({"danger": []}, quiet=False)
+
+        self.assertTrue(result["success"])
+        mock_print.assert_any_call("Uploading to: demo")
+        mock_info.assert_called_once_with("token")
+        mock_git_info.assert_called_once_with()
+        mock_ai.assert_called_once_with(None)
+        payload = mock_post.call_args.kwargs["json"]
+        self.assertEqual(payload["commit_hash"], "c")
+
     @patch("skylos.api.get_project_token")
     @patch("skylos.api.get_git_info", return_value=("c", "b", "actor", {}))
     @patch("skylos.api.get_git_root", return_value=None)
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_report_401_returns_invalid_token_error(
         self, mock_post, _, _mock_git_info, mock_token
     ):
@@ -561,9 +760,10 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_project_token")
     @patch("skylos.api.get_git_info", return_value=("c", "b", "actor", {}))
     @patch("skylos.api.get_git_root", return_value=None)
-    @patch("requests.post")
+    @patch("requests.Session.post")
+    @patch("skylos.api.time.sleep")
     def test_retry_returns_last_error_text(
-        self, mock_post, _, _mock_git_info, mock_token
+        self, _mock_sleep, mock_post, _, _mock_git_info, mock_token
     ):
         mock_token.return_value = "token"
 
@@ -600,7 +800,7 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_project_token")
     @patch("skylos.api.get_git_info", return_value=("c", "b", "actor", {}))
     @patch("skylos.api.get_git_root", return_value=None)
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_prepare_for_sarif_normalizes_missing_fields(
         self, mock_post, _root, _git, mock_token, mock_exporter
     ):
@@ -629,7 +829,7 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_project_token")
     @patch("skylos.api.get_git_info", return_value=("c", "b", "actor", {}))
     @patch("skylos.api.get_git_root", return_value="/mock/git/root")
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_prepare_for_sarif_relpaths_when_git_root_present(
         self, mock_post, _root, _git, mock_token, mock_exporter
     ):
@@ -667,7 +867,7 @@ class TestSkylosApi(unittest.TestCase):
         ),
     )
     @patch("skylos.api.get_git_root", return_value=None)
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_report_includes_ci_metadata(
         self,
         mock_post,
@@ -886,7 +1086,7 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_project_info", return_value={})
     @patch("skylos.api.detect_ai_code", return_value={"detected": False})
     @patch("requests.put")
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_report_large_payload_uses_artifact_flow(
         self,
         mock_post,
@@ -1007,7 +1207,7 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_git_root", return_value=None)
     @patch("skylos.api.get_project_info", return_value={})
     @patch("skylos.api.detect_ai_code", return_value={"detected": False})
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_report_large_payload_missing_required_artifact_instructions_fails(
         self,
         mock_post,
@@ -1058,7 +1258,7 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_project_info", return_value={})
     @patch("skylos.api.detect_ai_code", return_value={"detected": False})
     @patch("requests.put")
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_report_large_payload_optional_definitions_failure_still_succeeds(
         self,
         mock_post,
@@ -1131,7 +1331,7 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_project_info", return_value={})
     @patch("skylos.api.detect_ai_code", return_value={"detected": False})
     @patch("requests.put")
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_report_large_payload_optional_definitions_not_requested(
         self,
         mock_post,
@@ -1197,7 +1397,7 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_project_info", return_value={})
     @patch("skylos.api.detect_ai_code", return_value={"detected": False})
     @patch("requests.put")
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_report_retries_without_unsupported_optional_definitions(
         self,
         mock_post,
@@ -1275,7 +1475,7 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_git_root", return_value=None)
     @patch("skylos.api.get_project_info", return_value={})
     @patch("skylos.api.detect_ai_code", return_value={"detected": False})
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_report_large_payload_fails_cleanly_when_artifacts_unsupported(
         self,
         mock_post,
@@ -1315,7 +1515,7 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_git_root", return_value=None)
     @patch("skylos.api.get_project_info", return_value={})
     @patch("skylos.api.detect_ai_code", return_value={"detected": False})
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_report_small_payload_skips_artifact_init(
         self,
         mock_post,
@@ -1351,7 +1551,7 @@ class TestSkylosApi(unittest.TestCase):
     @patch("skylos.api.get_git_root", return_value=None)
     @patch("skylos.api.get_project_info", return_value={})
     @patch("skylos.api.detect_ai_code", return_value={"detected": False})
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_upload_report_large_payload_can_use_opt_in_degraded_legacy_fallback(
         self,
         mock_post,
@@ -1523,7 +1723,7 @@ class TestSkylosApi(unittest.TestCase):
             "https://uploads.example.com/report",
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_post_json_with_retries_rejects_non_http_url(self, mock_post):
         response, error = api._post_json_with_retries(
             "file:///tmp/report",
@@ -1537,7 +1737,7 @@ class TestSkylosApi(unittest.TestCase):
         self.assertIn("Unsafe API URL", error)
         mock_post.assert_not_called()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_github_oidc_token_rejects_non_github_url(self, mock_get):
         with patch.dict(
             os.environ,
@@ -1834,6 +2034,65 @@ class TestNormalizeBranch(unittest.TestCase):
         self.assertEqual(result, 123)
 
 
+class TestGitToplevelCache(unittest.TestCase):
+    @patch("subprocess.check_output", return_value=b"/repo\n")
+    def test_git_root_and_link_root_share_one_subprocess(self, mock_git):
+        with patch.dict(api._GIT_TOPLEVEL_CACHE, clear=True):
+            self.assertEqual(api.get_git_root(), "/repo")
+            self.assertEqual(api.get_git_root(), "/repo")
+            self.assertEqual(str(api._get_repo_root_for_link()), "/repo")
+
+        self.assertEqual(mock_git.call_count, 1)
+
+    @patch(
+        "subprocess.check_output",
+        side_effect=subprocess.TimeoutExpired(["git"], 10),
+    )
+    def test_git_timeout_returns_none(self, mock_git):
+        with patch.dict(api._GIT_TOPLEVEL_CACHE, clear=True):
+            self.assertIsNone(api.get_git_root())
+
+        self.assertEqual(mock_git.call_args.kwargs["timeout"], api.SUBPROCESS_TIMEOUT)
+
+    @patch("subprocess.check_output", side_effect=subprocess.SubprocessError())
+    def test_git_failure_is_not_cached(self, mock_git):
+        with patch.dict(api._GIT_TOPLEVEL_CACHE, clear=True):
+            self.assertIsNone(api.get_git_root())
+            self.assertIsNone(api.get_git_root())
+
+        self.assertEqual(mock_git.call_count, 2)
+
+
+class TestProjectInfoCache(unittest.TestCase):
+    @patch("requests.Session.get")
+    def test_project_info_is_reused_within_ttl(self, mock_get):
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.json.return_value = {"ok": True, "plan": "pro"}
+        mock_get.return_value = resp
+
+        with patch.dict(api._PROJECT_INFO_CACHE, clear=True):
+            self.assertEqual(api.get_project_info("tok")["plan"], "pro")
+            self.assertEqual(api.get_project_info("tok")["plan"], "pro")
+            self.assertEqual(mock_get.call_count, 1)
+
+            with patch("skylos.api.time.monotonic", return_value=1e12):
+                api.get_project_info("tok")
+            self.assertEqual(mock_get.call_count, 2)
+
+    @patch("requests.Session.get")
+    def test_failed_project_info_is_not_cached(self, mock_get):
+        resp = MagicMock()
+        resp.status_code = 401
+        mock_get.return_value = resp
+
+        with patch.dict(api._PROJECT_INFO_CACHE, clear=True):
+            self.assertIsNone(api.get_project_info("tok"))
+            self.assertIsNone(api.get_project_info("tok"))
+
+        self.assertEqual(mock_get.call_count, 2)
+
+
 class TestGetGitInfo(unittest.TestCase):
     def _clear_all_env(self):
         vars_to_clear = [
@@ -1874,7 +2133,7 @@ class TestGetGitInfo(unittest.TestCase):
 
     @patch("subprocess.check_output")
     def test_local_environment_uses_git(self, mock_git):
-        mock_git.side_effect = [b"localcommit123\n", b"my-branch\n"]
+        mock_git.return_value = b"localcommit123\nmy-branch\n"
         os.environ["USER"] = "localuser"
 
         commit, branch, actor, ci = get_git_info()
@@ -1883,6 +2142,12 @@ class TestGetGitInfo(unittest.TestCase):
         self.assertEqual(branch, "my-branch")
         self.assertEqual(actor, "localuser")
         self.assertEqual(ci, {})
+        mock_git.assert_called_once()
+        self.assertEqual(
+            mock_git.call_args.args[0],
+            ["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"],
+        )
+        self.assertEqual(mock_git.call_args.kwargs["timeout"], api.SUBPROCESS_TIMEOUT)
 
     @patch("subprocess.check_output")
     def test_env_overrides_always_win(self, mock_git):
@@ -1983,7 +2248,7 @@ class TestGetGitInfo(unittest.TestCase):
         os.environ["JENKINS_URL"] = "https://jenkins.example.com"
         os.environ["BUILD_NUMBER"] = "1"
 
-        mock_git.side_effect = [b"gitfallbacksha\n", b"fallback-branch\n"]
+        mock_git.return_value = b"gitfallbacksha\nfallback-branch\n"
 
         commit, branch, actor, ci = get_git_info()
 
@@ -2057,7 +2322,7 @@ class TestVerifyReport(unittest.TestCase):
     @patch("skylos.api.get_project_info")
     @patch("skylos.api.get_git_info", return_value=("sha", "branch", "actor", {}))
     @patch("skylos.api.get_git_root", return_value=None)
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_verify_report_normalizes_payload(
         self, mock_post, _, _git, mock_info, mock_token
     ):
@@ -2086,6 +2351,43 @@ class TestVerifyReport(unittest.TestCase):
         self.assertEqual(payload["findings"][1]["category"], "SECRET")
         self.assertEqual(payload["findings"][1]["finding_id"], "SKY-S000::secret.py::7")
 
+    @patch("skylos.api.get_project_token", return_value="token")
+    @patch("skylos.api.get_project_info", return_value={"plan": "pro"})
+    @patch("skylos.api.get_git_info", return_value=("sha", "branch", "actor", {}))
+    @patch("skylos.api.get_git_root")
+    @patch("requests.Session.post")
+    def test_verify_report_merges_results_by_normalized_finding_id(
+        self, mock_post, mock_root, _git, _info, _token
+    ):
+        with tempfile.TemporaryDirectory() as repo:
+            mock_root.return_value = repo
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.json.return_value = {
+                "results": [
+                    {"finding_id": "SKY-D000::pkg/app.py::5", "verdict": "VERIFIED"},
+                    {"finding_id": "SKY-S000::other.py::1", "verdict": "REFUTED"},
+                ]
+            }
+            mock_post.return_value = resp
+            result_json = {
+                "danger": [
+                    {"file": os.path.join(repo, "pkg", "app.py"), "line": 5},
+                    {"file": os.path.join(repo, "pkg", "app.py"), "line": 9},
+                ],
+                "secrets": [],
+            }
+
+            from skylos.api import verify_report
+
+            result = verify_report(result_json, quiet=True)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(
+            result_json["danger"][0]["verification"]["verdict"], "VERIFIED"
+        )
+        self.assertNotIn("verification", result_json["danger"][1])
+
 
 if __name__ == "__main__":
     unittest.main()
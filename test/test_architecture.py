@@ -1,10 +1,12 @@
 import ast
+import statistics
 from skylos.analysis.architecture import (
     analyze_architecture,
     get_architecture_findings,
     get_layer_policy_findings,
     _compute_abstractness,
     _classify_zone,
+    _count_source_loc,
     _has_main_guard,
 )
 
@@ -71,6 +73,48 @@ class Baz:
         result = _compute_abstractness(tree)
         assert result["abstractness"] > 0.0
 
+    def test_nested_statements_are_counted(self):
+        tree = ast.parse("""
+from abc import ABC, abstractmethod
+from typing import TypeVar
+
+def factory(kind):
+    try:
+        class Local(ABC):
+            @abstractmethod
+            def run(self): ...
+    except ImportError:
+        T = TypeVar("T")
+    match kind:
+        case "x":
+            def helper():
+                pass
+    return lambda: None
+""")
+        result = _compute_abstractness(tree)
+        assert result["total_classes"] == 1
+        assert result["abstract_classes"] == 1
+        assert result["abstract_methods"] == 1
+        assert result["total_functions"] == 3
+        assert result["type_vars"] == 1
+
+    def test_else_finally_and_with_bodies_are_counted(self):
+        tree = ast.parse("""
+for item in items:
+    pass
+else:
+    def after_loop(): ...
+try:
+    pass
+finally:
+    class Cleanup: ...
+with ctx:
+    async def inside(): ...
+""")
+        result = _compute_abstractness(tree)
+        assert result["total_classes"] == 1
+        assert result["total_functions"] == 2
+
 
 class TestClassifyZone:
     def test_canonical_truth_table(self):
@@ -113,6 +157,70 @@ class TestClassifyZone:
         assert result.system_metrics["zone_distribution"]["zone_of_pain"] == 0
         assert result.system_metrics["zone_distribution"]["disconnected"] == 1
 
+    def test_loc_counts_code_lines_from_file(self, tmp_path):
+        source = tmp_path / "mod.py"
+        source.write_bytes(b"# header\r\n\r\nimport os\r\n    # indented\nx = 1\n  \n")
+
+        result = analyze_architecture(
+            dependency_graph={"mod": set()},
+            module_files={"mod": str(source)},
+        )
+
+        assert result.modules["mod"].loc == 2
+
+    def test_loc_from_file_matches_source_count(self, tmp_path):
+        samples = [
+            b"import os\rx = 1\ry = 2\r",
+            "import os\n\xa0\n\f\nx = 1\n".encode("utf-8"),
+            b"a = 1\r\n\x0cb = 2\x0bc = 3\n# done\n",
+        ]
+        for i, raw in enumerate(samples):
+            source = tmp_path / f"mod{i}.py"
+            source.write_bytes(raw)
+            expected = _count_source_loc(raw.decode("utf-8"))
+
+            result = analyze_architecture(
+                dependency_graph={"mod": set()},
+                module_files={"mod": str(source)},
+            )
+
+            assert result.modules["mod"].loc == expected
+        assert _count_source_loc("import os\rx = 1\ry = 2\r") == 3
+        assert _count_source_loc("import os\n\xa0\n\f\nx = 1\n") == 2
+
+
+class TestDIPViolations:
+    def test_stable_module_depending_on_unstable_module(self):
+        graph = {f"c{i}": {"a"} for i in range(5)}
+        graph["a"] = {"b", "external"}
+        graph["b"] = {"d1", "d2", "d3"}
+        modules = set(graph) | {"d1", "d2", "d3"}
+        result = analyze_architecture(
+            dependency_graph=graph,
+            module_files={name: "" for name in modules},
+            module_loc={name: 1 for name in modules},
+        )
+
+        assert [
+            (v.stable_module, v.unstable_module) for v in result.dip_violations
+        ] == [("a", "b")]
+        violation = result.dip_violations[0]
+        assert violation.stable_instability == 0.167
+        assert violation.unstable_instability == 0.75
+        assert violation.severity == "MEDIUM"
+
+        instabilities = [m.instability for m in result.modules.values()]
+        assert result.system_metrics["instability_variance"] == round(
+            statistics.pvariance(instabilities), 4
+        )
+        assert result.system_metrics["total_loc"] == len(modules)
+        assert result.system_metrics["mean_distance"] == round(
+            statistics.fmean(m.distance for m in result.modules.values()), 3
+        )
+        zones = result.system_metrics["zone_distribution"]
+        assert sum(zones.values()) == len(modules)
+        assert zones["disconnected"] == 0
+
 
 class TestArchitectureContext:
     def test_main_guard_detected(self):
@@ -125,6 +233,19 @@ if __name__ == "__main__":
 """)
         assert _has_main_guard(tree)
 
+    def test_nested_main_guard_detected(self):
+        tree = ast.parse("""
+try:
+    import fast
+except ImportError:
+    fast = None
+else:
+    if "__main__" == __name__:
+        fast.run()
+""")
+        assert _has_main_guard(tree)
+        assert not _has_main_guard(ast.parse("x = lambda: __name__ == '__main__'"))
+
     def test_entrypoint_and_private_helpers_filter_contextual_findings(self):
         graph = {
             "mypkg.cli": {"mypkg.flow_a", "mypkg.flow_b", "mypkg.flow_c"},
@@ -460,6 +581,49 @@ class TestAnalyzeArchitecture:
         assert m.ca == 0
         assert m.ce == 0
         assert m.instability == 0.0
+        assert not hasattr(m, "__dict__")
+        assert not hasattr(result, "__dict__")
+
+    def test_package_keys_drive_grouping_and_modularity(self):
+        result = analyze_architecture(
+            dependency_graph={
+                "pkg.sub.a": {"pkg.sub.b", "other.c"},
+                "pkg.sub.b": set(),
+                "other.c": set(),
+                "top": {"pkg.sub.a"},
+            },
+            module_files={
+                "pkg.sub.a": "/p/pkg/sub/a.py",
+                "pkg.sub.b": "/p/pkg/sub/b.py",
+                "other.c": "/p/other/c.py",
+                "top": "/p/top.py",
+            },
+        )
+
+        a = result.modules["pkg.sub.a"]
+        assert (a.package, a.simple_name) == ("pkg.sub", "a")
+        top = result.modules["top"]
+        assert (top.package, top.simple_name) == ("top", "top")
+        pkg_sub = result.packages["pkg.sub"]
+        assert pkg_sub["modules"] == ["pkg.sub.a", "pkg.sub.b"]
+        assert pkg_sub["module_count"] == 2
+        assert (pkg_sub["afferent_coupling"], pkg_sub["efferent_coupling"]) == (2, 2)
+        assert result.packages["top"]["modules"] == ["top"]
+        assert result.system_metrics["modularity_index"] == round(1 / 3, 3)
+
+    def test_coupling_ignores_self_edges_and_unknown_targets(self):
+        result = analyze_architecture(
+            dependency_graph={
+                "outside": {"a"},
+                "a": {"a", "b", "missing"},
+                "b": set(),
+            },
+            module_files={"a": "/p/a.py", "b": "/p/b.py"},
+        )
+
+        assert set(result.modules) == {"a", "b"}
+        assert (result.modules["a"].ca, result.modules["a"].ce) == (1, 1)
+        assert (result.modules["b"].ca, result.modules["b"].ce) == (1, 0)
 
     def test_simple_dependency(self):
         result = analyze_architecture(
@@ -705,6 +869,7 @@ class Base2(ABC):
         hints = " ".join(item["hint"] for item in q803["remediations"])
 
         assert q803["name"] == "pkg._helpers"
+        assert q803["basename"] == "_helpers.py"
         assert "Keep private-helper intent explicit" in titles
         assert "fake" in hints
         assert "one-off abstractions" in hints
@@ -1,5 +1,13 @@
 import json
-from skylos.core.baseline import save_baseline, load_baseline, filter_new_findings
+from unittest.mock import patch
+
+from skylos.core import baseline as baseline_module
+from skylos.core.baseline import (
+    _fingerprint_digest,
+    filter_new_findings,
+    load_baseline,
+    save_baseline,
+)
 
 
 def _sample_result():
@@ -56,11 +64,13 @@ class TestSaveBaseline:
         save_baseline(tmp_path, result)
         baseline = json.loads((tmp_path / ".skylos" / "baseline.json").read_text())
         fps = set(baseline["fingerprints"])
-        assert "dead:unused_functions:old_func" in fps
-        assert "dead:unused_functions:another_func" in fps
-        assert "dead:unused_imports:os" in fps
-        assert "SKY-D211:app.py:50" in fps
-        assert "SKY-Q301:app.py:80" in fps
+        assert len(fps) == 5
+        assert all(len(fp) == 32 and ":" not in fp for fp in fps)
+        assert _fingerprint_digest("dead:unused_functions:old_func") in fps
+        assert _fingerprint_digest("dead:unused_functions:another_func") in fps
+        assert _fingerprint_digest("dead:unused_imports:os") in fps
+        assert _fingerprint_digest("SKY-D211:app.py:50") in fps
+        assert _fingerprint_digest("SKY-Q301:app.py:80") in fps
 
     def test_overwrites_existing(self, tmp_path):
         save_baseline(tmp_path, _sample_result())
@@ -79,6 +89,15 @@ class TestSaveBaseline:
         baseline = json.loads((tmp_path / ".skylos" / "baseline.json").read_text())
         assert len(baseline["fingerprints"]) == 0
 
+    def test_output_matches_stdlib_without_orjson(self, tmp_path):
+        fast_path = save_baseline(tmp_path / "fast", _sample_result())
+        with patch.object(baseline_module, "orjson", None):
+            slow_path = save_baseline(tmp_path / "slow", _sample_result())
+            assert load_baseline(tmp_path / "fast") == load_baseline(tmp_path / "slow")
+
+        assert fast_path.read_bytes() == slow_path.read_bytes()
+        assert fast_path.read_bytes().endswith(b"]\n}\n")
+
 
 class TestLoadBaseline:
     def test_returns_none_if_missing(self, tmp_path):
@@ -138,6 +157,39 @@ class TestFilterNewFindings:
         assert len(filtered["unused_functions"]) == 1
         assert filtered["unused_functions"][0]["name"] == "brand_new_func"
 
+    def test_mixed_legacy_and_hashed_fingerprints(self):
+        result = _sample_result()
+        baseline = {
+            "fingerprints": [
+                "dead:unused_functions:old_func",
+                _fingerprint_digest("SKY-D211:app.py:50"),
+            ]
+        }
+        filtered = filter_new_findings(result, baseline)
+        assert [f["name"] for f in filtered["unused_functions"]] == ["another_func"]
+        assert filtered["danger"] == []
+        assert len(filtered["quality"]) == 1
+
+    def test_tagged_baseline_skips_legacy_rehash(self, tmp_path):
+        save_baseline(tmp_path, _sample_result())
+        baseline = load_baseline(tmp_path)
+        assert baseline["fingerprint_format"] == "blake2b-128"
+
+        with patch.object(
+            baseline_module,
+            "_fingerprint_digest",
+            wraps=baseline_module._fingerprint_digest,
+        ) as digest:
+            known = baseline_module._known_fingerprints(baseline)
+
+        assert known == set(baseline["fingerprints"])
+        digest.assert_not_called()
+
+        legacy = {"fingerprints": ["SKY-Q301:app.py:80"]}
+        assert baseline_module._known_fingerprints(legacy) == {
+            _fingerprint_digest("SKY-Q301:app.py:80")
+        }
+
     def test_empty_baseline_keeps_all(self):
         result = _sample_result()
         baseline = {"fingerprints": []}
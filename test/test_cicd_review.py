@@ -1,16 +1,21 @@
+import json
+import subprocess
 from unittest.mock import patch
 
 import pytest
 
 from skylos.cicd.review import (
     _parse_unified_diff,
+    get_changed_line_ranges,
     filter_findings_to_diff,
     _flatten_findings,
     _merge_llm_findings,
     _format_review_comment,
     _format_evidence_card_comment,
-    _post_summary_comment,
+    _format_summary_body,
     _detect_pr_number,
+    _gh_available,
+    run_pr_review,
 )
 from skylos.cicd.evidence import build_evidence_card
 
@@ -83,6 +88,67 @@ def test_parse_unified_diff():
     assert ranges[1]["end"] == 5
 
 
+def test_parse_unified_diff_crlf_and_added_header_lookalikes():
+    diff = (
+        "diff --git a/new.py b/new.py\r\n"
+        "--- /dev/null\r\n"
+        "+++ b/new.py\r\n"
+        "@@ -0,0 +1,2 @@\r\n"
+        "+@@ -1 +99 @@ not a hunk header\r\n"
+        "++++ b/also_not_a_file.py\r\n"
+    )
+
+    assert _parse_unified_diff(diff) == [{"file": "new.py", "start": 1, "end": 2}]
+
+
+def test_get_changed_line_ranges_streams_git_diff(tmp_path, monkeypatch):
+    def git(*args):
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    git("init", "-q")
+    (tmp_path / "app.py").write_text("a = 1\nb = 2\nc = 3\n")
+    git("add", "app.py")
+    git("commit", "-q", "-m", "base")
+    git("tag", "base")
+    (tmp_path / "app.py").write_text("a = 1\nb = 20\nc = 3\nd = 4\n")
+    git("commit", "-q", "-am", "change")
+    monkeypatch.chdir(tmp_path)
+
+    assert get_changed_line_ranges("base") == [
+        {"file": "app.py", "start": 2, "end": 2},
+        {"file": "app.py", "start": 4, "end": 4},
+    ]
+    assert get_changed_line_ranges("no-such-ref") == []
+
+
+def test_get_changed_line_ranges_ignores_non_utf8_body(tmp_path, monkeypatch):
+    def git(*args):
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    git("init", "-q")
+    (tmp_path / "legacy.py").write_bytes(b"a = 1\n")
+    git("add", "legacy.py")
+    git("commit", "-q", "-m", "base")
+    git("tag", "base")
+    (tmp_path / "legacy.py").write_bytes(b"a = 1\nname = '\xe9t\xe9'\n")
+    git("commit", "-q", "-am", "latin-1 literal")
+    monkeypatch.chdir(tmp_path)
+
+    assert get_changed_line_ranges("base") == [
+        {"file": "legacy.py", "start": 2, "end": 2},
+    ]
+
+
 def test_filter_findings_to_diff(sample_results):
     ranges = _parse_unified_diff(SAMPLE_DIFF)
     findings = _flatten_findings(sample_results)
@@ -95,6 +161,21 @@ def test_filter_findings_to_diff(sample_results):
     assert "other.py" not in files
 
 
+def test_filter_findings_to_diff_unsorted_and_overlapping_hunks():
+    ranges = [
+        {"file": "pkg/app.py", "start": 40, "end": 45},
+        {"file": "pkg/app.py", "start": 1, "end": 30},
+        {"file": "pkg/app.py", "start": 10, "end": 12},
+        {"file": "pkg/app.py", "start": 31, "end": 33},
+    ]
+    findings = [
+        {"file": "/repo/pkg/app.py", "line": line} for line in (0, 20, 33, 34, 40, 46)
+    ]
+
+    kept = [f["line"] for f in filter_findings_to_diff(findings, ranges)]
+    assert kept == [20, 33, 40]
+
+
 def test_filter_findings_empty_ranges():
     findings = [{"file": "a.py", "line": 1, "message": "test"}]
     assert filter_findings_to_diff(findings, []) == []
@@ -252,19 +333,6 @@ def test_format_evidence_card_comment_includes_fallback_suggested_fix():
 
 
 def test_summary_comment_omits_evidence_counts_by_default():
-    captured = {}
-
-    def mock_run(cmd, **kwargs):
-        if "pr" in cmd and "comment" in cmd:
-            captured["body"] = cmd[cmd.index("--body") + 1]
-
-        class FakeResult:
-            returncode = 0
-            stdout = ""
-            stderr = ""
-
-        return FakeResult()
-
     finding = {
         "category": "danger",
         "severity": "HIGH",
@@ -274,26 +342,12 @@ def test_summary_comment_omits_evidence_counts_by_default():
         "line": 4,
     }
 
-    with patch("skylos.cicd.review.subprocess.run", side_effect=mock_run):
-        _post_summary_comment([finding], [finding], 42, "owner/repo")
+    body = _format_summary_body([finding], [finding])
 
-    assert "### Evidence" not in captured["body"]
+    assert "### Evidence" not in body
 
 
 def test_summary_comment_includes_evidence_counts_when_enabled():
-    captured = {}
-
-    def mock_run(cmd, **kwargs):
-        if "pr" in cmd and "comment" in cmd:
-            captured["body"] = cmd[cmd.index("--body") + 1]
-
-        class FakeResult:
-            returncode = 0
-            stdout = ""
-            stderr = ""
-
-        return FakeResult()
-
     findings = [
         {
             "category": "danger",
@@ -314,35 +368,14 @@ def test_summary_comment_includes_evidence_counts_when_enabled():
         },
     ]
 
-    with patch("skylos.cicd.review.subprocess.run", side_effect=mock_run):
-        _post_summary_comment(
-            findings,
-            findings,
-            42,
-            "owner/repo",
-            evidence_cards=True,
-        )
+    body = _format_summary_body(findings, findings, evidence_cards=True)
 
-    body = captured["body"]
     assert "### Evidence" in body
     assert "| Proven | 1 |" in body
     assert "| Speculative | 1 |" in body
 
 
 def test_summary_comment_includes_risk_passport_when_supplied():
-    captured = {}
-
-    def mock_run(cmd, **kwargs):
-        if "pr" in cmd and "comment" in cmd:
-            captured["body"] = cmd[cmd.index("--body") + 1]
-
-        class FakeResult:
-            returncode = 0
-            stdout = ""
-            stderr = ""
-
-        return FakeResult()
-
     risk_passport = {
         "recommendation": "BLOCK",
         "ai_authored_files": 2,
@@ -356,21 +389,72 @@ def test_summary_comment_includes_risk_passport_when_supplied():
         "warnings": [],
     }
 
-    with patch("skylos.cicd.review.subprocess.run", side_effect=mock_run):
-        _post_summary_comment(
-            [],
-            [],
-            42,
-            "owner/repo",
-            risk_passport=risk_passport,
-        )
+    body = _format_summary_body([], [], risk_passport=risk_passport)
 
-    body = captured["body"]
     assert "### AI PR Risk Passport" in body
     assert "**Merge recommendation: BLOCK**" in body
     assert "| Security controls weakened | auth |" in body
 
 
+def test_pr_review_carries_summary_in_single_gh_call(sample_results):
+    calls = []
+
+    def mock_run(cmd, **kwargs):
+        calls.append((cmd, kwargs))
+
+        class FakeResult:
+            returncode = 0
+            stdout = ""
+            stderr = ""
+
+        return FakeResult()
+
+    ranges = _parse_unified_diff(SAMPLE_DIFF)
+    with (
+        patch("skylos.cicd.review._gh_available", return_value=True),
+        patch("skylos.cicd.review._detect_regressions_from_diff", return_value=[]),
+        patch("skylos.cicd.review.get_changed_line_ranges", return_value=ranges),
+        patch("skylos.cicd.review._resolve_review_provenance", return_value=None),
+        patch("skylos.cicd.review._to_relative_path", side_effect=lambda f: f),
+        patch("skylos.cicd.review.subprocess.run", side_effect=mock_run),
+    ):
+        run_pr_review(sample_results, pr_number=42, repo="owner/repo")
+
+    assert len(calls) == 1
+    cmd, kwargs = calls[0]
+    assert "/repos/owner/repo/pulls/42/reviews" in cmd
+    payload = json.loads(kwargs["input"])
+    assert payload["body"].startswith("## Skylos Analysis Summary")
+    assert {c["path"] for c in payload["comments"]} == {"app.py", "utils.py"}
+
+
+def test_summary_only_review_posts_pr_comment(sample_results):
+    calls = []
+
+    def mock_run(cmd, **kwargs):
+        calls.append(cmd)
+
+        class FakeResult:
+            returncode = 0
+            stdout = ""
+            stderr = ""
+
+        return FakeResult()
+
+    with (
+        patch("skylos.cicd.review._gh_available", return_value=True),
+        patch("skylos.cicd.review._detect_regressions_from_diff", return_value=[]),
+        patch("skylos.cicd.review._resolve_review_provenance", return_value=None),
+        patch("skylos.cicd.review.subprocess.run", side_effect=mock_run),
+    ):
+        run_pr_review(
+            sample_results, pr_number=42, repo="owner/repo", summary_only=True
+        )
+
+    assert len(calls) == 1
+    assert calls[0][:4] == ["gh", "pr", "comment", "42"]
+
+
 def test_detect_pr_number(monkeypatch):
     monkeypatch.setenv("GITHUB_REF", "refs/pull/42/merge")
     assert _detect_pr_number() == 42
@@ -384,3 +468,14 @@ def test_detect_pr_number_not_pr(monkeypatch):
 def test_detect_pr_number_no_env(monkeypatch):
     monkeypatch.delenv("GITHUB_REF", raising=False)
     assert _detect_pr_number() is None
+
+
+def test_gh_available_probes_once():
+    _gh_available.cache_clear()
+    try:
+        with patch("skylos.cicd.review.subprocess.run") as mock_run:
+            assert _gh_available() is True
+            assert _gh_available() is True
+        mock_run.assert_called_once()
+    finally:
+        _gh_available.cache_clear()
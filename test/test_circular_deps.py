@@ -1,14 +1,27 @@
 import ast
+from unittest.mock import patch
+
 import pytest
 from skylos.analysis.architecture import get_architecture_findings
 from skylos.analysis.circular_deps import (
     CircularDependencyAnalyzer,
     CircularDependencyRule,
     DependencyGraphBuilder,
+    _module_root,
+    _resolve_known_module,
     analyze_circular_dependencies,
 )
 
 
+def test_resolve_known_module_prefers_longest_prefix():
+    known = {"pkg", "pkg.sub"}
+    assert _resolve_known_module("pkg.sub.leaf", known) == "pkg.sub"
+    assert _resolve_known_module("pkg.other", known) == "pkg"
+    assert _resolve_known_module("elsewhere.pkg", known) is None
+    assert _module_root("pkg.sub.leaf") == "pkg"
+    assert _module_root("") == ""
+
+
 class TestDependencyGraphBuilder:
     """Test the AST visitor that extracts imports."""
 
@@ -26,6 +39,23 @@ class TestDependencyGraphBuilder:
         assert len(builder.architecture_dependencies) == 1
         assert builder.architecture_dependencies[0].to_module == "foo"
 
+    def test_nested_imports_found_in_source_order(self):
+        code = """
+def load(kind):
+    match kind:
+        case "a":
+            import alpha
+    try:
+        from beta import thing
+    except ImportError:
+        import gamma
+    return lambda: __import__("delta")
+"""
+        builder = DependencyGraphBuilder("main", "main.py", {"alpha", "beta", "gamma"})
+        builder.visit(ast.parse(code))
+
+        assert [d.to_module for d in builder.dependencies] == ["alpha", "beta", "gamma"]
+
     def test_from_package_import_known_submodule(self):
         code = "from myproject import submodule"
         tree = ast.parse(code)
@@ -161,6 +191,63 @@ class TestCircularDependencyAnalyzer:
         cycles = analyzer.find_simple_cycles()
         assert isinstance(cycles, list)
 
+    def test_has_any_cycle_separates_dags_from_self_loops(self):
+        analyzer = CircularDependencyAnalyzer()
+        analyzer.modules = {"a": "a.py", "b": "b.py", "c": "c.py"}
+        analyzer.dependencies = {"a": {"b", "c"}, "b": {"c", "external"}}
+        assert not analyzer._has_any_cycle()
+
+        analyzer.dependencies["c"] = {"c"}
+        assert analyzer._has_any_cycle()
+        assert analyzer._find_cycles_py() == [["c"]]
+
+    def test_cycles_cached_until_graph_rebuilt(self):
+        analyzer = CircularDependencyAnalyzer()
+        analyzer.modules = {"a": "a.py", "b": "b.py"}
+        analyzer.dependencies = {"a": {"b"}, "b": {"a"}}
+
+        with (
+            patch("skylos.analysis.circular_deps._fast_find_cycles", None),
+            patch.object(
+                analyzer, "_find_cycles_py", wraps=analyzer._find_cycles_py
+            ) as search,
+        ):
+            assert len(analyzer.analyze()) == 1
+            analyzer.get_core_infrastructure()
+            assert search.call_count == 1
+
+            analyzer.build_graph_from_raw_imports({})
+            analyzer.find_simple_cycles()
+            assert search.call_count == 2
+
+    def test_cycles_over_same_module_set_reported_once(self):
+        analyzer = CircularDependencyAnalyzer()
+        analyzer.modules = {"a": "a.py", "b": "b.py", "c": "c.py"}
+        analyzer.dependencies = {
+            "a": {"b", "c"},
+            "b": {"a", "c"},
+            "c": {"a", "b"},
+        }
+
+        cycles = analyzer._find_cycles_py()
+        keys = [tuple(sorted(cycle)) for cycle in cycles]
+        assert sorted(keys) == [("a", "b"), ("a", "b", "c"), ("a", "c"), ("b", "c")]
+        assert all(cycle[0] == min(cycle) for cycle in cycles)
+
+    def test_long_import_chain_does_not_recurse(self):
+        depth = 5000
+        names = [f"m{i:05d}" for i in range(depth)]
+        analyzer = CircularDependencyAnalyzer()
+        # A single start module keeps the search linear; the chain behind it
+        # is still far deeper than the default recursion limit.
+        analyzer.modules = {names[0]: f"{names[0]}.py"}
+        analyzer.dependencies = {
+            name: {names[(i + 1) % depth]} for i, name in enumerate(names)
+        }
+
+        cycles = analyzer._find_cycles_py()
+        assert cycles == [names]
+
     def test_suggest_break_point_high_efferent(self):
         analyzer = CircularDependencyAnalyzer()
         analyzer.modules = {"a": "a.py", "b": "b.py", "c": "c.py"}
@@ -174,6 +261,9 @@ class TestCircularDependencyAnalyzer:
         suggestion = analyzer.suggest_break_point(cycle)
 
         assert suggestion in cycle
+        assert suggestion == "a"
+        assert analyzer.suggest_break_point(cycle, {"a": 1, "b": 1}) == "a"
+        assert analyzer.suggest_break_point(cycle, {"a": 5}) == "b"
 
     def test_get_core_infrastructure(self):
         analyzer = CircularDependencyAnalyzer()
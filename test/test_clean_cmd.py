@@ -362,3 +362,39 @@ def test_clean_command_apply_comment_out_uses_comment_transform(tmp_path):
     assert exit_code == 0
     comment_out.assert_called_once_with(original, "unused", 1)
     assert target.read_text(encoding="utf-8") == "# SKYLOS DEADCODE\npass\n"
+
+
+def test_clean_command_applies_several_edits_to_one_file_in_one_pass(tmp_path):
+    target = tmp_path / "sample.py"
+    target.write_text(
+        "import os\nimport sys\n\n\ndef unused():\n    return 1\n\n\n"
+        "def used():\n    return sys\n",
+        encoding="utf-8",
+    )
+    result = {
+        "unused_imports": [
+            {"name": "os", "file": str(target), "line": 1, "confidence": 95}
+        ],
+        "unused_functions": [
+            {"name": "unused", "file": str(target), "line": 5, "confidence": 95}
+        ],
+    }
+    console = Mock()
+
+    with (
+        patch("skylos.commands.clean_cmd.Console", return_value=console),
+        patch("skylos.commands.clean_cmd.run_analyze", return_value=json.dumps(result)),
+        patch(
+            "skylos.commands.clean_cmd.apply_cst_edits",
+            wraps=clean_cmd.apply_cst_edits,
+        ) as batch,
+        patch("skylos.commands.clean_cmd.remove_unused_import_cst") as remove_import,
+    ):
+        exit_code = clean_cmd.run_clean_command([str(tmp_path), "--apply"])
+
+    assert exit_code == 0
+    batch.assert_called_once()
+    remove_import.assert_not_called()
+    assert target.read_text(encoding="utf-8") == (
+        "import sys\n\n\ndef used():\n    return sys\n"
+    )
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import pytest
+import io
 import json
 import logging
 from unittest.mock import Mock, patch
@@ -51,12 +52,15 @@ class TestCleanFormatter:
 
 
 class TestSetupLogger:
+    def setup_method(self):
+        logging.getLogger("skylos").handlers.clear()
+
     def teardown_method(self):
         logger = logging.getLogger("skylos")
         logger.handlers.clear()
         logger.propagate = True
 
-    @patch("skylos.cli.logging.FileHandler")
+    @patch("skylos.cli._BufferedFileHandler")
     @patch("skylos.cli.RichHandler")
     def test_setup_logger_console_only(self, mock_rich_handler, mock_file_handler):
         """Test logger setup without output file."""
@@ -69,7 +73,7 @@ class TestSetupLogger:
         mock_rich_handler.assert_called_once()
         mock_file_handler.assert_not_called()
 
-    @patch("skylos.cli.logging.FileHandler")
+    @patch("skylos.cli._BufferedFileHandler")
     @patch("skylos.cli.RichHandler")
     def test_setup_logger_with_output_file(self, mock_rich_handler, mock_file_handler):
         """Test logger setup with output file."""
@@ -80,7 +84,32 @@ class TestSetupLogger:
 
         assert logger.name == "skylos"
         mock_rich_handler.assert_called_once()
-        mock_file_handler.assert_called_once_with("output.log")
+        mock_file_handler.assert_called_once_with("output.log", encoding="utf-8")
+
+    def test_repeated_setup_reuses_console_handler(self, tmp_path):
+        with patch("skylos.cli.RichHandler", return_value=Mock()) as mock_rich:
+            first = setup_logger()
+            console_handler = first.handlers[0]
+            second = setup_logger(str(tmp_path / "a.log"))
+            third = setup_logger()
+
+        assert first is second is third
+        mock_rich.assert_called_once()
+        assert third.handlers == [console_handler]
+
+    def test_output_file_is_buffered_until_close(self, tmp_path):
+        out = tmp_path / "report.log"
+        with patch("skylos.cli.RichHandler", return_value=logging.NullHandler()):
+            logger = setup_logger(str(out))
+        file_handler = logger.handlers[-1]
+
+        logger.info("first")
+        logger.info("second")
+        assert out.read_text() == ""
+
+        file_handler.close()
+        lines = out.read_text().splitlines()
+        assert [line.rsplit(" - ", 1)[1] for line in lines] == ["first", "second"]
 
     def test_remove_simple_import(self):
         """Test removing a simple import statement."""
@@ -93,7 +122,9 @@ def main():
 """
 
         with (
-            patch("pathlib.Path.read_text", return_value=content) as mock_read,
+            patch(
+                "pathlib.Path.read_bytes", return_value=content.encode()
+            ) as mock_read,
             patch("pathlib.Path.write_text") as mock_write,
             patch(
                 "skylos.cli.remove_unused_import_cst", return_value=("NEW_CODE", True)
@@ -104,13 +135,13 @@ def main():
             assert result is True
             mock_read.assert_called_once()
             mock_codemod.assert_called_once()
-            mock_write.assert_called_once_with("NEW_CODE", encoding="utf-8")
+            mock_write.assert_called_once_with("NEW_CODE", encoding="utf-8", newline="")
 
     def test_remove_from_multi_import(self):
         content = "import os, sys, json\n"
 
         with (
-            patch("pathlib.Path.read_text", return_value=content),
+            patch("pathlib.Path.read_bytes", return_value=content.encode()),
             patch("pathlib.Path.write_text") as mock_write,
             patch("skylos.cli.remove_unused_import_cst", return_value=("X", True)),
         ):
@@ -123,7 +154,7 @@ def main():
         content = "from collections import defaultdict, Counter\n"
 
         with (
-            patch("pathlib.Path.read_text", return_value=content),
+            patch("pathlib.Path.read_bytes", return_value=content.encode()),
             patch("pathlib.Path.write_text") as mock_write,
             patch("skylos.cli.remove_unused_import_cst", return_value=("X", True)),
         ):
@@ -136,19 +167,19 @@ def main():
         content = "from collections import defaultdict\n"
 
         with (
-            patch("pathlib.Path.read_text", return_value=content),
+            patch("pathlib.Path.read_bytes", return_value=content.encode()),
             patch("pathlib.Path.write_text") as mock_write,
             patch("skylos.cli.remove_unused_import_cst", return_value=("", True)),
         ):
             result = remove_unused_import("test.py", "defaultdict", 1)
 
             assert result is True
-            mock_write.assert_called_once_with("", encoding="utf-8")
+            mock_write.assert_called_once_with("", encoding="utf-8", newline="")
 
     def test_remove_import_file_error(self):
         """handling file errors when removing imports."""
         with patch(
-            "pathlib.Path.read_text", side_effect=FileNotFoundError("File not found")
+            "pathlib.Path.read_bytes", side_effect=FileNotFoundError("File not found")
         ):
             result = remove_unused_import("nonexistent.py", "os", 1)
             assert result is False
@@ -168,7 +199,7 @@ def another_function():
 """
 
         with (
-            patch("pathlib.Path.read_text", return_value=content),
+            patch("pathlib.Path.read_bytes", return_value=content.encode()),
             patch("pathlib.Path.write_text") as mock_write,
             patch(
                 "skylos.cli.remove_unused_function_cst",
@@ -178,7 +209,9 @@ def another_function():
             result = remove_unused_function("test.py", "unused_function", 4)
 
         assert result is True
-        mock_write.assert_called_once_with("NEW_FUNC_CODE", encoding="utf-8")
+        mock_write.assert_called_once_with(
+            "NEW_FUNC_CODE", encoding="utf-8", newline=""
+        )
 
     def test_remove_function_with_decorators(self):
         """removing function with decorators."""
@@ -189,7 +222,7 @@ def unused_function():
 """
 
         with (
-            patch("pathlib.Path.read_text", return_value=content),
+            patch("pathlib.Path.read_bytes", return_value=content.encode()),
             patch("pathlib.Path.write_text") as mock_write,
             patch("skylos.cli.remove_unused_function_cst", return_value=("X", True)),
         ):
@@ -200,13 +233,15 @@ def unused_function():
 
     def test_remove_function_file_error(self):
         with patch(
-            "pathlib.Path.read_text", side_effect=FileNotFoundError("File not found")
+            "pathlib.Path.read_bytes", side_effect=FileNotFoundError("File not found")
         ):
             result = remove_unused_function("nonexistent.py", "func", 1)
             assert result is False
 
     def test_remove_function_parse_error(self):
-        with patch("pathlib.Path.read_text", side_effect=SyntaxError("Invalid syntax")):
+        with patch(
+            "pathlib.Path.read_bytes", side_effect=SyntaxError("Invalid syntax")
+        ):
             result = remove_unused_function("test.py", "func", 1)
             assert result is False
 
@@ -540,6 +575,13 @@ def _progress_ctx():
     return cm
 
 
+def _git_diff_popen(diff_output=b""):
+    proc = Mock(returncode=0, stdout=io.BytesIO(diff_output))
+    proc.__enter__ = Mock(return_value=proc)
+    proc.__exit__ = Mock(return_value=False)
+    return proc
+
+
 def test_shorten_path_non_pathlike_returns_str():
     assert cli._shorten_path(123) == "123"
 
@@ -594,7 +636,7 @@ def test_apply_display_filters_combines_category_file_and_severity():
 
 def test_comment_out_unused_import_handles_exception_and_returns_false():
     with (
-        patch("pathlib.Path.read_text", return_value="import os\n"),
+        patch("pathlib.Path.read_bytes", return_value=b"import os\n"),
         patch(
             "skylos.cli.comment_out_unused_import_cst", side_effect=RuntimeError("boom")
         ),
@@ -610,7 +652,7 @@ def test_comment_out_unused_import_handles_exception_and_returns_false():
 
 def test_comment_out_unused_function_handles_exception_and_returns_false():
     with (
-        patch("pathlib.Path.read_text", return_value="def f():\n    pass\n"),
+        patch("pathlib.Path.read_bytes", return_value=b"def f():\n    pass\n"),
         patch(
             "skylos.cli.comment_out_unused_function_cst",
             side_effect=RuntimeError("boom"),
@@ -651,6 +693,16 @@ def test_remove_unused_import_refuses_file_outside_root(tmp_path):
     assert outside.read_text(encoding="utf-8") == "import os\n"
 
 
+def test_remove_unused_function_keeps_crlf_line_endings(tmp_path):
+    src = tmp_path / "mod.py"
+    src.write_bytes(b"import os\r\n\r\ndef unused():\r\n    return 1\r\n\r\nx = 1\r\n")
+
+    ok = cli.remove_unused_function(src, "unused", 3, root_path=tmp_path)
+
+    assert ok is True
+    assert src.read_bytes() == b"import os\r\n\r\nx = 1\r\n"
+
+
 def test_generate_llm_report_formats_findings_and_defaults_dead_code(tmp_path):
     src = tmp_path / "app.py"
     src.write_text(
@@ -1878,10 +1930,10 @@ class TestDiffFlag:
                 "skylos.cli.upload_report",
                 return_value={"success": False, "error": "No token found"},
             ),
-            patch("skylos.cicd.review.subprocess.run") as mock_git,
+            patch("skylos.cicd.review.subprocess.Popen") as mock_git,
             patch("skylos.api.get_project_token", return_value=None),
         ):
-            mock_git.return_value = Mock(returncode=0, stdout="")
+            mock_git.return_value = _git_diff_popen()
             cli.main()
             diff_calls = [
                 c for c in mock_git.call_args_list if c.args[0][:2] == ["git", "diff"]
@@ -1891,6 +1943,7 @@ class TestDiffFlag:
                 "git",
                 "diff",
                 "--unified=0",
+                "--no-color",
                 "origin/develop...HEAD",
             ]
 
@@ -1921,10 +1974,10 @@ class TestDiffFlag:
                 "skylos.cli.upload_report",
                 return_value={"success": False, "error": "No token found"},
             ),
-            patch("skylos.cicd.review.subprocess.run") as mock_git,
+            patch("skylos.cicd.review.subprocess.Popen") as mock_git,
             patch("skylos.api.get_project_token", return_value=None),
         ):
-            mock_git.return_value = Mock(returncode=0, stdout="")
+            mock_git.return_value = _git_diff_popen()
             cli.main()
             diff_calls = [
                 c for c in mock_git.call_args_list if c.args[0][:2] == ["git", "diff"]
@@ -1934,6 +1987,7 @@ class TestDiffFlag:
                 "git",
                 "diff",
                 "--unified=0",
+                "--no-color",
                 "origin/main...HEAD",
             ]
 
@@ -1964,10 +2018,10 @@ class TestDiffFlag:
                 "skylos.cli.upload_report",
                 return_value={"success": False, "error": "No token found"},
             ),
-            patch("skylos.cicd.review.subprocess.run") as mock_git,
+            patch("skylos.cicd.review.subprocess.Popen") as mock_git,
             patch("skylos.api.get_project_token", return_value=None),
         ):
-            mock_git.return_value = Mock(returncode=0, stdout="")
+            mock_git.return_value = _git_diff_popen()
             cli.main()
             diff_calls = [
                 c for c in mock_git.call_args_list if c.args[0][:2] == ["git", "diff"]
@@ -1977,6 +2031,7 @@ class TestDiffFlag:
                 "git",
                 "diff",
                 "--unified=0",
+                "--no-color",
                 "origin/develop...HEAD",
             ]
 
@@ -2023,22 +2078,23 @@ class TestDiffFlag:
         }
 
         diff_output = (
-            "diff --git a/src/app.py b/src/app.py\n"
-            "--- a/src/app.py\n"
-            "+++ b/src/app.py\n"
-            "@@ -8,5 +8,7 @@ some context\n"
-            "+new line\n"
+            b"diff --git a/src/app.py b/src/app.py\n"
+            b"--- a/src/app.py\n"
+            b"+++ b/src/app.py\n"
+            b"@@ -8,5 +8,7 @@ some context\n"
+            b"+new line\n"
         )
 
-        git_result = Mock(returncode=0, stdout=diff_output)
-
         captured_output = []
 
         with (
             patch("skylos.cli.Progress", return_value=_progress_ctx()),
             patch("skylos.cli.run_analyze", return_value=json.dumps(result)),
             patch("skylos.cli.load_config", return_value={}),
-            patch("skylos.cicd.review.subprocess.run", return_value=git_result),
+            patch(
+                "skylos.cicd.review.subprocess.Popen",
+                return_value=_git_diff_popen(diff_output),
+            ),
             patch("builtins.print", side_effect=lambda x: captured_output.append(x)),
         ):
             cli.main()
@@ -2052,6 +2108,40 @@ class TestDiffFlag:
         assert len(output["ai_defects"]) == 1
         assert output["ai_defects"][0]["rule_id"] == "SKY-A103"
 
+    def test_diff_filter_without_json_does_not_reserialize(self, monkeypatch):
+        """Filtered results are only dumped back to JSON for --json output."""
+        monkeypatch.setattr(
+            cli.sys, "argv", ["skylos", ".", "--diff", "origin/main", "--no-provenance"]
+        )
+        result = {
+            "analysis_summary": {"total_files": 1},
+            "unused_functions": [{"name": "foo", "file": "src/app.py", "line": 10}],
+        }
+        result_json = json.dumps(result)
+        diff_output = b"+++ b/src/app.py\n@@ -8,5 +8,7 @@ some context\n"
+
+        with (
+            patch("skylos.cli.Progress", return_value=_progress_ctx()),
+            patch("skylos.cli.run_analyze", return_value=result_json),
+            patch("skylos.cli.load_config", return_value={}),
+            patch("skylos.cli.render_results") as mock_render,
+            patch("skylos.cli.print_badge"),
+            patch(
+                "skylos.cli.upload_report",
+                return_value={"success": False, "error": "No token found"},
+            ),
+            patch(
+                "skylos.cicd.review.subprocess.Popen",
+                return_value=_git_diff_popen(diff_output),
+            ),
+            patch("skylos.api.get_project_token", return_value=None),
+            patch("skylos.cli.json.dumps", wraps=json.dumps) as mock_dumps,
+        ):
+            cli.main()
+
+        mock_render.assert_called_once()
+        mock_dumps.assert_not_called()
+
     def test_diff_base_filters_ai_defects_to_changed_files(self, monkeypatch):
         """--diff-base filters ai_defects to changed files."""
         monkeypatch.setattr(
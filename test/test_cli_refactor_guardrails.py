@@ -697,6 +697,21 @@ def test_doctor_command_json_reports_unavailable_go_engine(capsys):
     assert payload["checks"]["go_engine"]["reason"] == "Go engine binary not found"
 
 
+def test_doctor_interactive_check_does_not_import_inquirer():
+    from skylos.commands.doctor_cmd import _interactive_available
+
+    with (
+        patch(
+            "skylos.commands.doctor_cmd.importlib.util.find_spec",
+            return_value=object(),
+        ) as find_spec,
+        patch.dict(sys.modules, {"inquirer": None}),
+    ):
+        assert _interactive_available() is True
+
+    find_spec.assert_called_once_with("inquirer")
+
+
 def test_discover_command_json_output_prints_report(tmp_path):
     target = tmp_path / "repo"
     target.mkdir()
@@ -1,6 +1,9 @@
 import json
 import sys
+import tomllib
 import pytest
+from concurrent.futures import Future
+from pathlib import Path
 from unittest.mock import Mock, patch
 from rich.panel import Panel
 
@@ -42,6 +45,30 @@ def test_shorten_path_from_parent_dir(tmp_path, monkeypatch):
     assert out.replace("\\", "/") == "proj/src/m.py"
 
 
+def test_shorten_path_resolves_each_file_once_per_cwd(tmp_path, monkeypatch):
+    root = tmp_path / "proj"
+    (root / "src").mkdir(parents=True)
+    f = root / "src" / "m.py"
+    f.write_text("x=1", encoding="utf-8")
+    resolved = []
+    real_resolve = Path.resolve
+
+    def counting_resolve(self, *args, **kwargs):
+        resolved.append(str(self))
+        return real_resolve(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "resolve", counting_resolve)
+    monkeypatch.chdir(root)
+    outs = [cli._shorten_path(str(f)) for _ in range(5)]
+    monkeypatch.chdir(tmp_path)
+    outs.append(cli._shorten_path(str(f)))
+
+    assert [out.replace("\\", "/") for out in outs] == ["src/m.py"] * 5 + [
+        "proj/src/m.py"
+    ]
+    assert resolved.count(str(f)) == 2
+
+
 def test_run_init_creates_pyproject_when_missing(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     mock_console = Mock()
@@ -340,6 +367,32 @@ def test_main_list_default_excludes_returns_without_analysis(monkeypatch):
     assert fake_logger.console.print.called
 
 
+def test_main_list_default_excludes_skips_scan_parser(monkeypatch):
+    fake_logger = Mock()
+    fake_logger.console = Mock()
+
+    monkeypatch.setattr(sys, "argv", ["skylos", "--list-default-excludes"])
+
+    with (
+        patch("skylos.cli.setup_logger", return_value=fake_logger),
+        patch("skylos.cli._build_main_parser") as build_parser,
+    ):
+        cli.main()
+
+    assert fake_logger.console.print.called
+    build_parser.assert_not_called()
+
+
+def test_main_version_skips_scan_parser(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["skylos", "--version"])
+
+    with patch("skylos.cli._build_main_parser") as build_parser:
+        cli.main()
+
+    assert capsys.readouterr().out == f"skylos {cli.skylos.__version__}\n"
+    build_parser.assert_not_called()
+
+
 def test_main_merges_config_excludes_into_scan(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     (tmp_path / "pyproject.toml").write_text(
@@ -579,7 +632,7 @@ def test_main_trace_runs_python_c_script(tmp_path, monkeypatch):
 
 def test_remove_unused_import_returns_false_when_no_change():
     with (
-        patch("pathlib.Path.read_text", return_value="import os\n"),
+        patch("pathlib.Path.read_bytes", return_value=b"import os\n"),
         patch("pathlib.Path.write_text") as mock_write,
         patch("skylos.cli.remove_unused_import_cst", return_value=("SAME", False)),
     ):
@@ -591,7 +644,7 @@ def test_remove_unused_import_returns_false_when_no_change():
 
 def test_remove_unused_function_returns_false_when_no_change():
     with (
-        patch("pathlib.Path.read_text", return_value="def f():\n    pass\n"),
+        patch("pathlib.Path.read_bytes", return_value=b"def f():\n    pass\n"),
         patch("pathlib.Path.write_text") as mock_write,
         patch("skylos.cli.remove_unused_function_cst", return_value=("SAME", False)),
     ):
@@ -603,7 +656,7 @@ def test_remove_unused_function_returns_false_when_no_change():
 
 def test_comment_out_unused_import_returns_false_when_no_change():
     with (
-        patch("pathlib.Path.read_text", return_value="import os\n"),
+        patch("pathlib.Path.read_bytes", return_value=b"import os\n"),
         patch("pathlib.Path.write_text") as mock_write,
         patch("skylos.cli.comment_out_unused_import_cst", return_value=("SAME", False)),
     ):
@@ -615,19 +668,19 @@ def test_comment_out_unused_import_returns_false_when_no_change():
 
 def test_comment_out_unused_import_writes_when_changed():
     with (
-        patch("pathlib.Path.read_text", return_value="import os\n"),
+        patch("pathlib.Path.read_bytes", return_value=b"import os\n"),
         patch("pathlib.Path.write_text") as mock_write,
         patch("skylos.cli.comment_out_unused_import_cst", return_value=("NEW", True)),
     ):
         ok = cli.comment_out_unused_import("x.py", "os", 1, marker="M")
 
     assert ok is True
-    mock_write.assert_called_once_with("NEW", encoding="utf-8")
+    mock_write.assert_called_once_with("NEW", encoding="utf-8", newline="")
 
 
 def test_comment_out_unused_function_returns_false_when_no_change():
     with (
-        patch("pathlib.Path.read_text", return_value="def f():\n    pass\n"),
+        patch("pathlib.Path.read_bytes", return_value=b"def f():\n    pass\n"),
         patch("pathlib.Path.write_text") as mock_write,
         patch(
             "skylos.cli.comment_out_unused_function_cst", return_value=("SAME", False)
@@ -641,14 +694,14 @@ def test_comment_out_unused_function_returns_false_when_no_change():
 
 def test_comment_out_unused_function_writes_when_changed():
     with (
-        patch("pathlib.Path.read_text", return_value="def f():\n    pass\n"),
+        patch("pathlib.Path.read_bytes", return_value=b"def f():\n    pass\n"),
         patch("pathlib.Path.write_text") as mock_write,
         patch("skylos.cli.comment_out_unused_function_cst", return_value=("NEW", True)),
     ):
         ok = cli.comment_out_unused_function("x.py", "f", 1, marker="M")
 
     assert ok is True
-    mock_write.assert_called_once_with("NEW", encoding="utf-8")
+    mock_write.assert_called_once_with("NEW", encoding="utf-8", newline="")
 
 
 @pytest.fixture
@@ -880,7 +933,7 @@ def test_main_interactive_comment_out_uses_comment_functions(monkeypatch):
     result = {
         "analysis_summary": {"total_files": 1},
         "unused_functions": [{"name": "u", "file": "a.py", "line": 1}],
-        "unused_imports": [{"name": "os", "file": "a.py", "line": 1}],
+        "unused_imports": [{"name": "os", "file": "b.py", "line": 1}],
         "unused_variables": [],
         "unused_classes": [],
         "unused_parameters": [],
@@ -922,3 +975,344 @@ def test_main_interactive_comment_out_uses_comment_functions(monkeypatch):
 
     c_fn.assert_called_once()
     c_imp.assert_called_once()
+
+
+def test_main_interactive_removes_several_items_from_one_file(tmp_path, monkeypatch):
+    target = tmp_path / "a.py"
+    target.write_text(
+        "import os\n"
+        "\n"
+        "\n"
+        "def first():\n"
+        "    return 1\n"
+        "\n"
+        "\n"
+        "def second():\n"
+        "    return 2\n"
+        "\n"
+        "\n"
+        "def kept():\n"
+        "    return 3\n",
+        encoding="utf-8",
+    )
+    result = {
+        "analysis_summary": {"total_files": 1},
+        "unused_functions": [
+            {"name": "first", "file": str(target), "line": 4},
+            {"name": "second", "file": str(target), "line": 8},
+        ],
+        "unused_imports": [{"name": "os", "file": str(target), "line": 1}],
+        "unused_variables": [],
+        "unused_classes": [],
+        "unused_parameters": [],
+        "danger": [],
+        "quality": [],
+        "secrets": [],
+    }
+
+    monkeypatch.setattr(cli.sys, "argv", ["skylos", str(tmp_path), "--interactive"])
+
+    fake_logger = Mock()
+    fake_logger.console = Mock()
+
+    with (
+        patch("skylos.cli.setup_logger", return_value=fake_logger),
+        patch("skylos.cli.Progress", return_value=_progress_ctx()),
+        patch("skylos.cli.run_analyze", return_value=json.dumps(result)),
+        patch("skylos.cli.load_config", return_value={}),
+        patch("skylos.cli.INTERACTIVE_AVAILABLE", True),
+        patch("skylos.cli.render_results"),
+        patch("skylos.cli.print_badge"),
+        patch("skylos.cli.inquirer.prompt", return_value={"confirm": True}),
+        patch(
+            "skylos.cli.interactive_selection",
+            return_value=(result["unused_functions"], result["unused_imports"]),
+        ),
+        patch("builtins.print"),
+        patch("skylos.api.get_project_token", return_value=None),
+    ):
+        cli.main()
+
+    assert target.read_text(encoding="utf-8").strip() == "def kept():\n    return 3"
+    printed = " ".join(
+        str(call.args[0])
+        for call in fake_logger.console.print.call_args_list
+        if call.args
+    )
+    assert "Failed" not in printed
+
+
+def test_apply_cleanup_edits_comments_out_several_items_in_one_pass(tmp_path):
+    target = tmp_path / "a.py"
+    target.write_text(
+        "import os\n\n\ndef unused():\n    return 1\n\n\ndef kept():\n    return 2\n",
+        encoding="utf-8",
+    )
+    edits_by_file = {
+        str(target): [
+            (
+                "function",
+                cli.comment_out_unused_function,
+                {"file": str(target), "name": "unused", "line": 4},
+            ),
+            (
+                "import",
+                cli.comment_out_unused_import,
+                {"file": str(target), "name": "os", "line": 1},
+            ),
+        ]
+    }
+
+    with (
+        patch("skylos.cli.comment_out_unused_function") as c_fn,
+        patch("skylos.cli.comment_out_unused_import") as c_imp,
+        patch("skylos.cli.apply_cst_edits", wraps=cli.apply_cst_edits) as batch,
+    ):
+        results = list(
+            cli._apply_cleanup_edits(
+                edits_by_file, comment_out=True, root_path=tmp_path, jobs=1
+            )
+        )
+
+    assert [(kind, ok) for kind, _item, ok in results] == [
+        ("function", True),
+        ("import", True),
+    ]
+    c_fn.assert_not_called()
+    c_imp.assert_not_called()
+    batch.assert_called_once()
+    assert batch.call_args.args[1] == [
+        ("comment_function", "unused", 4),
+        ("comment_import", "os", 1),
+    ]
+    text = target.read_text(encoding="utf-8")
+    assert text.count("SKYLOS DEADCODE START") == 2
+    assert "def kept():\n    return 2\n" in text
+
+
+def test_apply_cleanup_edits_runs_files_in_worker_processes(tmp_path):
+    files = []
+    for stem in ("a", "b"):
+        path = tmp_path / f"{stem}.py"
+        path.write_text(
+            "import os\nimport sys\n\n\ndef used():\n    return sys\n",
+            encoding="utf-8",
+        )
+        files.append(path)
+
+    edits_by_file = {
+        str(path): [
+            (
+                "import",
+                cli.remove_unused_import,
+                {"file": str(path), "name": "os", "line": 1},
+            ),
+        ]
+        for path in files
+    }
+
+    results = list(cli._apply_cleanup_edits(edits_by_file, root_path=tmp_path, jobs=2))
+
+    assert [(kind, item["file"], ok) for kind, item, ok in results] == [
+        ("import", str(files[0]), True),
+        ("import", str(files[1]), True),
+    ]
+    for path in files:
+        assert path.read_text(encoding="utf-8").startswith("import sys\n")
+
+
+class _FailingCleanupPool:
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, file_edits, *args):
+        # a.py is rewritten before the worker dies, b.py never reaches one.
+        if file_edits[0][2]["file"].endswith("a.py"):
+            fn(file_edits, *args)
+        future = Future()
+        future.set_exception(RuntimeError("worker died"))
+        return future
+
+
+def test_apply_cleanup_edits_only_retries_untouched_files(tmp_path):
+    files = []
+    for stem in ("a", "b"):
+        path = tmp_path / f"{stem}.py"
+        path.write_text("import os\nimport sys\n\nprint(sys)\n", encoding="utf-8")
+        files.append(path)
+    remove = Mock(wraps=cli.remove_unused_import)
+    edits_by_file = {
+        str(path): [("import", remove, {"file": str(path), "name": "os", "line": 1})]
+        for path in files
+    }
+
+    with patch("concurrent.futures.ProcessPoolExecutor", _FailingCleanupPool):
+        results = list(
+            cli._apply_cleanup_edits(edits_by_file, root_path=tmp_path, jobs=2)
+        )
+
+    assert [(item["file"], ok) for _kind, item, ok in results] == [
+        (str(files[0]), False),
+        (str(files[1]), True),
+    ]
+    assert [call.args[0] for call in remove.call_args_list] == [
+        str(files[0]),
+        str(files[1]),
+    ]
+    for path in files:
+        assert path.read_text(encoding="utf-8") == "import sys\n\nprint(sys)\n"
+
+
+def test_set_no_upload_prompt_only_edits_tool_skylos_table(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        '[project]\nname = "demo"\ndescription = "see [tool.skylos] below"\n'
+        "\n"
+        "[tool.other]\nno_upload_prompt = false\n"
+        "\n"
+        '[tool.skylos]\nexclude = [\n  ["a"],\n]\n'
+        "\n"
+        "[tool.skylos.gate]\nstrict = true\n",
+        encoding="utf-8",
+    )
+
+    assert cli._set_no_upload_prompt(tmp_path, True) is True
+    assert cli._set_no_upload_prompt(tmp_path, False) is True
+
+    assert pyproject.read_text(encoding="utf-8") == (
+        '[project]\nname = "demo"\ndescription = "see [tool.skylos] below"\n'
+        "\n"
+        "[tool.other]\nno_upload_prompt = false\n"
+        "\n"
+        '[tool.skylos]\nno_upload_prompt = false\nexclude = [\n  ["a"],\n]\n'
+        "\n"
+        "[tool.skylos.gate]\nstrict = true\n"
+    )
+
+
+def test_set_no_upload_prompt_appends_table_when_missing(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "demo"\n', encoding="utf-8")
+
+    assert cli._set_no_upload_prompt(tmp_path, True) is True
+    assert pyproject.read_text(encoding="utf-8") == (
+        '[project]\nname = "demo"\n\n[tool.skylos]\nno_upload_prompt = true\n'
+    )
+    assert cli._set_no_upload_prompt(tmp_path / "missing", True) is False
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        "[tool.skylos]  # skylos settings",
+        "[ tool.skylos ]",
+        '[tool."skylos"]',
+    ],
+)
+def test_set_no_upload_prompt_accepts_header_variants(tmp_path, header):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        f"{header}\nno_upload_prompt = false  # keep\n\n[tool.other]\nx = 1\n",
+        encoding="utf-8",
+    )
+
+    assert cli._set_no_upload_prompt(tmp_path, True) is True
+
+    content = pyproject.read_text(encoding="utf-8")
+    assert content == (
+        f"{header}\nno_upload_prompt = true  # keep\n\n[tool.other]\nx = 1\n"
+    )
+    assert tomllib.loads(content)["tool"]["skylos"]["no_upload_prompt"] is True
+
+
+def test_set_no_upload_prompt_updates_dotted_keys_under_tool(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        '[tool]\nskylos.exclude = ["build"]\nskylos.no_upload_prompt = false\n',
+        encoding="utf-8",
+    )
+
+    assert cli._set_no_upload_prompt(tmp_path, True) is True
+    content = pyproject.read_text(encoding="utf-8")
+    assert content.count("skylos") == 2
+    assert tomllib.loads(content)["tool"]["skylos"] == {
+        "exclude": ["build"],
+        "no_upload_prompt": True,
+    }
+
+
+def test_set_no_upload_prompt_adds_dotted_key_under_tool(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        '[tool]\nskylos.exclude = ["build"]\n\n[project]\nname = "demo"\n',
+        encoding="utf-8",
+    )
+
+    assert cli._set_no_upload_prompt(tmp_path, False) is True
+    content = pyproject.read_text(encoding="utf-8")
+    assert "[tool.skylos]" not in content
+    assert tomllib.loads(content)["tool"]["skylos"] == {
+        "exclude": ["build"],
+        "no_upload_prompt": False,
+    }
+
+
+def test_set_no_upload_prompt_leaves_invalid_toml_alone(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[tool.skylos\n", encoding="utf-8")
+
+    assert cli._set_no_upload_prompt(tmp_path, True) is False
+    assert pyproject.read_text(encoding="utf-8") == "[tool.skylos\n"
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        'exclude = [\n"a",\n["b"],\n]\nno_upload_prompt = false\n',
+        'banner = """\n[not.a.table]\n"""\nno_upload_prompt = false\n',
+        "pattern = '''\n[x]'''\nno_upload_prompt = false\n",
+    ],
+)
+def test_set_no_upload_prompt_ignores_brackets_inside_values(tmp_path, body):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(f"[tool.skylos]\n{body}", encoding="utf-8")
+
+    assert cli._set_no_upload_prompt(tmp_path, True) is True
+
+    content = pyproject.read_text(encoding="utf-8")
+    assert content == "[tool.skylos]\n" + body.replace("= false", "= true")
+    assert tomllib.loads(content)["tool"]["skylos"]["no_upload_prompt"] is True
+
+
+def test_set_no_upload_prompt_adds_top_level_dotted_key(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        'tool.skylos.exclude = ["build"]\n\n[project]\nname = "demo"\n',
+        encoding="utf-8",
+    )
+
+    assert cli._set_no_upload_prompt(tmp_path, True) is True
+    content = pyproject.read_text(encoding="utf-8")
+    assert tomllib.loads(content)["tool"]["skylos"] == {
+        "exclude": ["build"],
+        "no_upload_prompt": True,
+    }
+
+
+def test_set_no_upload_prompt_adds_parent_table_after_sub_tables(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[tool.skylos.gate]\nstrict = true\n", encoding="utf-8")
+
+    assert cli._set_no_upload_prompt(tmp_path, False) is True
+    content = pyproject.read_text(encoding="utf-8")
+    assert content.count("[tool.skylos]") == 1
+    assert tomllib.loads(content)["tool"]["skylos"] == {
+        "gate": {"strict": True},
+        "no_upload_prompt": False,
+    }
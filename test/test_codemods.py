@@ -1,5 +1,11 @@
 import textwrap
+from unittest.mock import patch
+
+import libcst
+import pytest
+
 from skylos.remediation.codemods import (
+    apply_cst_edits,
     remove_unused_import_cst,
     remove_unused_function_cst,
     comment_out_unused_import_cst,
@@ -96,6 +102,16 @@ def test_import_idempotency():
     assert new2 == new
 
 
+def test_import_name_absent_from_source_skips_parse():
+    code = "import ospath\nprint(ospath)\n"
+    with patch("libcst.parse_module", wraps=libcst.parse_module) as parse:
+        new, changed = remove_unused_import_cst(code, "os", 1)
+        dotted, dotted_changed = remove_unused_import_cst(code, "ospath.x", 1)
+    assert (changed, dotted_changed) == (False, False)
+    assert new == dotted == code
+    parse.assert_not_called()
+
+
 def test_remove_simple_function_block():
     code = textwrap.dedent(
         """\
@@ -142,6 +158,34 @@ def test_function_wrong_line_noop():
     assert new == code
 
 
+def test_remove_nested_method_leaves_siblings_and_prefix_names():
+    code = textwrap.dedent(
+        """\
+        def foobar():
+            return 0
+
+
+        class Service:
+            def foo(self):
+                return 1
+
+            def foobar(self):
+                return 2
+        """
+    )
+
+    new, changed = remove_unused_function_cst(code, "foo", 1)
+    assert changed is False
+    assert new == code
+
+    ln = _line_no(code, "def foo(self)")
+    new, changed = remove_unused_function_cst(code, "Service.foo", ln)
+    assert changed is True
+    assert "def foo(self)" not in new
+    assert "def foobar(self)" in new
+    assert new.startswith("def foobar():")
+
+
 def test_function_idempotency():
     code = "def g():\n    return 1\n"
     ln = _line_no(code, "def g")
@@ -344,6 +388,34 @@ def test_comment_out_idempotency_import():
     assert new2 == new
 
 
+def test_chained_edits_reuse_previous_output_tree():
+    code = textwrap.dedent(
+        """\
+        import os
+        import sys
+
+
+        def f():
+            return 1
+
+
+        def g():
+            return 2
+        """
+    )
+
+    with patch("libcst.parse_module", wraps=libcst.parse_module) as parse:
+        step1, changed1 = remove_unused_function_cst(code, "f", 5)
+        step2, changed2 = remove_unused_import_cst(step1, "os", 1)
+        step3, changed3 = remove_unused_function_cst(
+            step2, "g", _line_no(step2, "def g")
+        )
+
+    assert (changed1, changed2, changed3) == (True, True, True)
+    assert parse.call_count == 1
+    assert step3 == "import sys\n"
+
+
 def test_comment_out_idempotency_function():
     code = "def f():\n    return 1\n"
     ln = _line_no(code, "def f")
@@ -356,6 +428,60 @@ def test_comment_out_idempotency_function():
     assert new2 == new
 
 
+def test_apply_cst_edits_matches_sequential_single_edits():
+    code = textwrap.dedent(
+        """\
+        import os, sys
+        from pkg import (
+            a,
+            b,
+        )
+
+
+        def outer():
+            def inner():
+                pass
+            return sys
+
+
+        async def gone():
+            pass
+
+
+        def commented():
+            return a
+        """
+    )
+    edits = [
+        ("remove_import", "os", 1),
+        ("remove_import", "b", _line_no(code, "b,")),
+        ("remove_function", "outer.inner", _line_no(code, "def inner")),
+        ("remove_function", "gone", _line_no(code, "async def gone")),
+        ("comment_function", "commented", _line_no(code, "def commented")),
+        ("remove_import", "missing", 1),
+    ]
+    with patch("libcst.parse_module", wraps=libcst.parse_module) as parse:
+        new, changed = apply_cst_edits(code, edits)
+
+    single = {
+        "remove_import": remove_unused_import_cst,
+        "remove_function": remove_unused_function_cst,
+        "comment_function": comment_out_unused_function_cst,
+    }
+    expected = code
+    for kind, name, line in sorted(edits, key=lambda edit: -edit[2]):
+        expected, _changed = single[kind](expected, name, line)
+
+    assert parse.call_count == 1
+    assert new == expected
+    assert changed == [True, True, True, True, True, False]
+
+
+def test_apply_cst_edits_rejects_unknown_kind():
+    with pytest.raises(ValueError, match="rename"):
+        apply_cst_edits("x = 1\n", [("rename", "x", 1)])
+
+
 def _has_uncommented_line(code: str, startswith: str) -> bool:
     for line in code.splitlines():
         s = line.lstrip()
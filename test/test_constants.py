@@ -10,6 +10,7 @@ from skylos.constants import (
     UNITTEST_LIFECYCLE_METHODS,
     FRAMEWORK_FILE_RE,
     DEFAULT_EXCLUDE_FOLDERS,
+    SORTED_DEFAULT_EXCLUDE_FOLDERS,
     get_non_library_dir_kind,
     is_test_path,
     is_framework_path,
@@ -414,6 +415,10 @@ class TestConstants:
             assert isinstance(folder, str), f"Folder {folder} should be string"
             assert len(folder) > 0, f"Folder name should not be empty"
 
+    def test_sorted_default_exclude_folders_matches_set(self):
+        assert isinstance(DEFAULT_EXCLUDE_FOLDERS, frozenset)
+        assert SORTED_DEFAULT_EXCLUDE_FOLDERS == tuple(sorted(DEFAULT_EXCLUDE_FOLDERS))
+
 
 class TestRegexEdgeCases:
     def test_test_file_regex_case_insensitivity(self):
@@ -7,8 +7,8 @@ from skylos.api import get_credit_balance, print_credit_status
 
 class TestGetCreditBalance:
     @patch("skylos.api.get_project_token", return_value="test-token")
-    @patch("skylos.api.requests")
-    def test_returns_balance_on_success(self, mock_requests, mock_token):
+    @patch("skylos.api._SESSION")
+    def test_returns_balance_on_success(self, mock_session, mock_token):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.json.return_value = {
@@ -17,7 +17,7 @@ class TestGetCreditBalance:
             "org_name": "Test Org",
             "recent_transactions": [],
         }
-        mock_requests.get.return_value = mock_resp
+        mock_session.get.return_value = mock_resp
 
         result = get_credit_balance("test-token")
         assert result is not None
@@ -25,19 +25,19 @@ class TestGetCreditBalance:
         assert result["plan"] == "pro"
 
     @patch("skylos.api.get_project_token", return_value="test-token")
-    @patch("skylos.api.requests")
-    def test_returns_none_on_server_error(self, mock_requests, mock_token):
+    @patch("skylos.api._SESSION")
+    def test_returns_none_on_server_error(self, mock_session, mock_token):
         mock_resp = MagicMock()
         mock_resp.status_code = 500
-        mock_requests.get.return_value = mock_resp
+        mock_session.get.return_value = mock_resp
 
         result = get_credit_balance("test-token")
         assert result is None
 
     @patch("skylos.api.get_project_token", return_value="test-token")
-    @patch("skylos.api.requests")
-    def test_returns_none_on_network_error(self, mock_requests, mock_token):
-        mock_requests.get.side_effect = ConnectionError("network down")
+    @patch("skylos.api._SESSION")
+    def test_returns_none_on_network_error(self, mock_session, mock_token):
+        mock_session.get.side_effect = ConnectionError("network down")
         result = get_credit_balance("test-token")
         assert result is None
 
@@ -51,29 +51,29 @@ class TestGetCreditBalance:
         assert result is None
 
     @patch("skylos.api.get_project_token", return_value="test-token")
-    @patch("skylos.api.requests")
-    def test_sends_correct_auth_header(self, mock_requests, mock_token):
+    @patch("skylos.api._SESSION")
+    def test_sends_correct_auth_header(self, mock_session, mock_token):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.json.return_value = {"balance": 100}
-        mock_requests.get.return_value = mock_resp
+        mock_session.get.return_value = mock_resp
 
         get_credit_balance("my-token-123")
 
-        call_args = mock_requests.get.call_args
+        call_args = mock_session.get.call_args
         assert call_args[1]["headers"]["Authorization"] == "Bearer my-token-123"
 
     @patch("skylos.api.get_project_token", return_value="test-token")
-    @patch("skylos.api.requests")
-    def test_calls_correct_endpoint(self, mock_requests, mock_token):
+    @patch("skylos.api._SESSION")
+    def test_calls_correct_endpoint(self, mock_session, mock_token):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.json.return_value = {"balance": 100}
-        mock_requests.get.return_value = mock_resp
+        mock_session.get.return_value = mock_resp
 
         get_credit_balance("token")
 
-        url = mock_requests.get.call_args[0][0]
+        url = mock_session.get.call_args[0][0]
         assert url.endswith("/api/credits/balance")
 
 
@@ -152,14 +152,14 @@ class TestUploadReportCredits:
         return_value={"ok": True, "plan": "pro", "project": {"name": "test"}},
     )
     @patch("skylos.api.get_project_token", return_value="test-token")
-    @patch("skylos.api.requests")
+    @patch("skylos.api._SESSION")
     @patch("skylos.api._load_repo_link")
     @patch("skylos.api.get_git_root", return_value="/fake/repo")
     def test_402_returns_no_credits_error(
         self,
         mock_git,
         mock_link,
-        mock_requests,
+        mock_session,
         mock_token,
         mock_info,
         mock_gitinfo,
@@ -175,7 +175,7 @@ class TestUploadReportCredits:
             "error": "No credits remaining. Buy more at skylos.dev/dashboard/billing"
         }
         mock_resp.text = "No credits"
-        mock_requests.post.return_value = mock_resp
+        mock_session.post.return_value = mock_resp
 
         result = upload_report(self.MINIMAL_RESULT, quiet=True)
         assert result["success"] is False
@@ -197,14 +197,14 @@ class TestUploadReportCredits:
         return_value={"ok": True, "plan": "pro", "project": {"name": "test"}},
     )
     @patch("skylos.api.get_project_token", return_value="test-token")
-    @patch("skylos.api.requests")
+    @patch("skylos.api._SESSION")
     @patch("skylos.api._load_repo_link")
     @patch("skylos.api.get_git_root", return_value="/fake/repo")
     def test_successful_upload_includes_credits_remaining(
         self,
         mock_git,
         mock_link,
-        mock_requests,
+        mock_session,
         mock_token,
         mock_info,
         mock_gitinfo,
@@ -223,7 +223,7 @@ class TestUploadReportCredits:
             "credits_warning": False,
             "plan": "pro",
         }
-        mock_requests.post.return_value = mock_resp
+        mock_session.post.return_value = mock_resp
 
         result = upload_report(self.MINIMAL_RESULT, quiet=True)
         assert result["success"] is True
@@ -244,14 +244,14 @@ class TestUploadReportCredits:
         return_value={"ok": True, "plan": "pro", "project": {"name": "test"}},
     )
     @patch("skylos.api.get_project_token", return_value="test-token")
-    @patch("skylos.api.requests")
+    @patch("skylos.api._SESSION")
     @patch("skylos.api._load_repo_link")
     @patch("skylos.api.get_git_root", return_value="/fake/repo")
     def test_credits_warning_flag_passed_through(
         self,
         mock_git,
         mock_link,
-        mock_requests,
+        mock_session,
         mock_token,
         mock_info,
         mock_gitinfo,
@@ -270,7 +270,7 @@ class TestUploadReportCredits:
             "credits_warning": True,
             "plan": "pro",
         }
-        mock_requests.post.return_value = mock_resp
+        mock_session.post.return_value = mock_resp
 
         result = upload_report(self.MINIMAL_RESULT, quiet=True)
         assert result["success"] is True
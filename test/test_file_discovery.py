@@ -1,5 +1,6 @@
 import subprocess
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -23,6 +24,49 @@ def test_should_exclude_path_honors_sonar_style_globs(tmp_path: Path):
     assert should_exclude_path(dist, root, ["dist/**"])
 
 
+def test_should_exclude_path_resolves_exclude_patterns_once_per_root(tmp_path: Path):
+    root = tmp_path / "repo"
+    files = [root / "pkg" / f"mod{i}.py" for i in range(20)]
+    excludes = ["build", "pkg/generated", str(root / "vendor")]
+
+    real_resolve = Path.resolve
+    calls = []
+
+    def counting_resolve(self, strict=False):
+        calls.append(self)
+        return real_resolve(self, strict=strict)
+
+    with patch.object(Path, "resolve", counting_resolve):
+        for path in files:
+            assert not should_exclude_path(path, root, excludes)
+        calls_for_first_pass = len(calls)
+        for path in files:
+            assert not should_exclude_path(path, root, excludes)
+
+    assert 0 < calls_for_first_pass <= 4
+    assert len(calls) == calls_for_first_pass
+    assert should_exclude_path(root / "pkg" / "generated" / "x.py", root, excludes)
+    assert should_exclude_path(root / "vendor" / "lib.py", root, excludes)
+
+
+def test_should_exclude_path_relative_root_follows_working_directory(
+    tmp_path: Path, monkeypatch
+):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    for base in (first, second):
+        (base / "repo" / "vendor").mkdir(parents=True)
+    root = Path("repo")
+    vendored = root / "vendor" / "lib.py"
+
+    monkeypatch.chdir(first)
+    assert should_exclude_path(vendored, root, [str(first / "repo" / "vendor")])
+
+    monkeypatch.chdir(second)
+    assert not should_exclude_path(vendored, root, [str(first / "repo" / "vendor")])
+    assert should_exclude_path(vendored, root, [str(second / "repo" / "vendor")])
+
+
 def test_discover_source_files_skips_symlinked_file_outside_root(tmp_path: Path):
     repo = tmp_path / "repo"
     repo.mkdir()
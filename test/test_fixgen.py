@@ -7,6 +7,7 @@ from skylos.remediation.fixgen import (
     _compute_safety_score,
     _find_block_end,
     _find_import_range,
+    _python_def_spans,
     _topological_sort,
     apply_patches,
     generate_fix_summary,
@@ -251,6 +252,37 @@ class TestFindImportRange:
         assert _find_import_range(lines, 0) == 0
 
 
+class TestPythonDefSpans:
+    def test_finds_defs_nested_in_statement_bodies(self):
+        lines = [
+            "class A:",  # 1
+            "    @staticmethod",
+            "    def m():",
+            "        pass",
+            "if True:",  # 5
+            "    def f():",
+            "        def g():",
+            "            pass",
+            "try:",
+            "    pass",  # 10
+            "except Exception:",
+            "    def h():",
+            "        pass",
+            "match x:",
+            "    case 1:",  # 15
+            "        async def k():",
+            "            pass",
+        ]
+        assert _python_def_spans(lines) == {
+            1: (1, 4),
+            3: (2, 4),
+            6: (6, 8),
+            7: (7, 8),
+            12: (12, 13),
+            16: (16, 17),
+        }
+
+
 class TestGenerateRemovalPlan:
     def test_basic_plan(self, tmp_path):
         src = tmp_path / "mod.py"
@@ -313,6 +345,38 @@ class TestGenerateRemovalPlan:
         assert len(patches) == 1
         assert patches[0].line_range[0] == 1
 
+    def test_python_block_range_comes_from_the_parser(self, tmp_path):
+        src = tmp_path / "mod.py"
+        src.write_text(
+            "@register(\n"
+            "    name='dead',\n"
+            ")\n"
+            "def dead(\n"
+            "    value,\n"
+            ") -> str:\n"
+            "    return '''\n"
+            "raw\n"
+            "'''\n"
+            "\n"
+            "x = 1\n"
+        )
+        findings = [
+            {"full_name": "dead", "type": "function", "file": str(src), "line": 4}
+        ]
+        patches = generate_removal_plan(findings, {"dead": {"calls": []}}, tmp_path)
+        assert len(patches) == 1
+        assert patches[0].line_range == (1, 10)
+
+    def test_unparsable_python_falls_back_to_indentation(self, tmp_path):
+        src = tmp_path / "mod.py"
+        src.write_text("def dead():\n    pass\n\nx = (\n")
+        findings = [
+            {"full_name": "dead", "type": "function", "file": str(src), "line": 1}
+        ]
+        patches = generate_removal_plan(findings, {"dead": {"calls": []}}, tmp_path)
+        assert len(patches) == 1
+        assert patches[0].line_range == (1, 3)
+
     def test_skips_missing_file(self, tmp_path):
         findings = [
             {
@@ -614,6 +678,33 @@ class TestApplyPatches:
         assert src.read_text() == "x = 1\n"
         assert not (tmp_path / "mod.py.bak").exists()
 
+    def test_nested_patch_does_not_shift_outer_removal(self, tmp_path):
+        src = tmp_path / "mod.py"
+        src.write_text(
+            "class Old:\n"
+            "    def method(self):\n"
+            "        return 1\n"
+            "\n"
+            "def keep():\n"
+            "    return 2\n"
+        )
+        outer = RemovalPatch(
+            file_path=str(src),
+            line_range=(1, 3),
+            replacement="",
+            finding_name="Old",
+            finding_type="class",
+        )
+        inner = RemovalPatch(
+            file_path=str(src),
+            line_range=(2, 3),
+            replacement="",
+            finding_name="Old.method",
+            finding_type="method",
+        )
+        result = apply_patches([inner, outer], tmp_path, dry_run=True)
+        assert result[str(src)] == "\ndef keep():\n    return 2\n"
+
     def test_apply_with_replacement(self, tmp_path):
         src = tmp_path / "mod.py"
         src.write_text("import os\nx = 1\n")
@@ -106,3 +106,26 @@ class TestGitHubAnnotations:
         assert lines[0].startswith("::error")
         assert lines[1].startswith("::error")  # HIGH -> error
         assert "Unused class: OldClass" in lines[2]
+
+    def test_annotations_are_written_in_one_call(self):
+        result = {
+            "unused_functions": [
+                {"name": f"f{i}", "file": "a.py", "line": i} for i in range(1, 6)
+            ],
+        }
+
+        class _CountingBuffer(io.StringIO):
+            writes = 0
+
+            def write(self, s):
+                type(self).writes += 1
+                return super().write(s)
+
+        old = sys.stdout
+        sys.stdout = buf = _CountingBuffer()
+        try:
+            _emit_github_annotations(result)
+        finally:
+            sys.stdout = old
+        assert _CountingBuffer.writes == 1
+        assert len(buf.getvalue().strip().splitlines()) == 5
@@ -1,7 +1,10 @@
 from skylos.core.result_cache import (
     TRACE_CACHE_DIR,
+    build_analysis_cache_key,
     build_trace_cache_key,
+    load_analysis_cache,
     load_trace_cache,
+    save_analysis_cache,
     save_trace_cache,
 )
 
@@ -112,3 +115,88 @@ def test_trace_cache_does_not_save_failed_trace_runs(tmp_path):
 
     assert path is None
     assert not (tmp_path / TRACE_CACHE_DIR / "abc.json").exists()
+
+
+def test_analysis_cache_key_tracks_sources_options_and_inputs(tmp_path):
+    app = tmp_path / "app.py"
+    app.write_text("def f():\n    return 1\n", encoding="utf-8")
+    config = tmp_path / "skylos.toml"
+    config.write_text("[skylos]\n", encoding="utf-8")
+    options = {"conf": 60, "danger": False}
+
+    def key(**overrides):
+        kwargs = {"options": options, "input_files": [config]}
+        kwargs.update(overrides)
+        return build_analysis_cache_key(tmp_path, [tmp_path], **kwargs)
+
+    base = key()
+    assert key() == base
+    assert key(options={"conf": 60, "danger": True}) != base
+
+    config.write_text("[skylos]\nquality_enabled = true\n", encoding="utf-8")
+    assert key() != base
+
+    config_key = key()
+    app.write_text("def f():\n    return 2\n", encoding="utf-8")
+    assert key() != config_key
+
+
+def test_analysis_cache_ignores_only_the_scan_excluded_directories(tmp_path):
+    (tmp_path / "app.py").write_text("x = 1\n", encoding="utf-8")
+    build = tmp_path / "build"
+    build.mkdir()
+    generated = build / "gen.py"
+    generated.write_text("y = 1\n", encoding="utf-8")
+
+    def key(exclude_folders):
+        return build_analysis_cache_key(
+            tmp_path, [tmp_path], options={}, exclude_folders=exclude_folders
+        )
+
+    excluded = key(["build"])
+    included = key([])
+    generated.write_text("y = 2\n", encoding="utf-8")
+
+    assert key(["build"]) == excluded
+    assert key([]) != included
+
+
+def test_analysis_cache_misses_after_non_python_input_changes(tmp_path):
+    (tmp_path / "app.py").write_text("x = 1\n", encoding="utf-8")
+    inputs = {
+        "settings.yaml": "token: a\n",
+        ".env.local": "API_KEY=a\n",
+        "gui.pyw": "x = 1\n",
+        "Program.cs": "class A {}\n",
+        "deploy.sh": "echo a\n",
+    }
+    for name, text in inputs.items():
+        (tmp_path / name).write_text(text, encoding="utf-8")
+
+    def key():
+        return build_analysis_cache_key(tmp_path, [tmp_path], options={"secrets": True})
+
+    for name, text in inputs.items():
+        cached = key()
+        save_analysis_cache(tmp_path, cached, "{}")
+        assert load_analysis_cache(tmp_path, key()) == "{}"
+
+        (tmp_path / name).write_text(text + "# changed\n", encoding="utf-8")
+
+        assert key() != cached, name
+        assert load_analysis_cache(tmp_path, key()) is None, name
+
+
+def test_analysis_cache_save_and_load_round_trips_result(tmp_path):
+    (tmp_path / "app.py").write_text("x = 1\n", encoding="utf-8")
+    key, fingerprint = build_analysis_cache_key(
+        tmp_path, [tmp_path], options={"conf": 60}, return_fingerprint=True
+    )
+    result_json = '{"unused_functions": []}'
+
+    assert load_analysis_cache(tmp_path, key) is None
+    assert save_analysis_cache(
+        tmp_path, key, result_json, fingerprint_summary=fingerprint
+    )
+    assert load_analysis_cache(tmp_path, key) == result_json
+    assert fingerprint["analysis_options"] == {"conf": 60}
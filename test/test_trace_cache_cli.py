@@ -358,3 +358,29 @@ def test_cache_stats_json_skips_symlink_targets(tmp_path):
     assert payload["symlinks"] == 1
     assert payload["skipped"] == 1
     assert payload["bytes"] == 5
+
+
+def test_analysis_cache_reuses_result_until_sources_change(tmp_path, monkeypatch):
+    _write_minimal_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    result_json = json.dumps({"unused_functions": [], "analysis_summary": {}})
+
+    def run_main(*extra):
+        with (
+            patch("sys.argv", ["skylos", ".", "--json", "--no-provenance", *extra]),
+            patch("skylos.cli.run_analyze", return_value=result_json) as analyze,
+            patch("builtins.print") as mock_print,
+            patch("skylos.core.result_cache._git_visible_files", return_value=None),
+        ):
+            cli.main()
+        mock_print.assert_called_once_with(result_json)
+        return analyze.call_count
+
+    assert run_main("--cache") == 1
+    assert run_main("--cache") == 0
+    assert run_main() == 1
+    assert run_main("--cache", "--no-cache") == 1
+    assert run_main("--cache", "--refresh-cache") == 1
+
+    (tmp_path / "app.py").write_text("def f():\n    return 2\n", encoding="utf-8")
+    assert run_main("--cache") == 1
@@ -73,6 +73,16 @@ class TestDefinition(unittest.TestCase):
         definition2 = Definition("pkg.func", "function", "/path/to/module.py", 1)
         self.assertFalse(definition2.in_init)
 
+    def test_init_file_flag_can_be_precomputed(self):
+        definition = Definition(
+            "pkg.func", "function", "/path/to/module.py", 1, in_init=True
+        )
+        self.assertTrue(definition.in_init)
+
+        visitor = Visitor("pkg", "/path/to/__init__.py")
+        visitor.visit(ast.parse("def func():\n    pass\n"))
+        self.assertTrue(visitor.defs[0].in_init)
+
     def test_definition_types(self):
         types = ["function", "method", "class", "variable", "parameter", "import"]
         for def_type in types:
@@ -107,6 +117,29 @@ def my_function():
         self.assertEqual(definition.type, "function")
         self.assertEqual(definition.simple_name, "my_function")
 
+    def test_reset_starts_fresh_file_without_mutating_previous_results(self):
+        visitor = self.parse_and_visit("import os\ndef first():\n    os.getcwd()\n")
+        first_defs = visitor.defs
+        first_refs = visitor.refs
+
+        visitor.reset("other_module", "other.py")
+        visitor.visit(ast.parse("def second():\n    pass\n"))
+
+        self.assertEqual(visitor.mod, "other_module")
+        self.assertEqual(visitor.alias, {})
+        self.assertEqual([d.name for d in visitor.defs], ["other_module.second"])
+        self.assertIn("test_module.first", [d.name for d in first_defs])
+        self.assertTrue(first_refs)
+        self.assertIsNot(visitor.refs, first_refs)
+
+    def test_repeated_refs_share_one_entry(self):
+        visitor = self.parse_and_visit("x = 1\nprint(x)\nprint(x)\n")
+
+        x_refs = [ref for ref in visitor.refs if ref[0] == "test_module.x"]
+        self.assertEqual(len(x_refs), 2)
+        self.assertIs(x_refs[0], x_refs[1])
+        self.assertEqual(x_refs[0], ("test_module.x", self.temp_file.name))
+
     def test_string_ref_patterns_escape_regex_metacharacters(self):
         self.visitor.pattern_tracker = ImplicitRefTracker()
         self.visitor.defs = [